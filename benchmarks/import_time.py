@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the package and the light CLI commands.
+
+Runs each target in a fresh interpreter several times and reports the median
+wall time, so regressions in startup cost (for example a module-level import
+of Playwright creeping back into the CLI) show up as numbers.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20 --budget-ms 100
+
+With --budget-ms the script exits non-zero if a CLI command is slower than the
+budget, which makes it usable in CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Name -> Python source run in a fresh interpreter
+TARGETS = {
+    "python (baseline)": "pass",
+    "import ita_scrapper": "import ita_scrapper",
+    "import ita_scrapper.cli": "import ita_scrapper.cli",
+    "cli parse": (
+        "import sys; from ita_scrapper.cli import main; "
+        "sys.argv = ['ita-scrapper', 'parse', '--type', 'price', '$1,234']; main()"
+    ),
+    "cli version": (
+        "import sys; from ita_scrapper.cli import main; "
+        "sys.argv = ['ita-scrapper', 'version']; main()"
+    ),
+    "import ita_scrapper.scrapper": "import ita_scrapper.scrapper",
+}
+
+# Targets held to the --budget-ms limit
+CLI_TARGETS = ("cli parse", "cli version")
+
+
+def measure(source: str, runs: int) -> float:
+    """Median wall time in milliseconds of running source in a new interpreter."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", source],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per target")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Fail if a CLI command takes longer than this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    results = {name: measure(source, args.runs) for name, source in TARGETS.items()}
+    baseline = results["python (baseline)"]
+
+    print(f"{'target':<30} {'median ms':>10} {'over baseline':>14}")
+    for name, ms in results.items():
+        print(f"{name:<30} {ms:>10.1f} {ms - baseline:>14.1f}")
+
+    if args.budget_ms is not None:
+        slow = [name for name in CLI_TARGETS if results[name] > args.budget_ms]
+        if slow:
+            print(f"Over the {args.budget_ms:g} ms budget: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tooltip extraction benchmark: per-element handles versus one page.evaluate.
+
+Renders a synthetic results page with a configurable number of tooltips in a
+headless Chromium, then times ITAMatrixParser._extract_tooltip_data against
+the previous implementation, which queried each strategy's elements and made
+two awaited driver calls (id and inner text) per element. Driver round trips
+are counted by wrapping the page and its element handles.
+
+Usage:
+    python benchmarks/tooltip_extraction.py
+    python benchmarks/tooltip_extraction.py --tooltips 50 200 800 --runs 5
+
+Requires a Playwright Chromium install (playwright install chromium).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from ita_scrapper.parsers import ITAMatrixParser
+
+
+class Counter:
+    """Counts awaited driver calls made through wrapped objects."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def wrap(self, target):
+        return _Counted(target, self)
+
+
+class _Counted:
+    """Proxy counting each awaited method call as one round trip."""
+
+    def __init__(self, target, counter: Counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args, **kwargs):
+            self._counter.calls += 1
+            result = await attribute(*args, **kwargs)
+            if isinstance(result, list):
+                return [self._counter.wrap(item) for item in result]
+            return result
+
+        return call
+
+
+async def per_element_extract(page) -> dict[str, str]:
+    """The previous implementation: two driver calls per tooltip element."""
+    data = {}
+    for selector in ('[role="tooltip"]', '[id*="cdk-describedby-message"]'):
+        for tooltip in await page.query_selector_all(selector):
+            tooltip_id = await tooltip.get_attribute("id")
+            tooltip_text = await tooltip.inner_text()
+            if tooltip_id and tooltip_text:
+                data[tooltip_id] = tooltip_text.strip()
+
+    broad = '[id*="tooltip"], [class*="tooltip"], [data-tooltip]'
+    for tooltip in await page.query_selector_all(broad):
+        tooltip_id = await tooltip.get_attribute("id") or await tooltip.get_attribute(
+            "data-tooltip"
+        )
+        tooltip_text = await tooltip.inner_text()
+        if tooltip_id and tooltip_text and tooltip_id not in data:
+            data[tooltip_id] = tooltip_text.strip()
+    return data
+
+
+def results_page(tooltips: int) -> str:
+    """HTML with Angular Material style tooltips like a Matrix results page."""
+    rows = []
+    for i in range(tooltips):
+        rows.append(
+            f'<div id="cdk-describedby-message-{i}" role="tooltip" '
+            f'class="cdk-visually-hidden">AA {100 + i} JFK 8:00 AM '
+            f"LAX 11:30 AM $3{i % 100:02d}</div>"
+        )
+    return f"<html><body>{''.join(rows)}</body></html>"
+
+
+async def measure(page, extract, runs: int) -> tuple[float, int, int]:
+    """Median milliseconds, round trips and entries of one extraction."""
+    timings = []
+    for _ in range(runs):
+        counter = Counter()
+        started = time.perf_counter()
+        data = await extract(counter.wrap(page))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), counter.calls, len(data)
+
+
+async def run(sizes: list[int], runs: int):
+    parser = ITAMatrixParser()
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+
+        print(
+            f"{'tooltips':>8}  {'per-element ms':>14} {'trips':>6}  "
+            f"{'evaluate ms':>11} {'trips':>6}  {'speedup':>7}"
+        )
+        for size in sizes:
+            await page.set_content(results_page(size))
+            old_ms, old_trips, old_entries = await measure(
+                page, per_element_extract, runs
+            )
+            new_ms, new_trips, new_entries = await measure(
+                page, parser._extract_tooltip_data, runs
+            )
+            if old_entries != new_entries:
+                print(f"  entry mismatch: {old_entries} vs {new_entries}")
+            print(
+                f"{size:>8}  {old_ms:>14.1f} {old_trips:>6}  "
+                f"{new_ms:>11.1f} {new_trips:>6}  {old_ms / new_ms:>6.1f}x"
+            )
+
+        await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--tooltips",
+        type=int,
+        nargs="+",
+        default=[50, 200, 800],
+        help="Tooltip counts to benchmark",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Runs per size")
+    args = parser.parse_args()
+    asyncio.run(run(args.tooltips, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,77 @@
 """
 ITA Scrapper - A Python library for scraping ITA travel website.
+
+Public names are imported lazily on first access, so importing the package
+(or running light CLI commands such as ``parse`` and ``version``) does not
+pay for Playwright, Pydantic models and the browser stack until they are
+actually used.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.3"
 __author__ = "ITA Scrapper Contributors"
 
-from .exceptions import (
-    ITAScrapperError,
-    ITATimeoutError,
-    NavigationError,
-    ParseError,
-)
-from .models import (
-    Airport,
-    CabinClass,
-    Flight,
-    FlightResult,
-    PriceCalendar,
-    SearchParams,
-    TripType,
-)
-from .scrapper import ITAScrapper
-from .utils import (
-    FlightDataParser,
-    format_duration,
-    get_date_range,
-    is_valid_date_range,
-    parse_duration,
-    parse_price,
-    parse_time,
-    validate_airport_code,
-)
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    "Airport": ".models",
+    "CabinClass": ".models",
+    "Flight": ".models",
+    "FlightDataParser": ".utils",
+    "FlightResult": ".models",
+    "ITAHttpEngine": ".http_engine",
+    "ITAScrapper": ".scrapper",
+    "ITAScrapperError": ".exceptions",
+    "ITAScrapperPool": ".pool",
+    "ITATimeoutError": ".exceptions",
+    "NavigationError": ".exceptions",
+    "ParseError": ".exceptions",
+    "PriceCalendar": ".models",
+    "SearchExecutor": ".executor",
+    "SearchOutcome": ".models",
+    "SearchParams": ".models",
+    "TripType": ".models",
+    "format_duration": ".utils",
+    "get_date_range": ".utils",
+    "is_valid_date_range": ".utils",
+    "parse_duration": ".utils",
+    "parse_price": ".utils",
+    "parse_time": ".utils",
+    "validate_airport_code": ".utils",
+}
+
+if TYPE_CHECKING:
+    from .exceptions import (
+        ITAScrapperError,
+        ITATimeoutError,
+        NavigationError,
+        ParseError,
+    )
+    from .executor import SearchExecutor
+    from .http_engine import ITAHttpEngine
+    from .models import (
+        Airport,
+        CabinClass,
+        Flight,
+        FlightResult,
+        PriceCalendar,
+        SearchOutcome,
+        SearchParams,
+        TripType,
+    )
+    from .pool import ITAScrapperPool
+    from .scrapper import ITAScrapper
+    from .utils import (
+        FlightDataParser,
+        format_duration,
+        get_date_range,
+        is_valid_date_range,
+        parse_duration,
+        parse_price,
+        parse_time,
+        validate_airport_code,
+    )
 
 __all__ = [
     "Airport",
@@ -38,12 +79,16 @@ __all__ = [
     "Flight",
     "FlightDataParser",
     "FlightResult",
+    "ITAHttpEngine",
     "ITAScrapper",
     "ITAScrapperError",
+    "ITAScrapperPool",
     "ITATimeoutError",
     "NavigationError",
     "ParseError",
     "PriceCalendar",
+    "SearchExecutor",
+    "SearchOutcome",
     "SearchParams",
     "TripType",
     "format_duration",
@@ -54,3 +99,18 @@ __all__ = [
     "parse_time",
     "validate_airport_code",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodules on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
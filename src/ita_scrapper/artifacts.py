@@ -0,0 +1,207 @@
+"""
+Debug artifact capture for searches.
+
+Screenshots are invaluable when a site changes under the scrapper, but taking
+a full-resolution PNG on every search is pure overhead in production and
+fixed file names in the working directory get overwritten as soon as searches
+run concurrently. The ArtifactRecorder decides per search whether to capture
+anything, names every file after the search that produced it, writes files in
+the background and keeps the artifact directory bounded.
+
+Policies:
+    off: never capture
+    on_failure: capture only when a search fails or finds nothing
+    always: capture at every capture point
+    sampled: capture failures, plus every capture point of a random
+        fraction of searches
+
+Usage:
+    >>> recorder = ArtifactRecorder(ArtifactPolicy.SAMPLED, sample_rate=0.05)
+    >>> search_id = recorder.new_search_id()
+    >>> recorder.capture(page, search_id, "parse-error", failure=True)
+    >>> await recorder.drain()  # wait for pending writes before closing the page
+"""
+
+import asyncio
+import logging
+import random
+import re
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Union
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Names of files written by a recorder: <search id>-<label>.jpg. Retention only
+# touches these, so other images in the directory are left alone.
+ARTIFACT_NAME = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}-.+\.jpg$")
+
+
+class ArtifactPolicy(str, Enum):
+    """When debug artifacts are captured."""
+
+    OFF = "off"
+    ON_FAILURE = "on_failure"
+    ALWAYS = "always"
+    SAMPLED = "sampled"
+
+
+class ArtifactRecorder:
+    """
+    Captures screenshots according to an ArtifactPolicy.
+
+    Screenshots are JPEG, viewport-sized and written by background tasks, so
+    the search that requested them does not wait for encoding or disk I/O.
+    Files are named ``<search id>-<label>.jpg`` and the oldest files are
+    removed once the directory holds more than ``max_files`` artifacts. Files
+    not named like this are never removed.
+
+    Attributes:
+        policy: When to capture
+        directory: Directory artifacts are written to
+        sample_rate: Fraction of searches captured under the sampled policy
+        max_bytes: Screenshots larger than this are retaken at lower quality,
+            then dropped if still too large
+        max_files: Maximum number of artifacts kept in the directory
+        quality: JPEG quality of screenshots (0-100)
+
+    Example:
+        >>> recorder = ArtifactRecorder("always", directory="/tmp/ita-artifacts")
+        >>> recorder.capture(page, recorder.new_search_id(), "landing")
+    """
+
+    def __init__(
+        self,
+        policy: Union[ArtifactPolicy, str] = ArtifactPolicy.ON_FAILURE,
+        directory: Union[str, Path] = "artifacts",
+        sample_rate: float = 0.1,
+        max_bytes: int = 500_000,
+        max_files: int = 200,
+        quality: int = 60,
+    ):
+        """
+        Configure artifact capture.
+
+        Args:
+            policy: One of ArtifactPolicy or its string value. Default: on_failure
+            directory: Where artifacts are written. Created on first write.
+                Default: "artifacts"
+            sample_rate: Fraction (0-1) of searches captured under the sampled
+                policy. Default: 0.1
+            max_bytes: Maximum size of a single screenshot. Default: 500000
+            max_files: Maximum number of artifacts kept. Default: 200
+            quality: JPEG quality (0-100). Default: 60
+        """
+        self.policy = ArtifactPolicy(policy)
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.quality = quality
+
+        self._pending: set[asyncio.Task] = set()
+
+    @staticmethod
+    def new_search_id() -> str:
+        """Return a unique, sortable identifier for a search."""
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        return f"{timestamp}-{uuid.uuid4().hex[:8]}"
+
+    def should_capture(self, search_id: str, failure: bool = False) -> bool:
+        """
+        Decide whether a capture point of a search produces an artifact.
+
+        Sampling is derived from the search id, so either all or none of the
+        non-failure capture points of a sampled search are recorded.
+
+        Args:
+            search_id: Identifier of the search
+            failure: Whether the capture point reports a failure
+
+        Returns:
+            True if an artifact should be captured
+        """
+        if self.policy == ArtifactPolicy.OFF:
+            return False
+        if self.policy == ArtifactPolicy.ALWAYS or failure:
+            return True
+        if self.policy == ArtifactPolicy.SAMPLED:
+            return random.Random(search_id).random() < self.sample_rate  # noqa: S311
+        return False
+
+    def capture(
+        self, page: Optional[Page], search_id: str, label: str, failure: bool = False
+    ) -> Optional[asyncio.Task]:
+        """
+        Schedule a screenshot of the page if the policy asks for one.
+
+        Returns immediately; the screenshot is taken and written in the
+        background. Call drain() before closing the page.
+
+        Args:
+            page: Page to capture
+            search_id: Identifier of the search, used in the file name
+            label: Short description of the capture point, used in the file name
+            failure: Whether the capture point reports a failure
+
+        Returns:
+            The background task, or None if nothing is captured
+        """
+        if page is None or not self.should_capture(search_id, failure):
+            return None
+
+        path = self.directory / f"{search_id}-{label}.jpg"
+        task = asyncio.create_task(self._capture(page, path))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def drain(self):
+        """Wait for all pending captures to finish."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def _capture(self, page: Page, path: Path):
+        """Take a bounded-size screenshot and write it off the event loop."""
+        try:
+            data = await page.screenshot(type="jpeg", quality=self.quality)
+            if len(data) > self.max_bytes:
+                data = await page.screenshot(
+                    type="jpeg", quality=max(10, self.quality // 2), scale="css"
+                )
+            if len(data) > self.max_bytes:
+                logger.debug(f"Dropping artifact {path.name}: {len(data)} bytes")
+                return
+
+            await asyncio.to_thread(self._write, path, data)
+            logger.info(f"Saved artifact {path}")
+
+        except Exception as e:
+            logger.debug(f"Failed to capture artifact {path.name}: {e}")
+
+    def _write(self, path: Path, data: bytes):
+        """Write an artifact and trim the directory to max_files."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+        def mtime(artifact: Path) -> float:
+            # Another writer may have trimmed the file in the meantime
+            try:
+                return artifact.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        artifacts = sorted(
+            (
+                artifact
+                for artifact in self.directory.glob("*.jpg")
+                if ARTIFACT_NAME.match(artifact.name)
+            ),
+            key=mtime,
+        )
+        for old in artifacts[: max(0, len(artifacts) - self.max_files)]:
+            old.unlink(missing_ok=True)
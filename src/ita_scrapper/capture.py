@@ -0,0 +1,163 @@
+"""
+Capture of the JSON responses behind a results page.
+
+The ITA Matrix web app is a thin Angular client: the search form posts to a
+JSON search API and the results table is rendered from its response.
+Reconstructing flights from the rendered tooltips means walking the DOM and
+guessing at text formats; listening on page.on("response") for the search
+call yields the same data already structured, as soon as it arrives.
+
+ResponseCapture watches a page for responses whose URL matches a pattern and
+keeps the first decodable JSON body of the current search. The scrapper resets
+it at the start of every search, then maps the captured body with
+ITAMatrixResponseParser and only falls back to DOM parsing if nothing usable
+was captured.
+
+Usage:
+    >>> capture = ResponseCapture()
+    >>> capture.install(page)
+    >>> capture.reset()
+    >>> await page.click("button[type=submit]")
+    >>> payload = await capture.wait(timeout_ms=30000)
+"""
+
+import asyncio
+import json
+import logging
+import re
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, Union
+
+from playwright.async_api import Page, Request, Response
+
+logger = logging.getLogger(__name__)
+
+# Matrix search API calls, e.g. https://content-alkalimatrix-pa.googleapis.com/v1/search
+SEARCH_API_PATTERN = re.compile(r"/v\d+/search(?:[?#]|$)")
+
+# Prefix Google APIs may put in front of JSON to defeat cross-site inclusion
+XSSI_PREFIX = ")]}'"
+
+
+class ResponseCapture:
+    """
+    Keeps the JSON body of the first matching response of each search.
+
+    Attributes:
+        pattern: Regular expression matched against response URLs
+        accept: Predicate deciding whether a decoded body is the one wanted;
+            other matching responses are ignored
+        captured: Number of bodies captured since the capture was installed
+        request: Request that produced the current capture, kept so the call
+            can be replayed without a browser (see ITAHttpEngine)
+
+    Example:
+        >>> capture = ResponseCapture(accept=lambda body: "solutionList" in body)
+        >>> capture.install(page)
+    """
+
+    def __init__(
+        self,
+        pattern: Union[str, re.Pattern] = SEARCH_API_PATTERN,
+        accept: Optional[Callable[[Any], bool]] = None,
+    ):
+        """
+        Configure which responses are captured.
+
+        Args:
+            pattern: URL pattern of the responses to capture.
+                Default: the Matrix search API
+            accept: Check applied to decoded bodies. Default: accept any JSON
+        """
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.accept = accept
+        self.captured = 0
+        self.request: Optional[Request] = None
+        self._payload: Optional[asyncio.Future] = None
+        # Body reads in flight, kept referenced until they finish
+        self._reads: set[asyncio.Task] = set()
+
+    def install(self, page: Page):
+        """Start listening to the page's responses."""
+        page.on("response", self._on_response)
+        self.reset()
+
+    def reset(self):
+        """Forget the previous capture, typically at the start of a search."""
+        if self._payload is not None and not self._payload.done():
+            self._payload.cancel()
+        self.request = None
+        self._payload = asyncio.get_running_loop().create_future()
+
+    def _on_response(self, response: Response):
+        """Schedule reading the body of a matching response."""
+        if self._payload is None or self._payload.done():
+            return
+        if not self.pattern.search(response.url):
+            return
+
+        task = asyncio.ensure_future(self._read(response, self._payload))
+        self._reads.add(task)
+        task.add_done_callback(self._reads.discard)
+
+    async def _read(self, response: Response, payload: asyncio.Future):
+        """Decode a response body and keep it if it is the one wanted."""
+        try:
+            text = await response.text()
+            if text.startswith(XSSI_PREFIX):
+                text = text[len(XSSI_PREFIX) :]
+            body = json.loads(text)
+        except Exception as e:
+            logger.debug(f"Could not read captured response {response.url}: {e}")
+            return
+
+        if self.accept is not None and not self.accept(body):
+            return
+        if not payload.done():
+            payload.set_result(body)
+            self.request = response.request
+            self.captured += 1
+            logger.debug(f"Captured response from {response.url}")
+
+    async def wait(
+        self,
+        timeout_ms: float,
+        rendered: Optional[Awaitable] = None,
+        grace_ms: float = 1000,
+    ) -> Optional[Any]:
+        """
+        Wait for the current search's response.
+
+        The capture must have been installed on the page first.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds
+            rendered: Optional wait for the results to appear on the page. The
+                page is rendered from the response, so once results show up
+                without a capture, only a short grace period is allowed before
+                giving up instead of waiting out the whole timeout
+            grace_ms: Extra wait after ``rendered`` completes. Default: 1000
+
+        Returns:
+            The decoded body, or None if no matching response arrived
+        """
+        payload = self._payload
+        waits: list[asyncio.Future] = [payload]
+        render = asyncio.ensure_future(rendered) if rendered is not None else None
+        if render is not None:
+            waits.append(render)
+
+        try:
+            done, _ = await asyncio.wait(
+                waits, timeout=timeout_ms / 1000, return_when=asyncio.FIRST_COMPLETED
+            )
+            if done and not payload.done():
+                await asyncio.wait([payload], timeout=grace_ms / 1000)
+        finally:
+            if render is not None:
+                render.cancel()
+                await asyncio.gather(render, return_exceptions=True)
+
+        if payload.done() and not payload.cancelled():
+            return payload.result()
+        return None
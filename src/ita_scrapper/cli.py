@@ -1,19 +1,18 @@
 #!/usr/bin/env python3
 """
 Command line interface for ITA Scrapper.
+
+Heavy modules (Playwright, the scrapper and the Pydantic models) are imported
+inside the commands that need them, so light commands like ``parse`` and
+``version`` start quickly enough to be called from shell pipelines.
 """
 
-import asyncio
-import json
 import sys
 from datetime import date
 from typing import Optional
 
 import click
 
-from .models import CabinClass
-from .scrapper import ITAScrapper
-
 
 @click.group()
 @click.version_option()
@@ -55,6 +54,21 @@ def main():
     help="Output format",
 )
 @click.option("--limit", "-l", default=10, help="Limit number of results")
+@click.option(
+    "--browser-endpoint",
+    envvar="ITA_BROWSER_ENDPOINT",
+    help="Connect to a running browser (e.g. from browser-server) instead of launching one",
+)
+@click.option(
+    "--record-har",
+    type=click.Path(dir_okay=False),
+    help="Save the search's network traffic to this HAR file",
+)
+@click.option(
+    "--replay-har",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Serve the search from a recorded HAR file instead of the network",
+)
 def search(
     origin: str,
     destination: str,
@@ -67,8 +81,16 @@ def search(
     headless: bool,
     format: str,
     limit: int,
+    browser_endpoint: Optional[str],
+    record_har: Optional[str],
+    replay_har: Optional[str],
 ):
     """Search for flights between two airports."""
+    import asyncio
+    import json
+
+    from .models import CabinClass
+    from .scrapper import ITAScrapper
 
     async def _search():
         try:
@@ -77,7 +99,12 @@ def search(
             ret_date = date.fromisoformat(return_date) if return_date else None
 
             # Create scrapper instance
-            async with ITAScrapper(headless=headless) as scrapper:
+            async with ITAScrapper(
+                headless=headless,
+                browser_endpoint=browser_endpoint,
+                record_har=record_har,
+                replay_har=replay_har,
+            ) as scrapper:
                 click.echo(f"Searching flights from {origin} to {destination}...")
 
                 result = await scrapper.search_flights(
@@ -233,6 +260,43 @@ def parse(text: str, data_type: str, reference_date: Optional[str]):
         sys.exit(1)
 
 
+@main.command("browser-server")
+@click.option("--host", default="127.0.0.1", help="Address to listen on")
+@click.option("--port", "-p", default=9222, help="DevTools port to listen on")
+@click.option(
+    "--headless/--no-headless", default=True, help="Run browser in headless mode"
+)
+def browser_server(host: str, port: int, headless: bool):
+    """Run a long-lived browser that searches can connect to."""
+    import asyncio
+
+    from playwright.async_api import async_playwright
+
+    from .scrapper import ITAScrapper
+
+    async def _serve():
+        async with async_playwright() as playwright:
+            browser = await ITAScrapper.launch_browser(
+                playwright, headless, debugging_port=port, debugging_host=host
+            )
+            endpoint = f"http://{host}:{port}"
+            click.echo(f"Browser server running at {endpoint}")
+            click.echo(
+                f"Connect with --browser-endpoint {endpoint} "
+                f"or ITA_BROWSER_ENDPOINT={endpoint}. Press Ctrl+C to stop."
+            )
+
+            disconnected = asyncio.Event()
+            browser.on("disconnected", lambda _: disconnected.set())
+            await disconnected.wait()
+            click.echo("Browser exited", err=True)
+
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        click.echo("Browser server stopped")
+
+
 @main.command()
 def version():
     """Show version information."""
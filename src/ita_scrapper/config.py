@@ -16,6 +16,8 @@ class Config:
         int(os.getenv("ITA_VIEWPORT_WIDTH", "1920")),
         int(os.getenv("ITA_VIEWPORT_HEIGHT", "1080")),
     )
+    # Running browser to connect to instead of launching one (CDP or Playwright)
+    BROWSER_ENDPOINT = os.getenv("ITA_BROWSER_ENDPOINT") or None
 
     # User agents for different browsers
     USER_AGENTS: ClassVar[dict[str, str]] = {
@@ -39,6 +41,13 @@ class Config:
     REQUEST_DELAY = float(
         os.getenv("ITA_REQUEST_DELAY", "0.5")
     )  # seconds between requests
+    RATE_LIMIT_BURST = int(os.getenv("ITA_RATE_LIMIT_BURST", "1"))
+    # Directory shared by processes that limit requests together (unset: per process)
+    RATE_LIMIT_DIR = os.getenv("ITA_RATE_LIMIT_DIR") or None
+
+    # File the learned selector ordering persists to (unset: keep it in memory),
+    # e.g. ~/.cache/ita-scrapper/selectors.json
+    SELECTOR_CACHE = os.getenv("ITA_SELECTOR_CACHE") or None
 
     # Logging
     LOG_LEVEL = os.getenv("ITA_LOG_LEVEL", "INFO")
@@ -47,6 +56,7 @@ class Config:
     # URLs
     GOOGLE_FLIGHTS_URL = "https://www.google.com/travel/flights"
     ITA_MATRIX_URL = "https://matrix.itasoftware.com/search"
+    ITA_MATRIX_RESULTS_URL = "https://matrix.itasoftware.com/flights"
 
     # CSS Selectors for Google Flights
     GOOGLE_SELECTORS: ClassVar[dict[str, str]] = {
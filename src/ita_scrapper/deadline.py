@@ -0,0 +1,141 @@
+"""
+End-to-end time budgets for searches.
+
+A search is a long chain of waits: navigation, selector loops while filling
+the form, readiness waits and result parsing. Each has its own timeout, so
+without an overall budget the worst case is the sum of all of them. A
+Deadline bounds the whole chain:
+
+- Every stage checks the deadline before it starts and records its name
+- Timeouts inside a stage are shrunk to the time left (clamp_timeout)
+- Retries are abandoned when their backoff would not fit the budget
+- The search itself is cancelled when the budget runs out, raising
+  ITATimeoutError naming the stage that was running
+
+The active deadline is held in a context variable, so code deep inside a
+search (parsers, readiness waits) sees it without extra arguments, and
+concurrent searches on one event loop each see their own.
+
+Usage:
+    >>> with Deadline(45).activate() as deadline:
+    ...     deadline.check("navigate")
+    ...     await page.goto(url, timeout=clamp_timeout(30000))
+"""
+
+import contextvars
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+from .exceptions import ITATimeoutError
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "ita_scrapper_deadline", default=None
+)
+
+
+class Deadline:
+    """
+    Time budget of one search.
+
+    Attributes:
+        budget: Total budget in seconds
+        stage: Name of the stage currently running
+        expires_at: Monotonic time the budget runs out
+
+    Example:
+        >>> deadline = Deadline(30)
+        >>> deadline.check("parse")
+        >>> deadline.clamp_ms(10000)  # at most the time left
+        10000
+    """
+
+    def __init__(self, budget: float):
+        """
+        Start a budget.
+
+        Args:
+            budget: Seconds the search may take in total
+        """
+        if budget <= 0:
+            raise ValueError("Deadline budget must be positive")
+        self.budget = budget
+        self.stage = "start"
+        self.expires_at = time.monotonic() + budget
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: Optional[str] = None):
+        """
+        Enter a stage, failing if the budget is already used up.
+
+        Args:
+            stage: Name of the stage about to run
+
+        Raises:
+            ITATimeoutError: If the deadline has passed
+        """
+        if stage is not None:
+            self.stage = stage
+        if self.expired:
+            raise self.error()
+
+    def clamp_ms(self, timeout_ms: float) -> int:
+        """
+        Shrink a timeout in milliseconds to the time left.
+
+        Args:
+            timeout_ms: Timeout the caller would normally use
+
+        Returns:
+            The smaller of the timeout and the remaining budget, at least 1 ms
+            (0 means "no timeout" to Playwright)
+        """
+        return max(1, int(min(timeout_ms, self.remaining * 1000)))
+
+    def error(self) -> ITATimeoutError:
+        """ITATimeoutError describing this deadline being exceeded."""
+        return ITATimeoutError(
+            f"Search exceeded its {self.budget:g}s deadline during stage {self.stage}",
+            stage=self.stage,
+        )
+
+    @contextmanager
+    def activate(self) -> Iterator["Deadline"]:
+        """Make this the deadline of the current task for a ``with`` block."""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the running search, if it has one."""
+    return _current.get()
+
+
+def clamp_timeout(timeout_ms: float) -> int:
+    """
+    Shrink a timeout to the running search's deadline.
+
+    Args:
+        timeout_ms: Timeout in milliseconds the caller would normally use
+
+    Returns:
+        The timeout unchanged outside a deadline, otherwise clamped to the
+        time left
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return int(timeout_ms)
+    return deadline.clamp_ms(timeout_ms)
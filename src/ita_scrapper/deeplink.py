@@ -0,0 +1,147 @@
+"""
+Deep links that open ITA Matrix search results directly.
+
+Filling the Matrix search form is the slowest and most fragile part of a
+search: clicking into inputs, typing airport codes with delays, waiting for
+autocomplete, probing date pickers and hunting for the submit button. The
+Matrix app can also start a search from its URL: the results page takes the
+whole search as base64-encoded JSON in its ``search`` query parameter, which
+is what the site itself produces when a search is bookmarked or shared.
+
+build_search_url() encodes SearchParams or MultiCitySearchParams in that
+format, so a search becomes a single navigation. parse_search_url() decodes a
+link again, which helps when comparing with links copied from the site.
+
+Usage:
+    >>> url = build_search_url(SearchParams(origin="JFK", destination="LAX",
+    ...                                     departure_date=date(2024, 8, 15),
+    ...                                     trip_type=TripType.ONE_WAY))
+    >>> await page.goto(url)  # the results page runs the search itself
+"""
+
+import base64
+import json
+from typing import Any, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from .config import Config
+from .models import MultiCitySearchParams, SearchParams
+from .parsers import ITAMatrixResponseParser
+
+# Matrix cabin names by cabin class
+CABIN_CODES = {
+    cabin_class: name for name, cabin_class in ITAMatrixResponseParser.CABINS.items()
+}
+
+
+def _dates(departure: str, return_date: str = "") -> dict[str, Any]:
+    """Dates section of a slice for specific (not flexible) dates."""
+    return {
+        "searchDateType": "specific",
+        "departureDate": departure,
+        "departureDateType": "depart",
+        "departureDateModifier": "0",
+        "departureDatePreferredTimes": [],
+        "returnDate": return_date,
+        "returnDateType": "depart",
+        "returnDateModifier": "0",
+        "returnDatePreferredTimes": [],
+    }
+
+
+def build_search_state(
+    search_params: Union[SearchParams, MultiCitySearchParams],
+) -> dict[str, Any]:
+    """
+    Describe a search the way the Matrix app stores it in its URL.
+
+    Args:
+        search_params: One-way, round-trip or multi-city search parameters
+
+    Returns:
+        The search state as a JSON-serializable dictionary
+    """
+    if isinstance(search_params, MultiCitySearchParams):
+        trip_type = "multi-city"
+        slices = [
+            {
+                "origin": [segment.origin],
+                "dest": [segment.destination],
+                "dates": _dates(segment.departure_date.isoformat()),
+            }
+            for segment in search_params.segments
+        ]
+    else:
+        return_date = search_params.return_date
+        trip_type = "round-trip" if return_date else "one-way"
+        slices = [
+            {
+                "origin": [search_params.origin],
+                "dest": [search_params.destination],
+                "dates": _dates(
+                    search_params.departure_date.isoformat(),
+                    return_date.isoformat() if return_date else "",
+                ),
+            }
+        ]
+
+    pax = {"adults": str(search_params.adults)}
+    if search_params.children:
+        pax["children"] = str(search_params.children)
+    if search_params.infants:
+        pax["infantsInLap"] = str(search_params.infants)
+
+    return {
+        "type": trip_type,
+        "slices": slices,
+        "options": {
+            "cabin": CABIN_CODES[search_params.cabin_class],
+            "stops": "-1",
+            "extraStops": "1",
+            "allowAirportChanges": "true",
+            "showOnlyAvailable": "true",
+        },
+        "pax": pax,
+    }
+
+
+def build_search_url(
+    search_params: Union[SearchParams, MultiCitySearchParams],
+    base_url: str = Config.ITA_MATRIX_RESULTS_URL,
+) -> str:
+    """
+    Build a link that opens the results of a search.
+
+    Args:
+        search_params: One-way, round-trip or multi-city search parameters
+        base_url: Matrix results page. Default: Config.ITA_MATRIX_RESULTS_URL
+
+    Returns:
+        The deep link URL
+
+    Example:
+        >>> build_search_url(params)
+        'https://matrix.itasoftware.com/flights?search=eyJ0eXBlIjoib25lLXdheSIs...'
+    """
+    state = json.dumps(build_search_state(search_params), separators=(",", ":"))
+    encoded = base64.b64encode(state.encode()).decode()
+    return f"{base_url}?{urlencode({'search': encoded})}"
+
+
+def parse_search_url(url: str) -> dict[str, Any]:
+    """
+    Decode the search state of a Matrix results link.
+
+    Args:
+        url: Link built by build_search_url() or copied from the site
+
+    Returns:
+        The search state dictionary
+
+    Raises:
+        ValueError: If the URL carries no decodable search
+    """
+    values = parse_qs(urlsplit(url).query).get("search")
+    if not values:
+        raise ValueError(f"No search in URL {url}")
+    return json.loads(base64.b64decode(values[0]))
@@ -29,6 +29,8 @@ Usage:
         print(f"General scraping error: {e}")
 """
 
+from typing import Optional
+
 
 class ITAScrapperError(Exception):
     """
@@ -69,7 +71,7 @@ class NavigationError(ITAScrapperError):
     - Network connectivity issues
     - Website blocking automated access (CAPTCHA, bot detection)
     - Website temporarily unavailable (maintenance, outages)
-    - HTTP errors (404, 500, etc.)
+    - HTTP errors (404, 500, etc.), reported in status_code
     - DNS resolution failures
     - SSL/TLS certificate issues
 
@@ -88,7 +90,16 @@ class NavigationError(ITAScrapperError):
         ...     # Try alternative approach or notify user
     """
 
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """
+        Create a navigation error.
+
+        Args:
+            message: Error message describing what went wrong
+            status_code: HTTP status of the failed response, if there was one
+        """
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class ParseError(ITAScrapperError):
@@ -147,6 +158,7 @@ class ITATimeoutError(ITAScrapperError):
     - Element wait timeouts (varies by operation)
     - Search completion timeouts (site-dependent)
     - Parsing operation timeouts (internal limits)
+    - Search deadlines (the stage that exceeded it is in ``stage``)
 
     Recovery Strategies:
     - Increase timeout values for complex operations
@@ -163,7 +175,16 @@ class ITATimeoutError(ITAScrapperError):
         ...     # Retry with increased timeout or smaller scope
     """
 
-    pass
+    def __init__(self, message: str, stage: Optional[str] = None):
+        """
+        Create a timeout error.
+
+        Args:
+            message: Error message describing what went wrong
+            stage: Search stage that ran out of time, if known
+        """
+        super().__init__(message)
+        self.stage = stage
 
 
 class ValidationError(ITAScrapperError):
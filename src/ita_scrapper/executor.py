@@ -0,0 +1,597 @@
+"""
+Multi-process search executor that scales across CPU cores.
+
+One asyncio event loop can only drive so many browser pages: Python parsing
+and the Playwright driver traffic of every page share a single core. The
+SearchExecutor runs several worker processes, each with its own event loop
+and its own ITAScrapperPool.
+
+Jobs and results cross the process boundary as JSON (search parameter and
+FlightResult models) over multiprocessing queues. The parent process hands
+every job to a specific worker through that worker's own queue, never more
+than the worker can run at once, so it always knows which worker holds which
+job. A collector thread resolves futures, dispatches waiting jobs as workers
+free up and supervises the workers:
+
+- A worker that crashes is replaced and the jobs it held are queued again
+- A worker can be recycled after a number of searches to bound memory growth
+- Per-worker counters are available through SearchExecutor.stats
+
+Unless a rate_limiter option is given, the workers share one file-locked
+RateLimiter, so Config.REQUEST_DELAY holds for the executor as a whole rather
+than for each process separately.
+
+Usage:
+    >>> with SearchExecutor(processes=8, pool_size=4) as executor:
+    ...     future = executor.submit(params)
+    ...     result = future.result()
+    ...     outcomes = executor.map(many_params)
+
+    From async code:
+    >>> async with SearchExecutor(processes=8) as executor:
+    ...     outcomes = await executor.search_many(many_params)
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Union
+
+from . import exceptions
+from .exceptions import ITAScrapperError
+from .models import FlightResult, MultiCitySearchParams, SearchOutcome, SearchParams
+from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+SearchParamsType = Union[SearchParams, MultiCitySearchParams]
+
+
+def default_engine_factory(options: dict[str, Any]):
+    """Create the search engine of a worker process: an ITAScrapperPool."""
+    # Imported here so the parent process does not need a browser stack
+    from .pool import ITAScrapperPool
+
+    return ITAScrapperPool(**options)
+
+
+class WorkerStats:
+    """
+    Counters for one worker slot of a SearchExecutor.
+
+    A slot keeps its statistics across restarts of its process.
+
+    Attributes:
+        worker_id: Slot number
+        pid: Process id of the current worker process
+        searches: Searches completed successfully
+        failures: Searches that raised an error
+        in_flight: Searches currently running in the worker
+        restarts: Times the worker process crashed and was replaced
+        recycles: Times the worker process was replaced after max searches
+        started_at: Monotonic time the current process was started
+    """
+
+    def __init__(self, worker_id: int):
+        """Create zeroed counters for a worker slot."""
+        self.worker_id = worker_id
+        self.pid: Optional[int] = None
+        self.searches = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.restarts = 0
+        self.recycles = 0
+        self.started_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkerStats(worker_id={self.worker_id}, pid={self.pid}, "
+            f"searches={self.searches}, failures={self.failures}, "
+            f"in_flight={self.in_flight}, restarts={self.restarts}, "
+            f"recycles={self.recycles})"
+        )
+
+
+class _Job:
+    """Bookkeeping for a submitted search."""
+
+    def __init__(self, job_id: int, params: SearchParamsType, max_results: int):
+        self.job_id = job_id
+        self.params = params
+        self.max_results = max_results
+        self.future: Future = Future()
+        self.attempts = 0
+
+    def message(self) -> tuple:
+        """Serialized form sent to the worker processes."""
+        kind = "multi_city" if isinstance(self.params, MultiCitySearchParams) else "one"
+        return (self.job_id, kind, self.params.model_dump_json(), self.max_results)
+
+
+def _load_params(kind: str, payload: str) -> SearchParamsType:
+    if kind == "multi_city":
+        return MultiCitySearchParams.model_validate_json(payload)
+    return SearchParams.model_validate_json(payload)
+
+
+def _rebuild_error(type_name: str, message: str) -> Exception:
+    """Recreate a library exception raised in a worker process."""
+    error_class = getattr(exceptions, type_name, None)
+    if isinstance(error_class, type) and issubclass(error_class, ITAScrapperError):
+        return error_class(message)
+    return ITAScrapperError(f"{type_name}: {message}")
+
+
+def _worker_main(
+    worker_id: int,
+    jobs: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    engine_factory: Callable[[dict[str, Any]], Any],
+    options: dict[str, Any],
+    concurrency: int,
+    max_searches: Optional[int],
+):
+    """Entry point of a worker process."""
+    asyncio.run(
+        _run_worker(
+            worker_id, jobs, results, engine_factory, options, concurrency, max_searches
+        )
+    )
+
+
+async def _run_worker(
+    worker_id: int,
+    jobs: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    engine_factory: Callable[[dict[str, Any]], Any],
+    options: dict[str, Any],
+    concurrency: int,
+    max_searches: Optional[int],
+):
+    """
+    Run the jobs the parent hands to this worker, up to ``concurrency`` at once.
+
+    The parent never sends more than ``concurrency`` unfinished jobs, nor more
+    than ``max_searches`` in total, so taking a job cannot block on a slot.
+    """
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    running: set[asyncio.Task] = set()
+    taken = 0
+    reason = "shutdown"
+
+    async def run_job(engine, job_id: int, kind: str, payload: str, max_results: int):
+        try:
+            result = await engine.search(_load_params(kind, payload), max_results)
+            message = ("result", worker_id, job_id, result.model_dump_json(), None)
+        except Exception as e:
+            message = ("result", worker_id, job_id, None, (type(e).__name__, str(e)))
+        finally:
+            slots.release()
+        results.put(message)
+
+    async with engine_factory(options) as engine:
+        results.put(("started", worker_id, os.getpid()))
+
+        while True:
+            if max_searches is not None and taken >= max_searches:
+                reason = "recycle"
+                break
+
+            await slots.acquire()
+            job = await loop.run_in_executor(None, jobs.get)
+            if job is None:
+                slots.release()
+                break
+
+            taken += 1
+            job_id, kind, payload, max_results = job
+            task = asyncio.create_task(
+                run_job(engine, job_id, kind, payload, max_results)
+            )
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        await asyncio.gather(*running)
+
+    results.put(("exit", worker_id, reason))
+
+
+class SearchExecutor:
+    """
+    Runs searches on a set of worker processes, each owning a browser pool.
+
+    Attributes:
+        processes: Number of worker processes
+        pool_size: Concurrent searches (browser contexts) per worker process
+        max_searches_per_worker: Searches after which a worker process is
+            replaced by a fresh one, or None to keep workers indefinitely
+        max_requeues: How often a job is queued again after its worker crashed
+
+    Example:
+        >>> with SearchExecutor(processes=4, pool_size=3, headless=True) as ex:
+        ...     for outcome in ex.map(all_params):
+        ...         print(outcome.index, outcome.ok)
+        ...     print(ex.stats)
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        pool_size: int = 2,
+        max_searches_per_worker: Optional[int] = None,
+        max_requeues: int = 1,
+        engine_factory: Callable[[dict[str, Any]], Any] = default_engine_factory,
+        mp_context: str = "spawn",
+        **scrapper_options: Any,
+    ):
+        """
+        Configure the executor.
+
+        Args:
+            processes: Number of worker processes. Default: number of CPU cores
+            pool_size: Browser contexts, and so concurrent searches, per worker.
+                Default: 2
+            max_searches_per_worker: Replace a worker after this many searches.
+                Default: None (never)
+            max_requeues: Times a job is retried on another worker after its
+                worker crashed. Default: 1
+            engine_factory: Picklable top-level callable that receives the worker
+                options and returns an async context manager with a
+                ``search(params, max_results)`` coroutine. Default: creates an
+                ITAScrapperPool
+            mp_context: multiprocessing start method. Default: "spawn"
+            **scrapper_options: Keyword arguments for ITAScrapperPool (and its
+                workers) in every process, for example headless=True
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.pool_size = pool_size
+        self.max_searches_per_worker = max_searches_per_worker
+        self.max_requeues = max_requeues
+        self.engine_factory = engine_factory
+        self.worker_options = {"size": pool_size, **scrapper_options}
+
+        self._context = multiprocessing.get_context(mp_context)
+        self._results_queue: Optional[multiprocessing.Queue] = None
+        self._workers: dict[int, multiprocessing.Process] = {}
+        # Job queue of each worker process
+        self._queues: dict[int, multiprocessing.Queue] = {}
+        self._stats: dict[int, WorkerStats] = {}
+        # Jobs handed to each worker and not resolved yet
+        self._held: dict[int, set[int]] = {}
+        # Jobs handed to the current process of each worker slot
+        self._dispatched: dict[int, int] = {}
+        # Jobs waiting for a free worker, in submission order
+        self._backlog: deque[int] = deque()
+        self._jobs: dict[int, _Job] = {}
+        self._job_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._collector: Optional[threading.Thread] = None
+        self._stopping = False
+        self._rate_limit_dir: Optional[str] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.to_thread(self.shutdown)
+
+    @property
+    def stats(self) -> list[WorkerStats]:
+        """Counters of every worker slot."""
+        with self._lock:
+            return [self._stats[worker_id] for worker_id in sorted(self._stats)]
+
+    def start(self):
+        """Start the worker processes and the result collector."""
+        if self._collector is not None:
+            raise ITAScrapperError("Executor already started")
+
+        self._stopping = False
+        if "rate_limiter" not in self.worker_options:
+            # Let all worker processes draw from one shared request budget
+            self._rate_limit_dir = tempfile.mkdtemp(prefix="ita-rate-limit-")
+            self.worker_options["rate_limiter"] = RateLimiter(
+                lock_dir=self._rate_limit_dir
+            )
+
+        self._results_queue = self._context.Queue()
+
+        for worker_id in range(self.processes):
+            self._stats[worker_id] = WorkerStats(worker_id)
+            self._spawn(worker_id)
+
+        self._collector = threading.Thread(
+            target=self._collect, name="ita-executor-collector", daemon=True
+        )
+        self._collector.start()
+        logger.info(f"Search executor started with {self.processes} processes")
+
+    def shutdown(self, timeout: float = 60.0):
+        """
+        Let workers finish their current searches and stop them.
+
+        Jobs that have not started yet are cancelled.
+
+        Args:
+            timeout: Seconds to wait for workers before terminating them
+        """
+        if self._collector is None:
+            return
+
+        with self._lock:
+            self._stopping = True
+            workers = list(self._workers.values())
+            # Drop waiting jobs, then send each worker its stop sentinel
+            self._backlog.clear()
+            for jobs in self._queues.values():
+                jobs.put(None)
+
+        deadline = time.monotonic() + timeout
+        for process in workers:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Terminating unresponsive worker {process.pid}")
+                process.terminate()
+                process.join()
+
+        self._collector.join()
+        self._collector = None
+
+        with self._lock:
+            for job in self._jobs.values():
+                job.future.cancel()
+            self._jobs.clear()
+
+        for jobs in self._queues.values():
+            jobs.close()
+        self._queues.clear()
+        self._results_queue.close()
+
+        if self._rate_limit_dir:
+            del self.worker_options["rate_limiter"]
+            shutil.rmtree(self._rate_limit_dir, ignore_errors=True)
+            self._rate_limit_dir = None
+        logger.info("Search executor shut down")
+
+    def submit(self, params: SearchParamsType, max_results: int = 20) -> Future:
+        """
+        Queue a search on the next free worker.
+
+        Args:
+            params: Search parameters
+            max_results: Maximum number of results to return
+
+        Returns:
+            Future resolving to the FlightResult, or raising the search's error
+        """
+        if self._collector is None or self._stopping:
+            raise ITAScrapperError("Executor not running. Call start() first.")
+
+        job = _Job(next(self._job_ids), params, max_results)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._backlog.append(job.job_id)
+            self._dispatch()
+        return job.future
+
+    def map(
+        self, params: Iterable[SearchParamsType], max_results: int = 20
+    ) -> Iterator[SearchOutcome]:
+        """
+        Run a batch of searches and yield their outcomes in input order.
+
+        All searches are queued up front; failures are reported in the
+        outcomes rather than raised.
+
+        Args:
+            params: Search parameters, one per search
+            max_results: Maximum number of results per search
+
+        Yields:
+            SearchOutcome per input, in input order
+        """
+        submitted = [(p, self.submit(p, max_results)) for p in params]
+        for index, (search_params, future) in enumerate(submitted):
+            try:
+                result = future.result()
+                yield SearchOutcome(index=index, params=search_params, result=result)
+            except Exception as e:
+                yield SearchOutcome(index=index, params=search_params, error=e)
+
+    async def search_many(
+        self, params: Iterable[SearchParamsType], max_results: int = 20
+    ) -> list[SearchOutcome]:
+        """
+        Async counterpart of map(), returning all outcomes in input order.
+
+        Args:
+            params: Search parameters, one per search
+            max_results: Maximum number of results per search
+
+        Returns:
+            SearchOutcome per input, in input order
+        """
+        submitted = [(p, self.submit(p, max_results)) for p in params]
+        results = await asyncio.gather(
+            *(asyncio.wrap_future(future) for _, future in submitted),
+            return_exceptions=True,
+        )
+
+        outcomes = []
+        for index, ((search_params, _), result) in enumerate(zip(submitted, results)):
+            if isinstance(result, BaseException):
+                outcomes.append(
+                    SearchOutcome(index=index, params=search_params, error=result)
+                )
+            else:
+                outcomes.append(
+                    SearchOutcome(index=index, params=search_params, result=result)
+                )
+        return outcomes
+
+    def _spawn(self, worker_id: int):
+        """Start (or restart) the process of a worker slot."""
+        old_queue = self._queues.get(worker_id)
+        if old_queue is not None:
+            # Jobs left in it were held by the old process and requeued
+            old_queue.cancel_join_thread()
+            old_queue.close()
+        jobs = self._context.Queue()
+
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                jobs,
+                self._results_queue,
+                self.engine_factory,
+                self.worker_options,
+                self.pool_size,
+                self.max_searches_per_worker,
+            ),
+            name=f"ita-executor-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[worker_id] = process
+        self._queues[worker_id] = jobs
+        self._held[worker_id] = set()
+        self._dispatched[worker_id] = 0
+        self._stats[worker_id].pid = process.pid
+        self._stats[worker_id].in_flight = 0
+        self._stats[worker_id].started_at = time.monotonic()
+
+    def _dispatch(self):
+        """
+        Hand waiting jobs to workers with free capacity. Called with the lock held.
+
+        A job is marked as held by its worker before it is sent, so a worker
+        that dies at any point after that has its jobs queued again.
+        """
+        for worker_id in sorted(self._workers):
+            held = self._held[worker_id]
+            while (
+                self._backlog
+                and not self._stopping
+                and len(held) < self.pool_size
+                and (
+                    self.max_searches_per_worker is None
+                    or self._dispatched[worker_id] < self.max_searches_per_worker
+                )
+            ):
+                job = self._jobs.get(self._backlog.popleft())
+                if job is None or job.future.done():
+                    # Cancelled by the caller while waiting
+                    if job is not None:
+                        self._jobs.pop(job.job_id)
+                    continue
+                held.add(job.job_id)
+                self._dispatched[worker_id] += 1
+                self._stats[worker_id].in_flight += 1
+                self._queues[worker_id].put(job.message())
+
+    def _collect(self):
+        """Collector thread: process worker messages and supervise workers."""
+        while True:
+            with self._lock:
+                if self._stopping and not any(
+                    p.is_alive() for p in self._workers.values()
+                ):
+                    break
+
+            try:
+                message = self._results_queue.get(timeout=0.5)
+            except queue.Empty:
+                message = None
+
+            if message is not None:
+                with self._lock:
+                    self._handle(message)
+            self._check_workers()
+
+    def _handle(self, message: tuple):
+        """Apply one message from a worker. Called with the lock held."""
+        kind, worker_id = message[0], message[1]
+        stats = self._stats[worker_id]
+
+        if kind == "started":
+            stats.pid = message[2]
+
+        elif kind == "result":
+            _, _, job_id, payload, error = message
+            self._held[worker_id].discard(job_id)
+            stats.in_flight = max(0, stats.in_flight - 1)
+            job = self._jobs.pop(job_id, None)
+
+            if error is None:
+                stats.searches += 1
+                if job and not job.future.done():
+                    job.future.set_result(FlightResult.model_validate_json(payload))
+            else:
+                stats.failures += 1
+                if job and not job.future.done():
+                    job.future.set_exception(_rebuild_error(*error))
+            self._dispatch()
+
+        elif kind == "exit" and message[2] == "recycle" and not self._stopping:
+            logger.info(f"Recycling worker {worker_id}")
+            stats.recycles += 1
+            self._workers[worker_id].join()
+            self._spawn(worker_id)
+            self._dispatch()
+
+    def _check_workers(self):
+        """Replace crashed workers and queue their jobs again."""
+        with self._lock:
+            for worker_id, process in list(self._workers.items()):
+                if process.is_alive() or self._stopping:
+                    continue
+                if process.exitcode == 0 and not self._held[worker_id]:
+                    continue
+
+                logger.warning(
+                    f"Worker {worker_id} (pid {process.pid}) died with exit code "
+                    f"{process.exitcode}, restarting"
+                )
+                self._stats[worker_id].restarts += 1
+
+                requeued = []
+                for job_id in sorted(self._held[worker_id]):
+                    job = self._jobs.get(job_id)
+                    if job is None:
+                        continue
+                    job.attempts += 1
+                    if job.attempts > self.max_requeues:
+                        self._jobs.pop(job_id)
+                        if not job.future.done():
+                            job.future.set_exception(
+                                ITAScrapperError(
+                                    f"Worker crashed while running search {job_id}"
+                                )
+                            )
+                    else:
+                        requeued.append(job_id)
+                # Ahead of later submissions, in their original order
+                self._backlog.extendleft(reversed(requeued))
+
+                self._spawn(worker_id)
+                self._dispatch()
@@ -0,0 +1,157 @@
+"""
+HAR recording and offline replay of search traffic.
+
+A recorded search is a complete, reusable fixture: benchmarks can measure
+parsing and page handling without network variance, CI can run full searches
+without touching the site, and a new parser version can be run over
+yesterday's traffic to compare results.
+
+Recording uses Playwright's built-in HAR capture on the browser context.
+Replay serves the HAR back through Playwright routing (route_from_har) and
+aborts everything else, so a replayed search never reaches the network.
+
+One request needs special care: the search API call carries per-session
+tokens in its body, so a replayed page never sends exactly the recorded body
+and Playwright's HAR matching (which compares POST bodies) misses it.
+HarReplay serves those calls from the recorded responses in order instead.
+
+Usage:
+    >>> async with ITAScrapper(record_har="jfk-lax.har") as scrapper:
+    ...     await scrapper.search_flights("JFK", "LAX", date(2024, 8, 15))
+    >>> async with ITAScrapper(replay_har="jfk-lax.har") as scrapper:
+    ...     result = await scrapper.search_flights("JFK", "LAX", date(2024, 8, 15))
+"""
+
+import base64
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Union
+
+from playwright.async_api import BrowserContext, Route
+
+from .capture import SEARCH_API_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Recorded headers describing the original transfer, not the replayed body
+_STALE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def record_options(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    Browser context options that record all traffic to a HAR file.
+
+    Response bodies are embedded in a .har file, or stored next to the HAR
+    inside a .zip archive.
+
+    Args:
+        path: HAR file to write when the context closes
+
+    Returns:
+        Keyword arguments for Browser.new_context()
+    """
+    path = Path(path)
+    return {
+        "record_har_path": str(path),
+        "record_har_mode": "full",
+        "record_har_content": "attach" if path.suffix == ".zip" else "embed",
+    }
+
+
+class HarReplay:
+    """
+    Serves a recorded HAR to a browser context with no network access.
+
+    Attributes:
+        path: HAR file to replay
+        pattern: URL pattern of requests served in recorded order regardless
+            of their body (the Matrix search API by default)
+        missed: Requests that had no recorded response and were aborted
+
+    Example:
+        >>> replay = HarReplay("jfk-lax.har")
+        >>> await replay.install(context)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        pattern: Union[str, re.Pattern] = SEARCH_API_PATTERN,
+    ):
+        """
+        Load the HAR file.
+
+        Args:
+            path: HAR file written by a recording run
+            pattern: URL pattern of requests replayed in order
+
+        Raises:
+            FileNotFoundError: If the HAR file does not exist
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"HAR file not found: {self.path}")
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.missed = 0
+        self._responses = self._load_responses()
+        self._served = 0
+
+    def _load_responses(self) -> list[dict[str, Any]]:
+        """Recorded responses of requests matching the pattern, in order."""
+        if self.path.suffix == ".zip":
+            # Bodies live in separate archive entries; route_from_har only
+            return []
+
+        har = json.loads(self.path.read_text())
+        responses = []
+        for entry in har["log"]["entries"]:
+            if not self.pattern.search(entry["request"]["url"]):
+                continue
+            response = entry["response"]
+            content = response.get("content", {})
+            body = content.get("text", "")
+            if content.get("encoding") == "base64":
+                body = base64.b64decode(body)
+            responses.append(
+                {
+                    "status": response["status"],
+                    "headers": {
+                        header["name"]: header["value"]
+                        for header in response["headers"]
+                        if header["name"].lower() not in _STALE_HEADERS
+                    },
+                    "body": body,
+                }
+            )
+        return responses
+
+    async def install(self, context: BrowserContext):
+        """
+        Route all of a context's requests to the recording.
+
+        Must be installed after any other route handlers, because the most
+        recently installed handler runs first.
+        """
+        # Runs for requests the HAR has no exact match for
+        await context.route("**/*", self._handle_unmatched)
+        await context.route_from_har(self.path, not_found="fallback")
+        logger.info(f"Replaying {self.path} ({len(self._responses)} search responses)")
+
+    async def _handle_unmatched(self, route: Route):
+        """Serve pattern matches in recorded order; abort everything else."""
+        request = route.request
+        if self.pattern.search(request.url) and self._responses:
+            response = self._responses[self._served % len(self._responses)]
+            self._served += 1
+            await route.fulfill(
+                status=response["status"],
+                headers=response["headers"],
+                body=response["body"],
+            )
+            return
+
+        self.missed += 1
+        logger.debug(f"No recorded response for {request.method} {request.url}")
+        await route.abort("internetdisconnected")
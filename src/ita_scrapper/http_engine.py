@@ -0,0 +1,505 @@
+"""
+Browserless search engine replaying the ITA Matrix search API.
+
+A browser search loads the whole Matrix web app, fills the form and waits for
+the results to render: tens of seconds and hundreds of megabytes per search.
+All of that ends in a single JSON call to the search API, so once the shape of
+that call is known most searches can skip the browser entirely.
+
+ITAHttpEngine sends the search request itself over a pooled, keep-alive HTTP
+client (httpx) and maps the JSON response with ITAMatrixResponseParser. The
+request is not built from scratch: a MatrixSession holds a real search request
+recorded from a browser (URL, headers including API key and cookies, and the
+JSON body with its tokens). Each search reuses that body with its own
+airports, dates, passengers and cabin. Sessions are harvested occasionally
+with a real browser search: when the engine has none, when it is older than
+``max_session_age``, or when the API rejects it.
+
+httpx is an optional dependency: ``pip install 'ita-scrapper[http]'``.
+
+Usage:
+    >>> async with ITAHttpEngine() as engine:
+    ...     result = await engine.search_flights("JFK", "LAX", date(2024, 8, 15))
+    ...     engine.session.save("matrix-session.json")  # reuse in later runs
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from collections.abc import Awaitable
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from pydantic import ValidationError as PydanticValidationError
+
+from .capture import XSSI_PREFIX
+from .deadline import Deadline, clamp_timeout
+from .exceptions import (
+    ITAScrapperError,
+    ITATimeoutError,
+    NavigationError,
+    ParseError,
+    ValidationError,
+)
+from .models import CabinClass, FlightResult, SearchParams, TripType
+from .parsers import ITAMatrixResponseParser
+from .ratelimit import RateLimiter, default_rate_limiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
+    from playwright.async_api import Request
+
+logger = logging.getLogger(__name__)
+
+# Headers of the recorded request that must not be replayed verbatim
+_SKIPPED_HEADERS = frozenset(
+    {"host", "content-length", "connection", "accept-encoding", "keep-alive"}
+)
+
+# Statuses meaning the session (API key, cookies or tokens) is no longer valid
+SESSION_REJECTED_STATUS_CODES = frozenset({401, 403})
+
+Harvester = Callable[[SearchParams], Awaitable["MatrixSession"]]
+
+
+class MatrixSession:
+    """
+    A search API request recorded from a browser, ready to be replayed.
+
+    Attributes:
+        url: Search API URL, including its API key query parameter
+        headers: Request headers to send (cookies included)
+        body: JSON body of the recorded search, used as template
+        created_at: Unix time the session was harvested
+
+    Example:
+        >>> session = MatrixSession.load("matrix-session.json")
+        >>> session.age
+        412.7
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict[str, str],
+        body: dict[str, Any],
+        created_at: Optional[float] = None,
+    ):
+        """
+        Create a session.
+
+        Args:
+            url: Search API URL
+            headers: Request headers of the recorded search
+            body: JSON body of the recorded search
+            created_at: Unix time of the harvest. Default: now
+        """
+        self.url = url
+        self.headers = {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in _SKIPPED_HEADERS and not name.startswith(":")
+        }
+        self.body = body
+        self.created_at = time.time() if created_at is None else created_at
+
+    @property
+    def age(self) -> float:
+        """Seconds since the session was harvested."""
+        return time.time() - self.created_at
+
+    @classmethod
+    async def from_request(cls, request: "Request") -> "MatrixSession":
+        """
+        Record a session from a search API request made by a browser page.
+
+        Args:
+            request: Playwright request of the search call
+
+        Raises:
+            ParseError: If the request has no JSON body
+        """
+        body = request.post_data_json
+        if not isinstance(body, dict):
+            raise ParseError("Search API request has no JSON body to replay")
+        return cls(request.url, await request.all_headers(), body)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form of the session."""
+        return {
+            "url": self.url,
+            "headers": self.headers,
+            "body": self.body,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MatrixSession":
+        """Recreate a session from to_dict() output."""
+        return cls(data["url"], data["headers"], data["body"], data["created_at"])
+
+    def save(self, path: Union[str, Path]):
+        """Write the session to a JSON file. It contains cookies; keep it private."""
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MatrixSession":
+        """Read a session written by save()."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+async def harvest_session(
+    search_params: SearchParams, **scrapper_options: Any
+) -> MatrixSession:
+    """
+    Harvest a session by running one search in a real browser.
+
+    Args:
+        search_params: Search to run; any valid search works
+        **scrapper_options: ITAScrapper keyword arguments
+
+    Returns:
+        The recorded session
+    """
+    from .scrapper import ITAScrapper
+
+    async with ITAScrapper(**scrapper_options) as scrapper:
+        return await scrapper.harvest_session(search_params)
+
+
+class ITAHttpEngine:
+    """
+    Flight search engine that calls the Matrix search API without a browser.
+
+    Offers the same search_flights() and search() methods as ITAScrapper, so
+    it can replace the scrapper wherever searches are run. The HTTP client is
+    opened by start() (or ``async with``) and reuses its connections across
+    searches.
+
+    Attributes:
+        session: Current MatrixSession, or None before the first harvest
+        harvests: Number of sessions harvested by this engine
+        attempts: Attempts of the current (or last) search
+
+    Example:
+        >>> engine = ITAHttpEngine(session=MatrixSession.load("session.json"))
+        >>> async with engine:
+        ...     result = await engine.search(params, max_results=50)
+    """
+
+    # Matrix cabin names by cabin class
+    CABINS = {
+        cabin_class: name
+        for name, cabin_class in ITAMatrixResponseParser.CABINS.items()
+    }
+
+    def __init__(
+        self,
+        session: Optional[MatrixSession] = None,
+        harvester: Union[bool, Harvester] = True,
+        max_session_age: float = 1800.0,
+        timeout: int = 30000,
+        max_connections: int = 10,
+        rate_limiter: Union[bool, RateLimiter] = True,
+        retry: Union[bool, RetryPolicy] = True,
+    ):
+        """
+        Configure the engine.
+
+        Args:
+            session: Session to start with, for example one loaded from disk
+            harvester: How new sessions are obtained. True runs a headless
+                ITAScrapper search (harvest_session), False never harvests (a
+                session must be given), or pass a coroutine function taking
+                the SearchParams of the search that needs the session.
+                Default: True
+            max_session_age: Harvest a new session once the current one is
+                this many seconds old. Default: 1800 (30 minutes)
+            timeout: Timeout of a search request in milliseconds.
+                Default: 30000
+            max_connections: Connections the client keeps open to the API.
+                Default: 10
+            rate_limiter: Spacing of search requests, as for ITAScrapper.
+                Default: True (the process-wide limiter)
+            retry: Retries of failed requests, as for ITAScrapper.
+                Default: True
+        """
+        self.session = session
+        if harvester is True:
+            self._harvester: Optional[Harvester] = harvest_session
+        elif harvester is False:
+            self._harvester = None
+        else:
+            self._harvester = harvester
+        self.max_session_age = max_session_age
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        if rate_limiter is True:
+            self.rate_limiter: Optional[RateLimiter] = default_rate_limiter()
+        elif rate_limiter is False:
+            self.rate_limiter = None
+        else:
+            self.rate_limiter = rate_limiter
+
+        if isinstance(retry, RetryPolicy):
+            self.retry_policy = retry
+        else:
+            self.retry_policy = RetryPolicy() if retry else RetryPolicy(max_retries=0)
+
+        self.harvests = 0
+        self.attempts: dict[str, int] = {}
+        self._parser = ITAMatrixResponseParser()
+        self._client: Optional["httpx.AsyncClient"] = None
+        # Held while harvesting, so concurrent searches share one harvest
+        self._harvest_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        """Open the HTTP client when entering an async context."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the HTTP client when leaving an async context."""
+        await self.close()
+
+    async def start(self):
+        """
+        Open the pooled HTTP client.
+
+        Raises:
+            ITAScrapperError: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ITAScrapperError(
+                "ITAHttpEngine requires httpx: pip install 'ita-scrapper[http]'"
+            ) from e
+
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            timeout=self.timeout / 1000,
+        )
+
+    async def close(self):
+        """Close the HTTP client and its connections. Safe to call twice."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def search_flights(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: date,
+        return_date: Optional[date] = None,
+        cabin_class: CabinClass = CabinClass.ECONOMY,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        max_results: int = 20,
+        deadline: Optional[float] = None,
+    ) -> FlightResult:
+        """
+        Search for flights; same arguments as ITAScrapper.search_flights().
+
+        Returns:
+            FlightResult containing found flights
+
+        Raises:
+            ITAScrapperError: If the parameters are invalid or the search fails
+        """
+        try:
+            search_params = SearchParams(
+                origin=origin,
+                destination=destination,
+                departure_date=departure_date,
+                return_date=return_date,
+                trip_type=TripType.ROUND_TRIP if return_date else TripType.ONE_WAY,
+                cabin_class=cabin_class,
+                adults=adults,
+                children=children,
+                infants=infants,
+            )
+        except (PydanticValidationError, ValidationError) as e:
+            raise ITAScrapperError(f"Invalid search parameters: {e}") from e
+
+        return await self.search(search_params, max_results, deadline)
+
+    async def search(
+        self,
+        search_params: SearchParams,
+        max_results: int = 20,
+        deadline: Optional[float] = None,
+    ) -> FlightResult:
+        """
+        Run a search described by a SearchParams model.
+
+        Args:
+            search_params: Validated search parameters
+            max_results: Maximum number of results to return
+            deadline: Total time budget in seconds, including a harvest if
+                one is needed. Default: None (no overall limit)
+
+        Returns:
+            FlightResult containing found flights
+        """
+        if deadline is None:
+            return await self._search(search_params, max_results)
+
+        budget = Deadline(deadline)
+
+        async def run():
+            with budget.activate():
+                return await self._search(search_params, max_results)
+
+        try:
+            return await asyncio.wait_for(run(), budget.remaining)
+        except asyncio.TimeoutError:
+            if not budget.expired:
+                raise
+            raise budget.error() from None
+
+    async def _search(
+        self, search_params: SearchParams, max_results: int
+    ) -> FlightResult:
+        """Send the search, harvesting a new session first if needed."""
+        if self._client is None:
+            raise ITAScrapperError("Engine not started. Call start() first.")
+
+        self.attempts = {}
+        if self.session is None or self.session.age >= self.max_session_age:
+            await self._harvest(search_params, stale=self.session)
+
+        try:
+            payload = await self._request(search_params, max_results)
+        except NavigationError as e:
+            rejected = e.status_code in SESSION_REJECTED_STATUS_CODES
+            if not rejected or self._harvester is None:
+                raise
+            logger.warning(f"Search API rejected the session (HTTP {e.status_code})")
+            await self._harvest(search_params, stale=self.session)
+            payload = await self._request(search_params, max_results)
+
+        flights = self._parser.parse_search_response(
+            payload, max_results, search_params.cabin_class
+        )
+        return FlightResult(
+            flights=flights,
+            search_params=search_params,
+            total_results=len(flights),
+        )
+
+    async def _harvest(
+        self, search_params: SearchParams, stale: Optional[MatrixSession]
+    ):
+        """Replace the session, unless a concurrent search already did."""
+        if self._harvester is None:
+            raise ITAScrapperError(
+                "No usable search API session and harvesting is disabled"
+            )
+
+        async with self._harvest_lock:
+            if self.session is not stale:
+                return
+            logger.info("Harvesting a search API session with a browser")
+            self.session = await self._harvester(search_params)
+            self.harvests += 1
+
+    async def _request(self, search_params: SearchParams, max_results: int) -> dict:
+        """POST the search with retries and return the decoded response."""
+        return await self.retry_policy.call(
+            "search", lambda: self._post(search_params, max_results), self.attempts
+        )
+
+    async def _post(self, search_params: SearchParams, max_results: int) -> dict:
+        """Send one search request."""
+        import httpx
+
+        session = self.session
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(session.url)
+
+        try:
+            response = await self._client.post(
+                session.url,
+                json=self.build_body(session.body, search_params, max_results),
+                headers=session.headers,
+                timeout=clamp_timeout(self.timeout) / 1000,
+            )
+        except httpx.TimeoutException as e:
+            raise ITATimeoutError(f"Search API request timed out: {e}") from e
+        except httpx.TransportError as e:
+            raise NavigationError(f"Search API request failed: {e}") from e
+
+        if response.status_code >= 400:
+            raise NavigationError(
+                f"Search API returned HTTP {response.status_code}",
+                status_code=response.status_code,
+            )
+
+        text = response.text
+        if text.startswith(XSSI_PREFIX):
+            text = text[len(XSSI_PREFIX) :]
+        try:
+            payload = json.loads(text)
+        except ValueError as e:
+            raise ParseError(f"Search API returned invalid JSON: {e}") from e
+        if not self._parser.is_search_response(payload):
+            raise ParseError("Search API response contains no solutions")
+        return payload
+
+    @classmethod
+    def build_body(
+        cls, template: dict, search_params: SearchParams, max_results: int
+    ) -> dict:
+        """
+        Adapt a recorded search body to other search parameters.
+
+        Everything the browser sent (tokens, summarizers, options) is kept;
+        only the slices, passengers, cabin and page size are replaced.
+
+        Args:
+            template: JSON body of the recorded search
+            search_params: Search to run
+            max_results: Number of solutions to request
+
+        Returns:
+            The request body
+        """
+        body = copy.deepcopy(template)
+        inputs = body.setdefault("inputs", {})
+
+        recorded = inputs.get("slices") or [{}]
+        origin, destination = search_params.origin, search_params.destination
+        legs = [(origin, destination, search_params.departure_date)]
+        if search_params.return_date:
+            legs.append((destination, origin, search_params.return_date))
+
+        slices = []
+        for index, (departure, arrival, day) in enumerate(legs):
+            slice_ = copy.deepcopy(recorded[min(index, len(recorded) - 1)])
+            slice_.update(
+                origin=[departure], destination=[arrival], date=day.isoformat()
+            )
+            slices.append(slice_)
+        inputs["slices"] = slices
+
+        pax = {"adults": search_params.adults}
+        if search_params.children:
+            pax["children"] = search_params.children
+        if search_params.infants:
+            pax["infantsInLap"] = search_params.infants
+        inputs["pax"] = pax
+
+        inputs["cabin"] = cls.CABINS[search_params.cabin_class]
+        inputs.setdefault("page", {})["size"] = max_results
+        return body
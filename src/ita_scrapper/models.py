@@ -13,7 +13,7 @@ access methods for common operations.
 Key model categories:
 - Flight Data: Flight, FlightSegment, Airport, Airline
 - Search Configuration: SearchParams, MultiCitySearchParams
-- Results: FlightResult, PriceCalendar
+- Results: FlightResult, PriceCalendar, SearchOutcome
 - Enums: TripType, CabinClass
 
 All models support JSON serialization/deserialization and include comprehensive
@@ -23,9 +23,9 @@ validation rules to ensure data integrity.
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class TripType(str, Enum):
@@ -612,3 +612,42 @@ class MultiCitySearchParams(BaseModel):
     adults: int = Field(1, ge=1, le=9)
     children: int = Field(0, ge=0, le=8)
     infants: int = Field(0, ge=0, le=4)
+
+
+class SearchOutcome(BaseModel):
+    """
+    Result of one search in a batch, successful or not.
+
+    Batch searches never abort because a single search failed; instead every
+    input produces an outcome holding either the FlightResult or the
+    exception that search raised.
+
+    Attributes:
+        index: Position of the search parameters in the batch input
+        params: Search parameters of this search
+        result: FlightResult if the search succeeded, otherwise None
+        error: Exception raised by the search, or None on success
+
+    Properties:
+        ok: Whether the search succeeded
+
+    Example:
+        >>> outcomes = await pool.search_many(all_params, concurrency=8)
+        >>> for outcome in outcomes:
+        ...     if outcome.ok:
+        ...         print(outcome.params.origin, len(outcome.result.flights))
+        ...     else:
+        ...         print(outcome.params.origin, "failed:", outcome.error)
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    params: Union[SearchParams, MultiCitySearchParams]
+    result: Optional[FlightResult] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the search succeeded."""
+        return self.error is None
@@ -26,7 +26,7 @@ Key Features:
 
 Architecture:
 The parsing system uses a layered approach:
-1. Wait for dynamic content to load completely
+1. Wait for the first dynamic results to appear
 2. Extract tooltip data containing detailed flight information
 3. Identify flight result containers in the main page
 4. Cross-reference container and tooltip data
@@ -36,17 +36,137 @@ The parsing system uses a layered approach:
 
 import logging
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
-from typing import Optional
-
-from playwright.async_api import ElementHandle, Page
-
-from .models import Airline, Airport, CabinClass, Flight, FlightSegment
+from typing import Optional, Union
+
+from playwright.async_api import Page
+
+from .deadline import clamp_timeout
+from .models import (
+    Airline,
+    Airport,
+    CabinClass,
+    Flight,
+    FlightSegment,
+    MultiCitySearchParams,
+    SearchParams,
+)
+from .readiness import PageReadiness
+from .selector_registry import SelectorRegistry
 from .utils import FlightDataParser
 
 logger = logging.getLogger(__name__)
 
+# Collects {id: text} for every tooltip strategy in a single page.evaluate.
+# Role and CDK tooltips overwrite earlier entries; the broad selector only
+# fills in ids not found by the first two.
+_TOOLTIP_EXTRACTION_JS = """
+() => {
+    const data = {};
+    const text = (el) => (el.innerText || "").trim();
+    for (const el of document.querySelectorAll('[role="tooltip"]')) {
+        const value = text(el);
+        if (el.id && value) data[el.id] = value;
+    }
+    for (const el of document.querySelectorAll('[id*="cdk-describedby-message"]')) {
+        const value = text(el);
+        if (el.id && value) data[el.id] = value;
+    }
+    const broad = '[id*="tooltip"], [class*="tooltip"], [data-tooltip]';
+    for (const el of document.querySelectorAll(broad)) {
+        const key = el.id || el.getAttribute("data-tooltip");
+        const value = text(el);
+        if (key && value && !(key in data)) data[key] = value;
+    }
+    return data;
+}
+"""
+
+# Result row selectors, most specific first
+CONTAINER_SELECTORS = [
+    'tr[class*="itinerary"]',
+    'tr[class*="result"]',
+    'tr[class*="flight"]',
+    ".flight-result",
+    ".search-result",
+    '[data-testid*="flight"]',
+    'tr[role="row"]',
+    ".mat-row",
+    'tr[id*="result"]',
+]
+
+# Finds the result rows and reads each one with the tooltips its own and its
+# descendants' aria-describedby ids point to. The first container selector
+# with matches wins; without one, table rows mentioning any indicator are
+# used, at most limit of them. Every row is stamped with a data-ita-row key
+# on first sight; rows whose key is in seen are not read again. Only plain
+# data crosses back to Python.
+_ROW_RECORDS_JS = """
+([selectors, indicators, limit, seen]) => {
+    const text = (el) => (el.innerText || "").trim();
+    const described = (el) => {
+        const texts = [];
+        for (const id of (el.getAttribute("aria-describedby") || "").split(/\\s+/)) {
+            const tooltip = id && document.getElementById(id);
+            const value = tooltip ? text(tooltip) : "";
+            if (value) texts.push(value);
+        }
+        return texts;
+    };
+    const root = document.documentElement;
+    const key = (row) => {
+        if (!row.dataset.itaRow) {
+            const next = Number(root.dataset.itaRows || 0);
+            root.dataset.itaRows = String(next + 1);
+            row.dataset.itaRow = String(next);
+        }
+        return row.dataset.itaRow;
+    };
+    const read = (row) => {
+        const tooltips = described(row);
+        for (const child of row.querySelectorAll("[aria-describedby]")) {
+            tooltips.push(...described(child));
+        }
+        return { key: key(row), text: row.innerText || "", tooltips };
+    };
+
+    let rows = [];
+    let selector = null;
+    const missed = [];
+    for (const candidate of selectors) {
+        let found;
+        try {
+            found = document.querySelectorAll(candidate);
+        } catch (e) {
+            continue;
+        }
+        if (found.length) {
+            rows = Array.from(found);
+            selector = candidate;
+            break;
+        }
+        missed.push(candidate);
+    }
+    if (selector === null) {
+        for (const row of document.querySelectorAll("tr")) {
+            const value = (row.innerText || "").toLowerCase();
+            if (indicators.some((indicator) => value.includes(indicator))) {
+                rows.push(row);
+                if (rows.length >= limit) break;
+            }
+        }
+    }
+    const known = new Set(seen);
+    const unread = rows.filter((row) => !known.has(key(row)));
+    return { selector, missed, rows: unread.map(read) };
+}
+"""
+
+# Row text markers for the fallback scan when the search is unknown
+DEFAULT_ROW_INDICATORS = ("$", "am", "pm")
+
 
 class ITAMatrixParser:
     """
@@ -92,18 +212,27 @@ class ITAMatrixParser:
         require updates when major UI changes occur.
     """
 
-    def __init__(self):
+    def __init__(self, selector_registry: Optional[SelectorRegistry] = None):
         """
         Initialize the ITA Matrix parser with data processing utilities.
 
         Sets up the FlightDataParser utility for standardizing airline codes,
         flight numbers, and other structured data elements extracted from
         the complex ITA Matrix interface.
+
+        Args:
+            selector_registry: Registry that learns which result container
+                selector matches, so it is tried first. Default: None (fixed
+                order)
         """
         self.data_parser = FlightDataParser()
+        self.selector_registry = selector_registry
 
     async def parse_flight_results(
-        self, page: Page, max_results: int = 10
+        self,
+        page: Page,
+        max_results: int = 10,
+        row_indicators: Optional[list[str]] = None,
     ) -> list[Flight]:
         """
         Main entry point for parsing flight results from ITA Matrix.
@@ -125,6 +254,9 @@ class ITAMatrixParser:
                 Should be on a page that has completed a flight search
             max_results: Maximum number of flights to parse and return.
                 Limits processing time for large result sets. Default: 10
+            row_indicators: Lowercase text markers of result rows, used when
+                no known container selector matches (see row_indicators()).
+                Default: DEFAULT_ROW_INDICATORS
 
         Returns:
             List of Flight objects with comprehensive flight information including
@@ -152,57 +284,107 @@ class ITAMatrixParser:
             - Tooltip extraction requires page to be fully loaded
             - May return fewer flights than max_results if parsing fails
         """
-        flights = []
+        return [
+            flight
+            async for flight in self.iter_flight_results(
+                page, max_results, row_indicators
+            )
+        ]
 
-        try:
-            # Wait for the page to load completely
-            await self._wait_for_results(page)
+    async def iter_flight_results(
+        self,
+        page: Page,
+        max_results: int = 10,
+        row_indicators: Optional[list[str]] = None,
+        wait_timeout: float = 30000,
+    ) -> AsyncIterator[Flight]:
+        """
+        Parse flight results incrementally, yielding each flight once parsed.
 
-            # Extract all tooltip data first (contains detailed flight info)
-            tooltip_data = await self._extract_tooltip_data(page)
+        Parsing starts as soon as the first results are on the page. Containers
+        that render later are picked up in further rounds, each started once
+        the page has settled, until no new containers appear. Consumers can
+        therefore act on the first fares while the rest are still loading.
 
-            # Find the main flight result containers
-            flight_containers = await self._find_flight_containers(page)
+        Args:
+            page: Playwright Page object for the ITA Matrix results page
+            max_results: Maximum number of flights to yield. Default: 10
+            row_indicators: Lowercase text markers of result rows for the
+                fallback row scan. Default: DEFAULT_ROW_INDICATORS
+            wait_timeout: Maximum time to wait for the first results, in
+                milliseconds. Default: 30000 (30s)
 
-            logger.info(
-                f"Found {len(flight_containers)} flight containers and {len(tooltip_data)} tooltip entries"
-            )
+        Yields:
+            Flight objects in page order
 
-            for i, container in enumerate(flight_containers[:max_results]):
-                try:
-                    flight = await self._parse_single_flight(
-                        container, tooltip_data, page
-                    )
+        Note:
+            Like parse_flight_results(), errors are logged rather than raised;
+            iteration simply ends early.
+
+        Example:
+            >>> async for flight in parser.iter_flight_results(page, 20):
+            ...     print(f"${flight.price}")
+        """
+        yielded = 0
+        seen: set[str] = set()
+        idle_rounds = 0
+        settled = False
+        tooltip_data: Optional[dict[str, str]] = None
+
+        try:
+            # Wait for the first results to appear
+            await self._wait_for_results(page, wait_timeout)
+            readiness = PageReadiness.for_page(page)
+
+            while yielded < max_results:
+                # One round trip finds the rows not parsed yet and reads them
+                new_rows = await self._read_rows(page, row_indicators, seen)
+                seen.update(row["key"] for row in new_rows)
+                logger.info(f"Found {len(new_rows)} new flight rows")
+
+                # Rows without tooltips of their own fall back to all the
+                # page's tooltips; only then are they worth extracting
+                if any(not row["tooltips"] for row in new_rows):
+                    tooltip_data = await self._extract_tooltip_data(page)
+
+                for row in new_rows:
+                    if yielded >= max_results:
+                        break
+                    flight = self._parse_single_flight(row, tooltip_data or {})
                     if flight:
-                        flights.append(flight)
-                        logger.debug(f"Successfully parsed flight {i + 1}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse flight container {i}: {e}")
-                    continue
+                        yielded += 1
+                        logger.debug(f"Successfully parsed flight {yielded}")
+                        yield flight
+
+                # Stop once nothing new rendered on a settled page, or twice in a row
+                idle_rounds = 0 if new_rows else idle_rounds + 1
+                if (
+                    yielded >= max_results
+                    or (idle_rounds and settled)
+                    or idle_rounds > 1
+                ):
+                    break
 
-            # If we couldn't parse from containers, try parsing from tooltip data directly
-            if not flights and tooltip_data:
-                flights = await self._parse_from_tooltips(tooltip_data)
+                settled = await readiness.wait_until_ready(timeout_ms=3000)
 
-            return flights
+            # If we couldn't parse from containers, try parsing from tooltip data directly
+            if not yielded and tooltip_data is None:
+                tooltip_data = await self._extract_tooltip_data(page)
+            if not yielded and tooltip_data:
+                for flight in await self._parse_from_tooltips(tooltip_data):
+                    yield flight
 
         except Exception as e:
             logger.error(f"Failed to parse ITA Matrix results: {e}")
-            return []
 
-    async def _wait_for_results(self, page: Page, timeout: int = 30000):
+    async def _wait_for_results(self, page: Page, timeout: float = 30000):
         """
-        Wait for flight search results to fully load including dynamic tooltips.
+        Wait for the first flight search results to appear.
 
         ITA Matrix loads flight data asynchronously through Angular Material
-        components. This method ensures all tooltip elements containing detailed
-        flight information are present before attempting to parse data.
-
-        Strategy:
-        1. Wait for tooltip elements with role="tooltip" to appear
-        2. Allow additional time for dynamic content loading
-        3. Verify substantial tooltip content is available
-        4. Extend wait time if insufficient data detected
+        components. Tooltip elements carry the detailed flight information, so
+        their presence signals that parsing can begin. Results that render
+        later are picked up by the following rounds of iter_flight_results().
 
         Args:
             page: Playwright Page object on ITA Matrix results
@@ -210,22 +392,13 @@ class ITAMatrixParser:
 
         Note:
             - Tooltips contain the most detailed flight information
-            - Dynamic loading can take several seconds after initial page load
             - Method does not raise exceptions, logs warnings on failures
-            - Essential for reliable data extraction from ITA Matrix
         """
         try:
             # Wait for tooltip elements to appear (they contain the flight data)
-            await page.wait_for_selector('[role="tooltip"]', timeout=timeout)
-
-            # Additional wait for dynamic content
-            await page.wait_for_timeout(3000)
-
-            # Check if we have substantial content
-            tooltips = await page.query_selector_all('[role="tooltip"]')
-            if len(tooltips) < 5:
-                logger.warning("Few tooltips found, waiting longer...")
-                await page.wait_for_timeout(5000)
+            await page.wait_for_selector(
+                '[role="tooltip"]', timeout=clamp_timeout(timeout)
+            )
 
         except Exception as e:
             logger.warning(f"Failed to wait for results: {e}")
@@ -238,6 +411,9 @@ class ITAMatrixParser:
         tooltips that are dynamically generated. This method uses multiple
         extraction strategies to capture all available tooltip content.
 
+        All strategies run in one in-page script, so the whole extraction costs
+        a single driver round trip however many tooltips the page holds.
+
         Extraction Strategies:
         1. Standard tooltips with role="tooltip" attribute
         2. CDK (Component Dev Kit) tooltips with describedby patterns
@@ -263,148 +439,132 @@ class ITAMatrixParser:
             - Tooltip IDs are used to cross-reference with flight containers
             - Content includes raw text that requires further parsing
         """
-        tooltip_data = {}
+        tooltip_data: dict[str, str] = {}
 
         try:
-            # Try multiple strategies to get tooltip data
-
-            # Strategy 1: Get visible tooltips
-            tooltips = await page.query_selector_all('[role="tooltip"]')
-            logger.debug(f"Found {len(tooltips)} tooltips with role='tooltip'")
-
-            for tooltip in tooltips:
-                try:
-                    tooltip_id = await tooltip.get_attribute("id")
-                    tooltip_text = await tooltip.inner_text()
+            # One round trip for all strategies instead of two per element
+            tooltip_data = await page.evaluate(_TOOLTIP_EXTRACTION_JS)
+        except Exception as e:
+            logger.warning(f"Failed to extract tooltip data: {e}")
 
-                    if tooltip_id and tooltip_text:
-                        tooltip_data[tooltip_id] = tooltip_text.strip()
-                        logger.debug(
-                            f"Extracted tooltip {tooltip_id}: {tooltip_text[:50]}..."
-                        )
+        logger.info(f"Extracted {len(tooltip_data)} tooltip entries total")
+        return tooltip_data
 
-                except Exception as e:
-                    logger.debug(f"Failed to extract tooltip data: {e}")
-                    continue
+    async def _read_rows(
+        self,
+        page: Page,
+        row_indicators: Optional[list[str]] = None,
+        seen: Optional[set[str]] = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """
+        Find the result rows and read them with their tooltips in one round trip.
 
-            # Strategy 2: Look for CDK describedby tooltips (Angular Material pattern)
-            cdk_tooltips = await page.query_selector_all(
-                '[id*="cdk-describedby-message"]'
-            )
-            logger.debug(f"Found {len(cdk_tooltips)} CDK tooltips")
+        Finding rows used to return element handles that were then passed back
+        to the page to be read, one driver call each way, and the handles were
+        never released. The lookup and the row/tooltip join now run in a single
+        in-page script that returns plain records.
 
-            for tooltip in cdk_tooltips:
-                try:
-                    tooltip_id = await tooltip.get_attribute("id")
-                    tooltip_text = await tooltip.inner_text()
-
-                    if tooltip_id and tooltip_text:
-                        tooltip_data[tooltip_id] = tooltip_text.strip()
-                        logger.debug(
-                            f"Extracted CDK tooltip {tooltip_id}: {tooltip_text[:50]}..."
-                        )
+        Args:
+            page: Playwright Page object on ITA Matrix results
+            row_indicators: Lowercase text markers of result rows, used when
+                no container selector matches. Default: DEFAULT_ROW_INDICATORS
+            seen: Keys of rows already read, which are skipped. Default: None
+            limit: Maximum number of rows the indicator scan returns.
+                Default: 20
 
-                except Exception as e:
-                    logger.debug(f"Failed to extract CDK tooltip data: {e}")
-                    continue
+        Returns:
+            One record per unseen row in page order, with the ``key`` stamped
+            on the row, the row's ``text`` and the ``tooltips`` texts referenced
+            by the row and its descendants. Empty if the rows could not be read
+        """
+        selectors = CONTAINER_SELECTORS
+        registry = self.selector_registry
+        fingerprint = await registry.fingerprint(page) if registry else None
+        if registry:
+            selectors = registry.order(fingerprint, "containers", selectors)
 
-            # Strategy 3: Look for any hidden tooltip content
-            all_tooltips = await page.query_selector_all(
-                '[id*="tooltip"], [class*="tooltip"], [data-tooltip]'
+        indicators = [i.lower() for i in row_indicators or DEFAULT_ROW_INDICATORS]
+        try:
+            found = await page.evaluate(
+                _ROW_RECORDS_JS, [selectors, indicators, limit, sorted(seen or ())]
             )
-            logger.debug(f"Found {len(all_tooltips)} additional tooltip elements")
-
-            for tooltip in all_tooltips:
-                try:
-                    tooltip_id = await tooltip.get_attribute(
-                        "id"
-                    ) or await tooltip.get_attribute("data-tooltip")
-                    tooltip_text = await tooltip.inner_text()
-
-                    if tooltip_id and tooltip_text and tooltip_id not in tooltip_data:
-                        tooltip_data[tooltip_id] = tooltip_text.strip()
-
-                except Exception as e:
-                    logger.debug(f"Failed to extract additional tooltip data: {e}")
-                    continue
-
         except Exception as e:
-            logger.warning(f"Failed to extract tooltip data: {e}")
-
-        logger.info(f"Extracted {len(tooltip_data)} tooltip entries total")
-        return tooltip_data
-
-    async def _find_flight_containers(self, page: Page) -> list[ElementHandle]:
-        """Find the main flight result containers."""
-        selectors = [
-            'tr[class*="itinerary"]',
-            'tr[class*="result"]',
-            'tr[class*="flight"]',
-            ".flight-result",
-            ".search-result",
-            '[data-testid*="flight"]',
-            'tr[role="row"]',
-            ".mat-row",
-            'tr[id*="result"]',
-        ]
+            logger.warning(f"Failed to read flight containers: {e}")
+            return []
 
-        for selector in selectors:
-            try:
-                containers = await page.query_selector_all(selector)
-                if containers:
-                    logger.debug(
-                        f"Found {len(containers)} containers with selector: {selector}"
-                    )
-                    return containers
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
+        if registry:
+            for selector in found["missed"]:
+                registry.record(fingerprint, "containers", selector, hit=False)
+            if found["selector"]:
+                registry.record(fingerprint, "containers", found["selector"], hit=True)
 
-        # Fallback: look for any table rows that might contain flight data
-        try:
-            all_rows = await page.query_selector_all("tr")
-            # Filter rows that likely contain flight data
-            flight_rows = []
-            for row in all_rows:
-                try:
-                    row_text = await row.inner_text()
-                    # Look for indicators of flight data
-                    if any(
-                        indicator in row_text.lower()
-                        for indicator in ["$", "am", "pm", "jfk", "lhr"]
-                    ):
-                        flight_rows.append(row)
-                except:
-                    continue
+        if found["selector"]:
+            logger.debug(
+                f"Found {len(found['rows'])} containers with selector: "
+                f"{found['selector']}"
+            )
+        elif found["rows"]:
+            logger.debug(f"Found {len(found['rows'])} rows with flight indicators")
+        return found["rows"]
+
+    @staticmethod
+    def row_indicators(
+        search_params: Union[SearchParams, MultiCitySearchParams, None] = None,
+        currency_symbol: str = "$",
+    ) -> list[str]:
+        """
+        Text markers identifying result rows of a search.
 
-            if flight_rows:
-                logger.debug(f"Found {len(flight_rows)} rows with flight indicators")
-                return flight_rows[:20]  # Limit to reasonable number
+        Used by the fallback row scan when none of the known container
+        selectors match: a result row mentions the airports searched or a
+        price.
 
-        except Exception as e:
-            logger.debug(f"Fallback row search failed: {e}")
+        Args:
+            search_params: Current search; None for the generic defaults
+            currency_symbol: Symbol prices are shown with. Default: "$"
 
-        return []
+        Returns:
+            Lowercase indicators
 
-    async def _parse_single_flight(
-        self, container: ElementHandle, tooltip_data: dict[str, str], page: Page
+        Example:
+            >>> ITAMatrixParser.row_indicators(SearchParams(origin="JFK", ...))
+            ['jfk', 'lax', '$']
+        """
+        if search_params is None:
+            return list(DEFAULT_ROW_INDICATORS)
+
+        if isinstance(search_params, MultiCitySearchParams):
+            airports = [
+                code
+                for segment in search_params.segments
+                for code in (segment.origin, segment.destination)
+            ]
+        else:
+            airports = [search_params.origin, search_params.destination]
+
+        indicators = []
+        for code in airports:
+            if code.lower() not in indicators:
+                indicators.append(code.lower())
+        if currency_symbol:
+            indicators.append(currency_symbol.lower())
+        return indicators
+
+    def _parse_single_flight(
+        self, row: dict, tooltip_data: dict[str, str]
     ) -> Optional[Flight]:
-        """Parse a single flight from container and tooltip data."""
+        """Parse a single flight from a row record and tooltip data."""
         try:
             # Try to extract basic info from the container
-            container_text = await container.inner_text()
+            container_text = row["text"]
             logger.debug(f"Container text preview: {container_text[:100]}...")
 
             # Look for price in container
             price = self._extract_price_from_text(container_text)
 
-            # Look for associated tooltip references
-            related_tooltips = await self._find_related_tooltips(
-                container, tooltip_data
-            )
-
-            # Parse flight details from tooltips
-            flight_info = self._parse_flight_info_from_tooltips(related_tooltips)
+            # Parse flight details from the row's tooltips
+            flight_info = self._parse_flight_info_from_tooltips(row["tooltips"])
 
             # Also parse info directly from container text
             container_airlines = self._extract_airlines_from_text(container_text)
@@ -427,36 +587,6 @@ class ITAMatrixParser:
             logger.warning(f"Failed to parse single flight: {e}")
             return None
 
-    async def _find_related_tooltips(
-        self, container: ElementHandle, tooltip_data: dict[str, str]
-    ) -> list[str]:
-        """Find tooltips related to this flight container."""
-        related = []
-
-        try:
-            # Look for aria-describedby attributes
-            described_by = await container.get_attribute("aria-describedby")
-            if described_by:
-                tooltip_ids = described_by.split()
-                for tooltip_id in tooltip_ids:
-                    if tooltip_id in tooltip_data:
-                        related.append(tooltip_data[tooltip_id])
-
-            # Look for child elements with tooltip references
-            elements = await container.query_selector_all("[aria-describedby]")
-            for element in elements:
-                described_by = await element.get_attribute("aria-describedby")
-                if described_by:
-                    tooltip_ids = described_by.split()
-                    for tooltip_id in tooltip_ids:
-                        if tooltip_id in tooltip_data:
-                            related.append(tooltip_data[tooltip_id])
-
-        except Exception as e:
-            logger.debug(f"Failed to find related tooltips: {e}")
-
-        return related
-
     def _parse_flight_info_from_tooltips(self, tooltips: list[str]) -> dict:
         """Parse detailed flight information from tooltip texts."""
         flight_info = {
@@ -855,3 +985,197 @@ class ITAMatrixParser:
             logger.warning(f"Failed to parse from tooltips: {e}")
 
         return flights
+
+
+class ITAMatrixResponseParser:
+    """
+    Maps the JSON returned by ITA Matrix's search API to Flight objects.
+
+    The Matrix web app fetches its results from a JSON search endpoint and
+    renders the results table from that response. Reading the response
+    directly (see ResponseCapture) gives exact prices, airports, carriers and
+    timezone-aware times without walking the DOM, and without the defaults the
+    tooltip parser has to fill in when text does not match its patterns.
+
+    Response layout (only the fields used here)::
+
+        {"solutionList": {"solutions": [{
+            "displayTotal": "USD315.20",
+            "itinerary": {
+                "carriers": [{"code": "AA", "shortName": "American"}],
+                "slices": [{
+                    "origin": {"code": "JFK"}, "destination": {"code": "LAX"},
+                    "departure": "2024-08-15T08:00-04:00",
+                    "arrival": "2024-08-15T11:20-07:00",
+                    "duration": 380, "flights": ["AA1"],
+                    "cabins": ["COACH"], "stops": [],
+                    "segments": [...]  # optional per-flight legs
+                }]
+            }
+        }]}}
+
+    A slice with ``segments`` becomes one FlightSegment per leg; a summary slice
+    without them becomes a single FlightSegment covering the whole slice.
+
+    Usage:
+        >>> parser = ITAMatrixResponseParser()
+        >>> flights = parser.parse_search_response(payload, max_results=10)
+    """
+
+    # Matrix cabin names, from lowest to highest
+    CABINS = {
+        "COACH": CabinClass.ECONOMY,
+        "PREMIUM-COACH": CabinClass.PREMIUM_ECONOMY,
+        "BUSINESS": CabinClass.BUSINESS,
+        "FIRST": CabinClass.FIRST,
+    }
+
+    FLIGHT_NUMBER_PATTERN = re.compile(r"^([A-Z0-9]{2})\s*(\d{1,4})$")
+
+    def __init__(self):
+        """Initialize the parser with the shared data normalization helpers."""
+        self.data_parser = FlightDataParser()
+
+    @staticmethod
+    def is_search_response(payload) -> bool:
+        """Whether a JSON payload is a search result list."""
+        return isinstance(payload, dict) and "solutionList" in payload
+
+    def parse_search_response(
+        self,
+        payload: dict,
+        max_results: int = 10,
+        cabin_class: CabinClass = CabinClass.ECONOMY,
+    ) -> list[Flight]:
+        """
+        Convert a search API response into flights.
+
+        Solutions that cannot be mapped (missing fields, invalid codes) are
+        skipped and logged rather than replaced with made-up values.
+
+        Args:
+            payload: Decoded JSON body of the search response
+            max_results: Maximum number of flights to return. Default: 10
+            cabin_class: Cabin used when a solution does not name one
+
+        Returns:
+            Flights in the order the API ranked them (cheapest first)
+        """
+        solutions = (payload.get("solutionList") or {}).get("solutions") or []
+        flights = []
+        for index, solution in enumerate(solutions):
+            if len(flights) >= max_results:
+                break
+            try:
+                flight = self._parse_solution(solution, cabin_class)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping search API solution {index}: {e}")
+                continue
+            if flight:
+                flights.append(flight)
+
+        logger.info(f"Mapped {len(flights)} of {len(solutions)} search API solutions")
+        return flights
+
+    def _parse_solution(
+        self, solution: dict, cabin_class: CabinClass
+    ) -> Optional[Flight]:
+        """Map one priced itinerary to a Flight."""
+        price = self.data_parser.parse_price(
+            solution.get("displayTotal")
+            or (solution.get("ext") or {}).get("totalPrice")
+            or ""
+        )
+        if price is None:
+            return None
+
+        itinerary = solution["itinerary"]
+        carriers = {
+            carrier["code"]: carrier.get("shortName") or carrier.get("name")
+            for carrier in itinerary.get("carriers", [])
+        }
+
+        segments: list[FlightSegment] = []
+        duration = 0
+        stops = 0
+        cabins: list[str] = []
+        for slice_ in itinerary["slices"]:
+            slice_segments = self._parse_slice(slice_, carriers)
+            segments.extend(slice_segments)
+            duration += int(slice_["duration"])
+            stops += max(len(slice_.get("stops") or []), len(slice_segments) - 1)
+            cabins.extend(slice_.get("cabins") or [])
+
+        if not segments:
+            return None
+
+        known = [self.CABINS[cabin] for cabin in cabins if cabin in self.CABINS]
+        if known:
+            # Mixed-cabin itineraries are sold as their highest cabin
+            ranking = list(self.CABINS.values())
+            cabin_class = max(known, key=ranking.index)
+
+        return Flight(
+            segments=segments,
+            price=price,
+            cabin_class=cabin_class,
+            total_duration_minutes=duration,
+            stops=stops,
+        )
+
+    def _parse_slice(
+        self, slice_: dict, carriers: dict[str, Optional[str]]
+    ) -> list[FlightSegment]:
+        """Map one direction of travel to its flight segments."""
+        legs = slice_.get("segments")
+        if legs:
+            return [self._parse_leg(leg, carriers) for leg in legs]
+
+        # Summary slice: one segment from the first to the last airport
+        flights = slice_.get("flights") or []
+        if not flights:
+            return []
+        airline_code, _number = self._split_flight_number(flights[0])
+        return [
+            FlightSegment(
+                airline=Airline(code=airline_code, name=carriers.get(airline_code)),
+                flight_number="/".join(flights),
+                departure_airport=Airport(code=slice_["origin"]["code"]),
+                arrival_airport=Airport(code=slice_["destination"]["code"]),
+                departure_time=datetime.fromisoformat(slice_["departure"]),
+                arrival_time=datetime.fromisoformat(slice_["arrival"]),
+                duration_minutes=int(slice_["duration"]),
+                stops=len(slice_.get("stops") or []),
+            )
+        ]
+
+    def _parse_leg(
+        self, leg: dict, carriers: dict[str, Optional[str]]
+    ) -> FlightSegment:
+        """Map one flight of a detailed slice to a FlightSegment."""
+        flight = leg["flight"]
+        airline_code = flight["carrier"]
+        departure = datetime.fromisoformat(leg["departure"])
+        arrival = datetime.fromisoformat(leg["arrival"])
+        duration = leg.get("duration")
+        if duration is None:
+            duration = (arrival - departure).total_seconds() // 60
+
+        return FlightSegment(
+            airline=Airline(code=airline_code, name=carriers.get(airline_code)),
+            flight_number=f"{airline_code}{flight['number']}",
+            departure_airport=Airport(code=leg["origin"]["code"]),
+            arrival_airport=Airport(code=leg["destination"]["code"]),
+            departure_time=departure,
+            arrival_time=arrival,
+            duration_minutes=int(duration),
+            aircraft_type=(leg.get("aircraft") or {}).get("shortName"),
+            stops=len(leg.get("stops") or []),
+        )
+
+    def _split_flight_number(self, flight: str) -> tuple[str, str]:
+        """Split "AA123" into carrier code and number."""
+        match = self.FLIGHT_NUMBER_PATTERN.match(flight.strip())
+        if not match:
+            raise ValueError(f"Unrecognized flight number {flight!r}")
+        return match.group(1), match.group(2)
@@ -0,0 +1,534 @@
+"""
+Browser pool for running many flight searches concurrently on one Chromium.
+
+A single ITAScrapper owns a whole Chromium process with exactly one page, so
+running searches in parallel used to mean launching one browser per search.
+ITAScrapperPool launches Chromium once and hands out ITAScrapper workers, each
+bound to its own isolated BrowserContext (separate cookies, storage and cache)
+with the usual stealth configuration.
+
+Searches lease a worker, run on its page and return it to the pool, so at most
+``size`` searches run at the same time while the browser process, its GPU and
+network services are shared between all of them.
+
+With prewarming, every worker loads the search form in the background as soon
+as the pool starts and again whenever a search hands it back, so a burst of
+searches starts on ready forms instead of waiting for the site to bootstrap.
+Workers given a RecyclePolicy (``recycle=``) replace their context in the same
+background step, so recycling never delays a search.
+
+The pool also supervises the browser. When Chromium disconnects or a worker's
+page crashes, the browser is relaunched (or reconnected to) once, the affected
+contexts are rebuilt and the searches that were running are queued again, so
+unattended bulk runs survive crashes. browser_restarts, restarts and requeued
+count what happened.
+
+Bulk workloads should use search_many(), which schedules any number of
+searches across the workers and reports a SearchOutcome per input instead of
+failing the whole batch on the first error.
+
+Usage:
+    >>> async with ITAScrapperPool(size=4) as pool:
+    ...     results = await asyncio.gather(
+    ...         pool.search_flights("JFK", "LAX", date(2024, 8, 15)),
+    ...         pool.search_flights("SFO", "SEA", date(2024, 8, 16)),
+    ...     )
+    ...     outcomes = await pool.search_many(many_search_params)
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Optional, Union
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from .config import Config
+from .exceptions import ITAScrapperError
+from .models import (
+    Flight,
+    FlightResult,
+    MultiCitySearchParams,
+    SearchOutcome,
+    SearchParams,
+)
+from .scrapper import ITAScrapper
+
+logger = logging.getLogger(__name__)
+
+
+class ITAScrapperPool:
+    """
+    Pool of ITAScrapper workers sharing a single Chromium browser.
+
+    Each worker is an ITAScrapper attached to its own BrowserContext, so
+    searches are isolated from each other while paying for only one browser
+    process. Workers are leased for the duration of a search and returned to
+    the pool afterwards.
+
+    Attributes:
+        size: Number of workers (and therefore concurrent searches)
+
+    Example:
+        >>> async with ITAScrapperPool(size=3, headless=True) as pool:
+        ...     async with pool.lease() as scrapper:
+        ...         result = await scrapper.search_flights(
+        ...             "JFK", "LAX", date(2024, 8, 15)
+        ...         )
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        headless: bool = True,
+        timeout: int = 30000,
+        viewport_size: tuple = (1920, 1080),
+        user_agent: Optional[str] = None,
+        use_matrix: bool = True,
+        warm_session: bool = True,
+        browser_endpoint: Optional[str] = None,
+        prewarm: bool = True,
+        max_requeues: int = 1,
+        **scrapper_options: Any,
+    ):
+        """
+        Initialize the pool configuration.
+
+        Args:
+            size: Number of isolated contexts to create. Default: 4
+            headless: Whether to run the shared browser in headless mode
+            timeout: Default timeout in milliseconds for every worker page
+            viewport_size: Viewport of every worker context as (width, height)
+            user_agent: Custom user agent for every worker context
+            use_matrix: Whether workers search ITA Matrix (True) or Google Flights
+            warm_session: Whether workers keep their page parked on the search
+                form between searches. Default: True
+            browser_endpoint: Create the worker contexts in an already running
+                browser instead of launching one (see ITAScrapper).
+                Default: Config.BROWSER_ENDPOINT, or launch a browser if unset
+            prewarm: Load the search form on every idle worker in the
+                background, at start and after each search. Requires
+                warm_session. Default: True
+            max_requeues: How many times a search interrupted by a browser or
+                page crash is queued again on a rebuilt worker. Default: 1
+            **scrapper_options: Further ITAScrapper keyword arguments applied to
+                every worker, for example readiness_timeout or recycle
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if size > 1 and scrapper_options.get("record_har"):
+            raise ValueError(
+                "record_har needs a pool of size 1; workers would write the same file"
+            )
+
+        self.size = size
+        self.headless = headless
+        self.timeout = timeout
+        self.viewport_size = viewport_size
+        self.user_agent = user_agent
+        self.use_matrix = use_matrix
+        self.warm_session = warm_session
+        self.browser_endpoint = browser_endpoint or Config.BROWSER_ENDPOINT
+        self.prewarm = prewarm and warm_session
+        self.max_requeues = max_requeues
+        self.scrapper_options = scrapper_options
+
+        # Browsers relaunched and searches queued again after crashes
+        self.browser_restarts = 0
+        self.requeued = 0
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._workers: list[ITAScrapper] = []
+        self._idle: Optional[asyncio.Queue] = None
+        # Background prewarming of idle workers, awaited when they are leased
+        self._warming: dict[ITAScrapper, asyncio.Task] = {}
+        # Held while the browser is replaced, so it is relaunched only once
+        self._relaunch_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        """Start the pool when entering an async context."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the pool when leaving an async context."""
+        await self.close()
+
+    @property
+    def available(self) -> int:
+        """Number of workers currently idle."""
+        return self._idle.qsize() if self._idle else 0
+
+    @property
+    def restarts(self) -> int:
+        """Worker contexts rebuilt after crashes, across all workers."""
+        return sum(worker.restarts for worker in self._workers)
+
+    async def start(self):
+        """
+        Launch the shared browser and create all worker contexts.
+
+        Raises:
+            ITAScrapperError: If the browser or any context fails to start
+        """
+        try:
+            self._playwright = await async_playwright().start()
+            await self._open_browser()
+
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                worker = self._new_worker()
+                await worker.attach(self._browser)
+                self._workers.append(worker)
+                self._idle.put_nowait(worker)
+                self._schedule_warm(worker)
+
+            logger.info(f"Browser pool started with {self.size} contexts")
+
+        except Exception as e:
+            logger.error(f"Failed to start browser pool: {e}")
+            await self.close()
+            raise ITAScrapperError(f"Failed to start browser pool: {e}")
+
+    async def _open_browser(self):
+        """Connect to the configured endpoint or launch the shared browser."""
+        if self.browser_endpoint:
+            self._browser = await ITAScrapper.connect_browser(
+                self._playwright, self.browser_endpoint, self.timeout
+            )
+        else:
+            self._browser = await ITAScrapper.launch_browser(
+                self._playwright, self.headless
+            )
+        self._browser.on("disconnected", self._on_browser_disconnected)
+
+    def _on_browser_disconnected(self, browser: Browser):
+        """Log the loss of the shared browser; the next lease replaces it."""
+        if browser is self._browser:
+            logger.error("Shared browser disconnected, relaunching on next lease")
+
+    async def _ensure_browser(self):
+        """Relaunch or reconnect to the shared browser if it is gone."""
+        async with self._relaunch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            if self._playwright is None:
+                raise ITAScrapperError("Pool not started. Call start() first.")
+
+            logger.warning("Replacing the disconnected shared browser")
+            await self._open_browser()
+            self.browser_restarts += 1
+
+    async def _heal(self, worker: ITAScrapper):
+        """Rebuild a crashed worker's context, replacing the browser if needed."""
+        await self._ensure_browser()
+        await worker.restart(self._browser)
+
+    async def close(self):
+        """
+        Close every worker context, the shared browser and Playwright.
+
+        A browser the pool connected to is only disconnected from, not shut
+        down. Safe to call multiple times.
+        """
+        for task in self._warming.values():
+            task.cancel()
+        await asyncio.gather(*self._warming.values(), return_exceptions=True)
+        self._warming = {}
+
+        for worker in self._workers:
+            await worker.close()
+        self._workers = []
+        self._idle = None
+
+        try:
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+
+            logger.info("Browser pool closed successfully")
+
+        except Exception as e:
+            logger.error(f"Error closing browser pool: {e}")
+
+        self._browser = None
+        self._playwright = None
+
+    async def warm_up(self):
+        """
+        Wait until every worker has finished prewarming.
+
+        Optional: leases already wait for their own worker. Call this after
+        start() to take the bootstrap cost before traffic arrives.
+        """
+        await asyncio.gather(*self._warming.values(), return_exceptions=True)
+
+    def _schedule_warm(self, worker: ITAScrapper):
+        """Start maintaining an idle worker in the background."""
+        if self.prewarm or worker.recycle_policy or not worker.is_healthy:
+            self._warming[worker] = asyncio.create_task(self._maintain(worker))
+
+    async def _maintain(self, worker: ITAScrapper):
+        """Rebuild a crashed worker or recycle its context if due, then prewarm it."""
+        if not worker.is_healthy:
+            try:
+                await self._heal(worker)
+            except Exception as e:
+                # Tried again when the worker is leased
+                logger.warning(f"Failed to restart crashed pool context: {e}")
+                return
+
+        try:
+            reason = await worker.recycle_reason()
+            if reason:
+                logger.info(f"Recycling pool context after {reason}")
+                await worker.recycle()
+        except Exception as e:
+            logger.warning(f"Failed to recycle pool context: {e}")
+
+        if self.prewarm:
+            await worker.prewarm()
+
+    def _new_worker(self) -> ITAScrapper:
+        """Create an unattached worker with the pool's configuration."""
+        return ITAScrapper(
+            headless=self.headless,
+            timeout=self.timeout,
+            viewport_size=self.viewport_size,
+            user_agent=self.user_agent,
+            use_matrix=self.use_matrix,
+            warm_session=self.warm_session,
+            **self.scrapper_options,
+        )
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[ITAScrapper]:
+        """
+        Borrow a worker for the duration of an ``async with`` block.
+
+        Waits until a worker is idle. The worker is returned to the pool when
+        the block exits, whether or not it raised.
+
+        Yields:
+            An ITAScrapper attached to its own context in the shared browser
+
+        Raises:
+            ITAScrapperError: If the pool has not been started
+        """
+        if self._idle is None:
+            raise ITAScrapperError("Pool not started. Call start() first.")
+
+        worker = await self._idle.get()
+        try:
+            warming = self._warming.pop(worker, None)
+            if warming is not None:
+                # Usually finished long ago; otherwise it is the navigation
+                # the search would have had to do anyway
+                await asyncio.gather(warming, return_exceptions=True)
+            if not worker.is_healthy:
+                await self._heal(worker)
+            yield worker
+        finally:
+            if self._idle is not None:
+                self._idle.put_nowait(worker)
+                self._schedule_warm(worker)
+
+    async def search(
+        self,
+        search_params: Union[SearchParams, MultiCitySearchParams],
+        max_results: int = 20,
+        deadline: Optional[float] = None,
+    ) -> FlightResult:
+        """
+        Run ITAScrapper.search on a leased worker.
+
+        Args:
+            search_params: Validated search parameters
+            max_results: Maximum number of results to return
+            deadline: Time budget of the search in seconds, not counting the
+                wait for an idle worker
+
+        Returns:
+            FlightResult containing found flights
+        """
+        return await self._supervised(
+            lambda scrapper: scrapper.search(search_params, max_results, deadline)
+        )
+
+    async def search_flights(self, *args, **kwargs) -> FlightResult:
+        """
+        Run ITAScrapper.search_flights on a leased worker.
+
+        Accepts exactly the same arguments as ITAScrapper.search_flights.
+        """
+        return await self._supervised(
+            lambda scrapper: scrapper.search_flights(*args, **kwargs)
+        )
+
+    async def search_flights_stream(self, *args, **kwargs) -> AsyncIterator[Flight]:
+        """
+        Run ITAScrapper.search_flights_stream on a leased worker.
+
+        The worker stays leased until the iteration finishes or is abandoned.
+        Accepts exactly the same arguments as ITAScrapper.search_flights_stream.
+        """
+        async with self.lease() as scrapper:
+            async for flight in scrapper.search_flights_stream(*args, **kwargs):
+                yield flight
+
+    async def search_multi_city(
+        self,
+        search_params: MultiCitySearchParams,
+        max_results: int = 20,
+        deadline: Optional[float] = None,
+    ) -> FlightResult:
+        """
+        Run ITAScrapper.search_multi_city on a leased worker.
+
+        Args:
+            search_params: Multi-city search parameters
+            max_results: Maximum number of results to return
+            deadline: Time budget of the search in seconds, not counting the
+                wait for an idle worker
+
+        Returns:
+            FlightResult containing found flights
+        """
+        return await self._supervised(
+            lambda scrapper: scrapper.search_multi_city(
+                search_params, max_results, deadline
+            )
+        )
+
+    async def _supervised(
+        self, search: Callable[[ITAScrapper], Awaitable[FlightResult]]
+    ) -> FlightResult:
+        """
+        Run a search on a leased worker, queueing it again after a crash.
+
+        A search that fails because its worker's page crashed or the browser
+        disconnected is run again on the next idle worker, which lease() rebuilds
+        first if it was hit too. Ordinary search errors propagate unchanged.
+        """
+        requeues = 0
+        while True:
+            async with self.lease() as scrapper:
+                try:
+                    return await search(scrapper)
+                except Exception as e:
+                    if scrapper.is_healthy or requeues >= self.max_requeues:
+                        raise
+                    logger.warning(f"Search lost to a browser crash, requeueing: {e}")
+            requeues += 1
+            self.requeued += 1
+
+    async def search_many(
+        self,
+        params: Iterable[Union[SearchParams, MultiCitySearchParams]],
+        concurrency: Optional[int] = None,
+        max_results: int = 20,
+    ) -> list[SearchOutcome]:
+        """
+        Run a batch of searches and return their outcomes in input order.
+
+        A failing search does not affect the others; its outcome carries the
+        exception instead of a result.
+
+        Args:
+            params: Search parameters, one per search. Consumed lazily, so a
+                generator over a large workload is fine
+            concurrency: Maximum number of searches running at once. Capped by
+                (and defaulting to) the pool size
+            max_results: Maximum number of results per search
+
+        Returns:
+            One SearchOutcome per input, in the same order as ``params``
+
+        Example:
+            >>> outcomes = await pool.search_many(
+            ...     SearchParams(origin="JFK", destination=dest,
+            ...                  departure_date=day, trip_type=TripType.ONE_WAY)
+            ...     for dest in ("LAX", "SFO", "SEA") for day in days
+            ... )
+            >>> failed = [o for o in outcomes if not o.ok]
+        """
+        outcomes = [
+            outcome
+            async for outcome in self.search_many_as_completed(
+                params, concurrency, max_results
+            )
+        ]
+        return sorted(outcomes, key=lambda outcome: outcome.index)
+
+    async def search_many_as_completed(
+        self,
+        params: Iterable[Union[SearchParams, MultiCitySearchParams]],
+        concurrency: Optional[int] = None,
+        max_results: int = 20,
+    ) -> AsyncIterator[SearchOutcome]:
+        """
+        Run a batch of searches and yield outcomes as they complete.
+
+        Same scheduling as search_many(), but results are available as soon as
+        each search finishes. Use SearchOutcome.index to map an outcome back to
+        its input. Leaving the iteration early cancels the remaining searches.
+
+        Args:
+            params: Search parameters, one per search
+            concurrency: Maximum number of searches running at once. Capped by
+                (and defaulting to) the pool size
+            max_results: Maximum number of results per search
+
+        Yields:
+            SearchOutcome for each input, in completion order
+        """
+        limit = max(1, min(concurrency or self.size, self.size))
+        items = enumerate(params)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def run_searches():
+            try:
+                for index, search_params in items:
+                    outcome = await self._search_outcome(
+                        index, search_params, max_results
+                    )
+                    await finished.put(outcome)
+            finally:
+                # Tell the consumer this runner is done
+                finished.put_nowait(None)
+
+        runners = [asyncio.create_task(run_searches()) for _ in range(limit)]
+        try:
+            remaining = len(runners)
+            while remaining:
+                outcome = await finished.get()
+                if outcome is None:
+                    remaining -= 1
+                else:
+                    yield outcome
+
+            # Surface errors from the input iterable itself
+            for runner in runners:
+                if runner.exception():
+                    raise runner.exception()
+        finally:
+            for runner in runners:
+                runner.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
+
+    async def _search_outcome(
+        self,
+        index: int,
+        search_params: Union[SearchParams, MultiCitySearchParams],
+        max_results: int,
+    ) -> SearchOutcome:
+        """Run one batch search on a leased worker, capturing any failure."""
+        try:
+            result = await self.search(search_params, max_results)
+            return SearchOutcome(index=index, params=search_params, result=result)
+        except Exception as e:
+            logger.warning(f"Batch search {index} failed: {e}")
+            return SearchOutcome(index=index, params=search_params, error=e)
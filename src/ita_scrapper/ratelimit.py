@@ -0,0 +1,262 @@
+"""
+Request rate limiting shared across tasks and processes.
+
+Config.REQUEST_DELAY (``ITA_REQUEST_DELAY``) sets the minimum average interval
+between requests to a host. Every navigation and search submission of an
+ITAScrapper passes through a RateLimiter, which spaces them out with a token
+bucket per host: up to ``burst`` requests may go out back to back, after
+which requests are released at one per interval.
+
+Buckets live in memory by default, which covers every task of one event loop,
+for example all workers of an ITAScrapperPool sharing the default limiter.
+With ``lock_dir`` set, bucket state is kept in one file per host guarded by an
+exclusive file lock, so separate processes (SearchExecutor workers, or
+independent jobs on the same machine) share a single budget.
+
+Waiting is reservation-based: acquire() takes a slot immediately and sleeps
+until the slot is due, so concurrent callers are served in arrival order
+without polling.
+
+Usage:
+    >>> limiter = RateLimiter(min_interval=0.5, host_intervals={"www.google.com": 2.0})
+    >>> await limiter.acquire("https://matrix.itasoftware.com/search")
+    >>> print(f"{limiter.throughput():.2f} requests/s")
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import time
+from collections import deque
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlsplit
+
+from .config import Config
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a fixed rate.
+
+    The token count may go negative: each reservation takes a token right
+    away and the caller waits until the bucket has refilled past it.
+
+    Attributes:
+        rate: Tokens added per second
+        burst: Maximum number of tokens the bucket holds
+        tokens: Tokens currently available
+        updated: Time (seconds since the epoch) tokens were last refilled
+    """
+
+    def __init__(self, rate: float, burst: int = 1, tokens: Optional[float] = None):
+        """Create a bucket, full unless a token count is given."""
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst) if tokens is None else tokens
+        self.updated: Optional[float] = None
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token.
+
+        Args:
+            now: Current time in seconds since the epoch
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        if self.updated is not None:
+            elapsed = max(0.0, now - self.updated)
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+        self.updated = now
+
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def to_state(self) -> dict[str, float]:
+        """Serializable bucket state."""
+        return {"tokens": self.tokens, "updated": self.updated}
+
+    @classmethod
+    def from_state(cls, rate: float, burst: int, state: dict) -> "TokenBucket":
+        """Recreate a bucket from to_state() output."""
+        bucket = cls(rate, burst, tokens=state.get("tokens"))
+        bucket.updated = state.get("updated")
+        return bucket
+
+
+class RateLimiter:
+    """
+    Per-host request rate limiter.
+
+    Attributes:
+        min_interval: Default seconds between requests to a host
+        burst: Requests allowed back to back before spacing applies
+        host_intervals: Interval overrides by host name
+        lock_dir: Directory holding shared bucket files, or None for
+            in-process limiting only
+        window: Seconds of history used by throughput()
+
+    Example:
+        Share one budget between all processes on a machine:
+
+        >>> limiter = RateLimiter(lock_dir="/tmp/ita-rate-limit")
+        >>> scrapper = ITAScrapper(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        min_interval: Optional[float] = None,
+        burst: int = 1,
+        host_intervals: Optional[dict[str, float]] = None,
+        lock_dir: Optional[Union[str, Path]] = None,
+        window: float = 60.0,
+    ):
+        """
+        Configure the limiter.
+
+        Args:
+            min_interval: Seconds between requests to a host. 0 disables
+                limiting. Default: Config.REQUEST_DELAY
+            burst: Requests allowed back to back. Default: 1
+            host_intervals: Per-host overrides of min_interval, for example
+                {"www.google.com": 2.0}
+            lock_dir: Directory for cross-process bucket files. Created if
+                missing. Default: None (in-process only)
+            window: Seconds of history used to compute throughput. Default: 60
+        """
+        self.min_interval = (
+            Config.REQUEST_DELAY if min_interval is None else min_interval
+        )
+        self.burst = max(1, burst)
+        self.host_intervals = {
+            host.lower(): interval for host, interval in (host_intervals or {}).items()
+        }
+        self.window = window
+
+        if lock_dir is not None and fcntl is None:
+            logger.warning("File locks unavailable, rate limiting per process only")
+            lock_dir = None
+        self.lock_dir = Path(lock_dir) if lock_dir is not None else None
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._history: dict[str, deque] = {}
+
+    def __getstate__(self) -> dict:
+        # Ship configuration only, so limiters can be passed to worker processes
+        state = self.__dict__.copy()
+        state["_buckets"] = {}
+        state["_history"] = {}
+        return state
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Host name a URL's requests are limited under."""
+        return (urlsplit(url).hostname or url).lower()
+
+    def interval_for(self, host: str) -> float:
+        """Seconds between requests for a host."""
+        return self.host_intervals.get(host, self.min_interval)
+
+    async def acquire(self, url: str) -> float:
+        """
+        Wait until a request to the URL's host is allowed.
+
+        Args:
+            url: URL (or host name) about to be requested
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = self.host_of(url)
+        interval = self.interval_for(host)
+
+        delay = 0.0
+        if interval > 0:
+            if self.lock_dir is not None:
+                delay = await asyncio.to_thread(self._reserve_shared, host, interval)
+            else:
+                delay = self._reserve_local(host, interval)
+
+            if delay > 0:
+                logger.debug(f"Rate limiting {host}: waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        self._history.setdefault(host, deque()).append(time.monotonic())
+        return delay
+
+    def throughput(self, host: Optional[str] = None) -> float:
+        """
+        Requests per second granted over the last ``window`` seconds.
+
+        Args:
+            host: Host to report on. Default: all hosts combined
+
+        Returns:
+            Average requests per second within the window
+        """
+        cutoff = time.monotonic() - self.window
+        hosts = [host.lower()] if host else list(self._history)
+
+        granted = 0
+        for name in hosts:
+            history = self._history.get(name)
+            if not history:
+                continue
+            while history and history[0] < cutoff:
+                history.popleft()
+            granted += len(history)
+        return granted / self.window
+
+    def _reserve_local(self, host: str, interval: float) -> float:
+        """Reserve a slot in the in-process bucket of a host."""
+        bucket = self._buckets.get(host)
+        if bucket is None or bucket.rate != 1 / interval:
+            bucket = self._buckets[host] = TokenBucket(1 / interval, self.burst)
+        return bucket.reserve(time.time())
+
+    def _reserve_shared(self, host: str, interval: float) -> float:
+        """Reserve a slot in the file-backed bucket of a host (blocking)."""
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        path = self.lock_dir / f"{host}.bucket"
+
+        with path.open("a+") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                try:
+                    state = json.loads(handle.read() or "{}")
+                except ValueError:
+                    state = {}
+
+                bucket = TokenBucket.from_state(1 / interval, self.burst, state)
+                delay = bucket.reserve(time.time())
+
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(bucket.to_state()))
+                handle.flush()
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+        return delay
+
+
+@functools.cache
+def default_rate_limiter() -> RateLimiter:
+    """
+    Process-wide limiter used by scrappers that do not get their own.
+
+    Built on first use from Config.REQUEST_DELAY, Config.RATE_LIMIT_BURST and
+    Config.RATE_LIMIT_DIR.
+    """
+    return RateLimiter(burst=Config.RATE_LIMIT_BURST, lock_dir=Config.RATE_LIMIT_DIR)
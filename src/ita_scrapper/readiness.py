@@ -0,0 +1,318 @@
+"""
+Event-driven page readiness detection for dynamic travel sites.
+
+ITA Matrix and Google Flights are single-page applications that keep loading
+data and re-rendering long after the initial document has arrived. Instead of
+sleeping for a fixed amount of time after every interaction, the scrapper
+waits on signals that indicate the page has actually settled:
+
+- Angular zone stability, via the testability API Angular exposes on window
+- Network idle, tracked from the XHR/fetch requests the page has in flight
+- DOM quiescence, detected with a MutationObserver injected into the page
+
+Every wait returns as soon as its signal fires and is capped by a configurable
+maximum, so a page that never settles costs no more than the old fixed sleeps.
+None of the waits raise on timeout; they report whether the page became ready
+and let the caller carry on, matching how the scrapper treats other soft waits.
+
+Usage:
+    >>> readiness = PageReadiness(page, max_wait_ms=10000)
+    >>> await page.click("button[type=submit]")
+    >>> await readiness.wait_until_ready(selector='[role="tooltip"]')
+"""
+
+import asyncio
+import logging
+import re
+import weakref
+from typing import Optional, Union
+
+from playwright.async_api import Page, Request
+
+from .deadline import clamp_timeout
+
+logger = logging.getLogger(__name__)
+
+# Readiness trackers by page, so the scrapper and the parsers share listeners
+_trackers: "weakref.WeakKeyDictionary[Page, PageReadiness]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_ANGULAR_STABLE_JS = """
+() => {
+    const getTestabilities = window.getAllAngularTestabilities;
+    if (typeof getTestabilities !== 'function') {
+        return true;
+    }
+    return getTestabilities().every((testability) => testability.isStable());
+}
+"""
+
+_DOM_QUIESCENCE_JS = """
+([quietMs, timeoutMs]) => new Promise((resolve) => {
+    const root = document.documentElement || document;
+    let quietTimer = null;
+    let hardTimer = null;
+    const finish = (settled) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(hardTimer);
+        resolve(settled);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    observer.observe(root, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    hardTimer = setTimeout(() => finish(false), timeoutMs);
+})
+"""
+
+
+class PageReadiness:
+    """
+    Waits for a Playwright page to become ready using real page signals.
+
+    Creating a PageReadiness starts tracking the page's XHR and fetch traffic,
+    so requests started before a wait (for example by a click that submits a
+    search) are taken into account. Use for_page() to share one tracker between
+    the scrapper and the parsers.
+
+    Attributes:
+        page: Page being observed
+        max_wait_ms: Upper bound in milliseconds for any single wait
+        quiet_ms: How long the DOM and network must stay quiet to count as settled
+        url_pattern: Optional regular expression restricting network tracking
+            to matching request URLs (for example the search API endpoint)
+
+    Example:
+        >>> readiness = PageReadiness.for_page(page)
+        >>> await input_box.type("JFK")
+        >>> await readiness.settle(600)  # at most 600 ms, usually far less
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        max_wait_ms: int = 10000,
+        quiet_ms: int = 150,
+        url_pattern: Optional[Union[str, re.Pattern]] = None,
+    ):
+        """
+        Start observing a page.
+
+        Args:
+            page: Page to observe
+            max_wait_ms: Upper bound in milliseconds for any single wait.
+                Default: 10000 (10s)
+            quiet_ms: Quiet period in milliseconds that counts as settled.
+                Default: 150
+            url_pattern: Regular expression; when given, only XHR/fetch requests
+                whose URL matches are tracked for network idle
+        """
+        self.page = page
+        self.max_wait_ms = max_wait_ms
+        self.quiet_ms = quiet_ms
+        self.url_pattern = re.compile(url_pattern) if url_pattern else None
+
+        self._inflight: set[Request] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._last_activity = 0.0
+
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+        _trackers[page] = self
+
+    @classmethod
+    def for_page(cls, page: Page) -> "PageReadiness":
+        """
+        Return the tracker already observing a page, creating one if needed.
+
+        Args:
+            page: Page to observe
+
+        Returns:
+            The PageReadiness registered for the page
+        """
+        tracker = _trackers.get(page)
+        if tracker is None:
+            tracker = cls(page)
+        return tracker
+
+    @property
+    def inflight_requests(self) -> int:
+        """Number of tracked XHR/fetch requests currently in flight."""
+        return len(self._inflight)
+
+    def _is_tracked(self, request: Request) -> bool:
+        """Whether a request counts towards network activity."""
+        if request.resource_type not in ("xhr", "fetch"):
+            return False
+        return not self.url_pattern or bool(self.url_pattern.search(request.url))
+
+    def _on_request(self, request: Request):
+        if self._is_tracked(request):
+            self._inflight.add(request)
+            self._idle.clear()
+            self._last_activity = asyncio.get_running_loop().time()
+
+    def _on_request_done(self, request: Request):
+        if request in self._inflight:
+            self._inflight.discard(request)
+            self._last_activity = asyncio.get_running_loop().time()
+            if not self._inflight:
+                self._idle.set()
+
+    def _cap(self, timeout_ms: Optional[int]) -> int:
+        """Clamp a requested timeout to the configured maximum and any deadline."""
+        if timeout_ms is None:
+            timeout_ms = self.max_wait_ms
+        capped = max(0, min(timeout_ms, self.max_wait_ms))
+        return min(capped, clamp_timeout(capped))
+
+    async def wait_for_angular(self, timeout_ms: Optional[int] = None) -> bool:
+        """
+        Wait until every Angular zone on the page reports it is stable.
+
+        Pages without the Angular testability API count as stable.
+
+        Args:
+            timeout_ms: Maximum wait in milliseconds (capped by max_wait_ms)
+
+        Returns:
+            True if Angular became stable in time, False otherwise
+        """
+        timeout_ms = self._cap(timeout_ms)
+        try:
+            await self.page.wait_for_function(
+                _ANGULAR_STABLE_JS, timeout=timeout_ms, polling=50
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Angular did not stabilize within {timeout_ms}ms: {e}")
+            return False
+
+    async def wait_for_network_idle(
+        self, timeout_ms: Optional[int] = None, idle_ms: Optional[int] = None
+    ) -> bool:
+        """
+        Wait until no tracked requests are in flight for a quiet period.
+
+        Args:
+            timeout_ms: Maximum wait in milliseconds (capped by max_wait_ms)
+            idle_ms: Quiet period required, defaults to quiet_ms
+
+        Returns:
+            True if the network went idle in time, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._cap(timeout_ms) / 1000
+        idle = (self.quiet_ms if idle_ms is None else idle_ms) / 1000
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._idle.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+            quiet_for = loop.time() - self._last_activity
+            if quiet_for >= idle:
+                return True
+            await asyncio.sleep(min(idle - quiet_for, max(0.0, remaining)))
+
+        logger.debug(f"Network still busy with {self.inflight_requests} requests")
+        return False
+
+    async def wait_for_dom_quiescence(
+        self, timeout_ms: Optional[int] = None, quiet_ms: Optional[int] = None
+    ) -> bool:
+        """
+        Wait until the DOM stops changing for a quiet period.
+
+        Args:
+            timeout_ms: Maximum wait in milliseconds (capped by max_wait_ms)
+            quiet_ms: Quiet period required, defaults to the instance quiet_ms
+
+        Returns:
+            True if the DOM settled in time, False otherwise
+        """
+        timeout_ms = self._cap(timeout_ms)
+        quiet_ms = self.quiet_ms if quiet_ms is None else quiet_ms
+        if timeout_ms <= 0:
+            return False
+
+        try:
+            return bool(
+                await self.page.evaluate(_DOM_QUIESCENCE_JS, [quiet_ms, timeout_ms])
+            )
+        except Exception as e:
+            # Navigations destroy the execution context mid-wait
+            logger.debug(f"DOM quiescence wait interrupted: {e}")
+            return False
+
+    async def settle(self, max_ms: Optional[int] = None) -> bool:
+        """
+        Short wait after a form interaction until the UI stops changing.
+
+        Replacement for fixed post-interaction sleeps: returns as soon as the
+        DOM has been quiet for quiet_ms, and never waits longer than max_ms.
+
+        Args:
+            max_ms: Maximum wait in milliseconds (capped by max_wait_ms)
+
+        Returns:
+            True if the DOM settled in time, False otherwise
+        """
+        return await self.wait_for_dom_quiescence(timeout_ms=max_ms)
+
+    async def wait_until_ready(
+        self, selector: Optional[str] = None, timeout_ms: Optional[int] = None
+    ) -> bool:
+        """
+        Wait for a page to be fully ready after a navigation or search.
+
+        Stages run in order against one shared budget: the optional selector
+        appears, Angular is stable, the network is idle and the DOM is quiet.
+
+        Args:
+            selector: CSS selector that must be present before the page counts
+                as ready
+            timeout_ms: Total budget in milliseconds (capped by max_wait_ms)
+
+        Returns:
+            True if every stage completed within the budget, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._cap(timeout_ms) / 1000
+
+        def remaining_ms() -> int:
+            return max(0, int((deadline - loop.time()) * 1000))
+
+        if selector:
+            try:
+                await self.page.wait_for_selector(
+                    selector, state="attached", timeout=max(1, remaining_ms())
+                )
+            except Exception as e:
+                logger.debug(f"Readiness selector {selector} not found: {e}")
+                return False
+
+        ready = await self.wait_for_angular(remaining_ms())
+        ready = await self.wait_for_network_idle(remaining_ms()) and ready
+        ready = await self.wait_for_dom_quiescence(remaining_ms()) and ready
+
+        if not ready:
+            logger.debug("Page not fully settled within readiness budget")
+        return ready
@@ -0,0 +1,153 @@
+"""
+Recycling of long-lived browser contexts.
+
+A page that runs search after search accumulates DOM nodes, JavaScript heap
+and detached element handles from the many query_selector_all calls made
+while parsing, so its memory grows with uptime. Instead of restarting whole
+processes on a schedule, a RecyclePolicy tells a scrapper when to throw its
+context away and open a fresh one in the same browser: after a number of
+searches, after a maximum age, or once the page's memory crosses a limit.
+
+Memory is read from the Chrome DevTools Protocol (Performance.getMetrics),
+which reports the page's JavaScript heap and DOM counters without
+instrumenting the page itself.
+
+Usage:
+    >>> policy = RecyclePolicy(max_searches=50, max_age=1800, max_memory_mb=400)
+    >>> async with ITAScrapperPool(size=4, recycle=policy) as pool:
+    ...     outcomes = await pool.search_many(all_params)
+"""
+
+import logging
+from typing import Optional
+
+from playwright.async_api import BrowserContext, CDPSession, Page
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class RecyclePolicy:
+    """
+    Limits after which a scrapper replaces its browser context.
+
+    Any limit left as None is not enforced.
+
+    Attributes:
+        max_searches: Searches run in one context
+        max_age: Seconds since the context was created
+        max_memory_mb: JavaScript heap in use by the page, in megabytes
+
+    Example:
+        >>> policy = RecyclePolicy(max_searches=100)
+        >>> policy.reason(searches=100, age=12.0)
+        '100 searches'
+    """
+
+    def __init__(
+        self,
+        max_searches: Optional[int] = None,
+        max_age: Optional[float] = None,
+        max_memory_mb: Optional[float] = None,
+    ):
+        """
+        Configure the limits.
+
+        Args:
+            max_searches: Recycle after this many searches. Default: None
+            max_age: Recycle contexts older than this many seconds. Default: None
+            max_memory_mb: Recycle once the page's JS heap exceeds this many
+                megabytes. Default: None
+        """
+        self.max_searches = max_searches
+        self.max_age = max_age
+        self.max_memory_mb = max_memory_mb
+
+    @property
+    def measures_memory(self) -> bool:
+        """Whether the policy needs page memory metrics."""
+        return self.max_memory_mb is not None
+
+    def reason(
+        self, searches: int, age: float, memory_bytes: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Decide whether a context should be recycled.
+
+        Args:
+            searches: Searches run in the context so far
+            age: Seconds since the context was created
+            memory_bytes: JS heap used by the page, if measured
+
+        Returns:
+            A short description of the exceeded limit, or None to keep the
+            context
+        """
+        if self.max_searches is not None and searches >= self.max_searches:
+            return f"{searches} searches"
+        if self.max_age is not None and age >= self.max_age:
+            return f"age {age:.0f}s"
+        if (
+            self.max_memory_mb is not None
+            and memory_bytes is not None
+            and memory_bytes >= self.max_memory_mb * MB
+        ):
+            return f"JS heap {memory_bytes / MB:.0f} MB"
+        return None
+
+
+class PageMetrics:
+    """
+    Reads memory metrics of a page over a CDP session.
+
+    Only Chromium supports CDP sessions; on other browsers read() returns an
+    empty dictionary.
+    """
+
+    def __init__(self, context: BrowserContext, page: Page):
+        """Prepare to read metrics; the CDP session is opened on first use."""
+        self.context = context
+        self.page = page
+        self._session: Optional[CDPSession] = None
+        self._unavailable = False
+
+    async def read(self) -> dict[str, float]:
+        """
+        Read the page's performance metrics.
+
+        Returns:
+            Metrics by name, such as JSHeapUsedSize, JSHeapTotalSize, Nodes and
+            Documents, or an empty dictionary if they cannot be read
+        """
+        if self._unavailable:
+            return {}
+
+        if self._session is None:
+            try:
+                session = await self.context.new_cdp_session(self.page)
+            except Exception as e:
+                # Only Chromium has CDP sessions, so do not ask again
+                logger.debug(f"Page metrics unavailable: {e}")
+                self._unavailable = True
+                return {}
+            try:
+                await session.send("Performance.enable")
+            except Exception as e:
+                logger.debug(f"Could not enable page metrics: {e}")
+                return {}
+            self._session = session
+
+        try:
+            response = await self._session.send("Performance.getMetrics")
+        except Exception as e:
+            # Transient, e.g. the page navigated mid-call: reopen next time
+            logger.debug(f"Could not read page metrics: {e}")
+            self._session = None
+            return {}
+
+        return {metric["name"]: metric["value"] for metric in response["metrics"]}
+
+    async def js_heap_used(self) -> Optional[float]:
+        """JavaScript heap in use by the page in bytes, if available."""
+        return (await self.read()).get("JSHeapUsedSize")
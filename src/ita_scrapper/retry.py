@@ -0,0 +1,203 @@
+"""
+Retry handling for search stages.
+
+A search runs in three stages: navigating to the site, filling and submitting
+the search form, and parsing the results. Failures in any of them are often
+transient (a slow page, a flaky network, a results list still rendering), so
+each stage is retried on its own with jittered exponential backoff: a parse
+failure re-parses the page that is already showing results instead of
+navigating and searching all over again.
+
+Errors are classified before retrying. Timeouts, navigation and parse errors
+and transient HTTP statuses (408, 425, 429, 5xx) are retried; validation
+errors, other HTTP client errors and programming errors fail immediately.
+
+Usage:
+    >>> policy = RetryPolicy(max_retries=3, base_delay=1.0)
+    >>> attempts = {}
+    >>> flights = await policy.call("parse", lambda: parse(page), attempts)
+    >>> attempts
+    {'parse': 2}
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable
+from typing import Callable, Optional, TypeVar
+
+from playwright.async_api import Error as PlaywrightError
+from pydantic import ValidationError as PydanticValidationError
+
+from .config import Config
+from .deadline import Deadline, current_deadline
+from .exceptions import (
+    ITATimeoutError,
+    NavigationError,
+    ParseError,
+    ValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: timeouts, rate limiting and server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})
+
+
+class RetryPolicy:
+    """
+    Decides which errors are retried, how often and after what delay.
+
+    Delays use "full jitter": attempt n waits a random time between 0 and
+    min(max_delay, base_delay * 2 ** (n - 1)) seconds, which spreads retries of
+    concurrent searches instead of having them hit the site in lockstep.
+
+    Attributes:
+        max_retries: Retries per stage after the first attempt (0 disables)
+        base_delay: Backoff base in seconds
+        max_delay: Upper bound for a single delay in seconds
+
+    Example:
+        >>> scrapper = ITAScrapper(retry=RetryPolicy(max_retries=5, max_delay=10))
+        >>> result = await scrapper.search_flights("JFK", "LAX", date(2024, 8, 15))
+        >>> scrapper.attempts
+        {'navigate': 1, 'search_form': 1, 'parse': 3}
+    """
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: float = 30.0,
+    ):
+        """
+        Configure retries.
+
+        Args:
+            max_retries: Retries per stage. Default: Config.MAX_RETRIES
+            base_delay: Backoff base in seconds. Default: Config.RETRY_DELAY
+            max_delay: Maximum single delay in seconds. Default: 30
+        """
+        self.max_retries = Config.MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = Config.RETRY_DELAY if base_delay is None else base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before retrying after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+
+        Returns:
+            Seconds to wait
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Classify an error as transient (retry) or fatal (give up).
+
+        Args:
+            error: Exception raised by a stage
+
+        Returns:
+            True if the stage should be attempted again
+        """
+        if isinstance(error, (ValidationError, PydanticValidationError)):
+            return False
+
+        if isinstance(error, NavigationError) and error.status_code is not None:
+            status = error.status_code
+            return status in RETRYABLE_STATUS_CODES or status >= 500
+
+        return isinstance(
+            error,
+            (
+                NavigationError,
+                ParseError,
+                ITATimeoutError,
+                asyncio.TimeoutError,
+                PlaywrightError,
+                ConnectionError,
+            ),
+        )
+
+    def next_delay(
+        self,
+        error: BaseException,
+        attempt: int,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Number of the attempt that failed, starting at 1
+            deadline: Search deadline. Default: the active deadline, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt > self.max_retries or not self.is_retryable(error):
+            return None
+
+        delay = self.backoff(attempt)
+        deadline = deadline or current_deadline()
+        if deadline is not None and delay >= deadline.remaining:
+            logger.debug(f"No time left to retry after {delay:.1f}s backoff")
+            return None
+        return delay
+
+    async def call(
+        self,
+        stage: str,
+        operation: Callable[[], Awaitable[T]],
+        attempts: Optional[dict[str, int]] = None,
+        before_retry: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> T:
+        """
+        Run one stage, retrying it on transient errors.
+
+        Args:
+            stage: Stage name used in logs and as key in ``attempts``
+            operation: Coroutine function running the stage
+            attempts: Dictionary updated with the number of attempts made
+            before_retry: Coroutine function run before every retry, for
+                example to reset page state
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            The last error if it is fatal, retries are exhausted or the active
+            deadline leaves no time for another attempt
+            ITATimeoutError: If the active deadline has already passed
+        """
+        deadline = current_deadline()
+        attempt = 0
+        while True:
+            attempt += 1
+            if attempts is not None:
+                attempts[stage] = attempt
+            if deadline is not None:
+                deadline.check(stage)
+
+            try:
+                return await operation()
+            except Exception as e:
+                delay = self.next_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+
+                logger.warning(
+                    f"Stage {stage} failed (attempt {attempt} of "
+                    f"{self.max_retries + 1}), retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                if before_retry is not None:
+                    await before_retry()
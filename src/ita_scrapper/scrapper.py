@@ -11,16 +11,42 @@ parsers for handling dynamic content, tooltips, and Angular Material components
 found on modern travel booking sites.
 """
 
+import asyncio
 import logging
 import random
+import time
+from collections.abc import AsyncIterator, Awaitable
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Optional
-
-from playwright.async_api import Browser, Page, Playwright, async_playwright
+from pathlib import Path
+from typing import Callable, ClassVar, Optional, TypeVar, Union
+from urllib.parse import urlsplit
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    ElementHandle,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import ValidationError
 
-from .exceptions import ITAScrapperError, NavigationError, ParseError
+from .artifacts import ArtifactPolicy, ArtifactRecorder
+from .blocking import BlockingStats, ResourceBlocker
+from .capture import SEARCH_API_PATTERN, ResponseCapture
+from .config import Config
+from .deadline import Deadline, clamp_timeout, current_deadline
+from .deeplink import build_search_url
+from .exceptions import (
+    ITAScrapperError,
+    ITATimeoutError,
+    NavigationError,
+    ParseError,
+)
+from .har import HarReplay, record_options
+from .http_engine import MatrixSession
 from .models import (
     Airline,
     Airport,
@@ -34,10 +60,181 @@ from .models import (
     SearchParams,
     TripType,
 )
-from .parsers import ITAMatrixParser
+from .parsers import ITAMatrixParser, ITAMatrixResponseParser
+from .ratelimit import RateLimiter, default_rate_limiter
+from .readiness import PageReadiness
+from .recycle import PageMetrics, RecyclePolicy
+from .retry import RetryPolicy
+from .selector_registry import SelectorRegistry, default_selector_registry
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Departure date inputs, most specific first. Angular Material date pickers
+# have no placeholder text, so placeholders only come late as fallbacks.
+DEPARTURE_DATE_SELECTORS = [
+    'input[data-mat-calendar="mat-datepicker-1"]',  # Specific calendar attribute
+    'input.mat-datepicker-input[id="mat-input-12"]',  # Specific ID from HTML
+    # Angular Material date picker class combinations
+    "input.mat-datepicker-input.mat-mdc-input-element",
+    "input.mat-mdc-form-field-input-control.mat-datepicker-input",
+    ".mat-datepicker-input",
+    "input.mat-datepicker-input",
+    ".mat-mdc-input-element.mat-datepicker-input",
+    # Form field context selectors
+    ".mat-mdc-form-field.date-field input",
+    "mat-form-field.date-field input",
+    # Round-trip mode range inputs
+    ".mat-start-date",
+    "input.mat-start-date",
+    "input[matstartdate]",
+    "input[data-mat-calendar]",
+    # Placeholder-based selectors (may not exist)
+    'input[placeholder="Start date"]',  # Round-trip mode
+    'input[placeholder="Departure"]',  # One-way mode
+    'input[placeholder*="depart" i]',
+    'input[placeholder*="date" i]',
+    'input[type="text"][aria-label*="date" i]',
+    'input[type="text"][name*="date" i]',
+    # Last resort: any text input that's not airport/city/address related
+    'input[type="text"]:not([placeholder*="Add airport"])'
+    ':not([placeholder*="city" i]):not([placeholder*="address" i])'
+    ':not([placeholder*="sales" i]):not([placeholder*="billing" i])',
+]
+
+# Return date inputs (round trips only), most specific first
+RETURN_DATE_SELECTORS = [
+    'input[data-mat-calendar="mat-datepicker-2"]',  # Specific return calendar attribute
+    'input.mat-datepicker-input[id="mat-input-13"]',  # Typical return date ID
+    "input.mat-datepicker-input.mat-end-date",
+    ".mat-datepicker-input.mat-end-date",
+    ".mat-end-date",
+    "input.mat-end-date",
+    "input[matenddate]",
+    ".mat-mdc-form-field.date-field:nth-of-type(2) input",
+    'input[placeholder="End date"]',
+    'input[placeholder="Return"]',
+    'input[placeholder*="return" i]',
+]
+
+# Attribute keywords of inputs that are clearly not date fields
+DATE_EXCLUDED_KEYWORDS = [
+    "airport",
+    "city",
+    "address",
+    "sales",
+    "billing",
+    "street",
+    "zip",
+    "postal",
+    "phone",
+    "email",
+    "name",
+    "company",
+    "organization",
+    "contact",
+]
+
+# Attribute keywords suggesting a date field
+DATE_INDICATORS = [
+    "date",
+    "depart",
+    "departure",
+    "start",
+    "calendar",
+    "end",
+    "return",
+    "mat-datepicker",
+    "datepicker",
+    "mat-input",
+]
+
+# Clears a search form returned to with history navigation: Angular keeps the
+# previous search's airport chips and typed values in the restored form.
+_RESET_SEARCH_FORM_JS = """
+() => {
+    const removes = document.querySelectorAll(
+        "matrix-location-field .mat-mdc-chip-remove, matrix-location-field [matchipremove]"
+    );
+    for (const remove of removes) remove.click();
+    const inputs = document.querySelectorAll(
+        "matrix-location-field input, input.mat-datepicker-input"
+    );
+    for (const input of inputs) {
+        if (!input.value) continue;
+        input.value = "";
+        input.dispatchEvent(new Event("input", { bubbles: true }));
+        input.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+}
+"""
+
+# Values still present in the search form: chip labels and non-empty inputs
+_SEARCH_FORM_LEFTOVERS_JS = """
+() => {
+    const leftovers = [];
+    const chips = document.querySelectorAll(
+        "matrix-location-field mat-chip, matrix-location-field .mat-mdc-chip"
+    );
+    for (const chip of chips) leftovers.push((chip.innerText || "").trim());
+    const inputs = document.querySelectorAll(
+        "matrix-location-field input, input.mat-datepicker-input"
+    );
+    for (const input of inputs) if (input.value) leftovers.push(input.value);
+    return leftovers;
+}
+"""
+
+# Picks the date input in one round trip. Each selector's visible, enabled
+# matches are scored on their placeholder, aria-label, name and class: excluded
+# keywords disqualify, and the catch-all last selector also needs a date
+# indicator. If no selector yields an input, any text input with a date
+# indicator is taken. Returns [element, selector, missed], where missed lists
+# the selectors tried without yielding the input; element and selector are
+# null if none fits.
+_DATE_INPUT_JS = """
+({selectors, excluded, indicators}) => {
+    const usable = (el) =>
+        el.getClientRects().length > 0 &&
+        getComputedStyle(el).visibility !== "hidden" &&
+        !el.matches(":disabled");
+    const attrs = (el) =>
+        ["placeholder", "aria-label", "name", "class"]
+            .map((name) => el.getAttribute(name) || "")
+            .join(" ")
+            .toLowerCase();
+    const any = (text, keywords) => keywords.some((k) => text.includes(k));
+    const missed = [];
+
+    for (let i = 0; i < selectors.length; i++) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selectors[i]);
+        } catch (e) {
+            continue;
+        }
+        const catchAll = i === selectors.length - 1;
+        for (const el of elements) {
+            if (!usable(el)) continue;
+            const text = attrs(el);
+            if (any(text, excluded)) continue;
+            if (catchAll && !any(text, indicators)) continue;
+            return [el, selectors[i], missed];
+        }
+        missed.push(selectors[i]);
+    }
+
+    for (const el of document.querySelectorAll('input[type="text"]')) {
+        const text = attrs(el);
+        if (any(text, indicators) && !any(text, excluded) && usable(el)) {
+            return [el, "date-keyword-based", missed];
+        }
+    }
+    return [null, null, missed];
+}
+"""
+
 
 class ITAScrapper:
     """
@@ -92,6 +289,66 @@ class ITAScrapper:
     # Default to ITA Matrix as it's more reliable for scraping
     BASE_URL = ITA_MATRIX_URL
 
+    # How long a loaded results link may take to send its search request
+    # before the link is considered not understood, in milliseconds
+    DEEP_LINK_START_TIMEOUT = 8000
+
+    # Enhanced stealth args for better headless detection evasion
+    BROWSER_ARGS: ClassVar[list[str]] = [
+        "--no-sandbox",
+        "--disable-blink-features=AutomationControlled",
+        "--disable-web-security",
+        "--disable-features=VizDisplayCompositor",
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-default-apps",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-field-trial-config",
+        "--disable-ipc-flooding-protection",
+    ]
+
+    # Stealth JavaScript to mask headless detection, injected into every context
+    STEALTH_INIT_SCRIPT = """
+        // Remove webdriver property
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined,
+        });
+
+        // Mock plugins
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5],
+        });
+
+        // Mock languages
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-US', 'en'],
+        });
+
+        // Override permissions API
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (
+            parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+        );
+
+        // Mock chrome runtime
+        window.chrome = { runtime: {} };
+
+        // Override toString methods
+        window.navigator.webdriver = undefined;
+
+        // Mock hardware concurrency
+        Object.defineProperty(navigator, 'hardwareConcurrency', {
+            get: () => 4,
+        });
+    """
+
     def __init__(
         self,
         headless: bool = True,
@@ -99,6 +356,22 @@ class ITAScrapper:
         viewport_size: tuple = (1920, 1080),
         user_agent: Optional[str] = None,
         use_matrix: bool = True,
+        warm_session: bool = False,
+        readiness_timeout: int = 10000,
+        block_resources: Union[bool, ResourceBlocker] = True,
+        artifacts: Union[ArtifactPolicy, str, ArtifactRecorder] = (
+            ArtifactPolicy.ON_FAILURE
+        ),
+        rate_limiter: Union[bool, RateLimiter] = True,
+        retry: Union[bool, RetryPolicy] = True,
+        browser_endpoint: Optional[str] = None,
+        recycle: Optional[RecyclePolicy] = None,
+        crash_restarts: int = 1,
+        capture_responses: bool = True,
+        deep_link: bool = True,
+        record_har: Optional[Union[str, Path]] = None,
+        replay_har: Optional[Union[str, Path]] = None,
+        selector_registry: Union[bool, SelectorRegistry] = True,
     ):
         """
         Initialize the ITA Scrapper with browser and parsing configuration.
@@ -115,6 +388,71 @@ class ITAScrapper:
             use_matrix: Whether to use ITA Matrix (True) or Google Flights (False).
                 ITA Matrix is recommended as it provides more detailed flight data and
                 better parsing reliability. Default: True
+            warm_session: Keep the page parked on the search form between searches.
+                After the first search the scrapper navigates back to the already
+                loaded form instead of downloading and bootstrapping the site again,
+                falling back to a full navigation if the form cannot be restored.
+                Default: False
+            readiness_timeout: Maximum time in milliseconds to wait for the page to
+                settle (Angular stable, network idle, DOM quiet) after a navigation
+                or interaction. Waits return as soon as the page is ready, so this
+                only bounds the worst case. Default: 10000 (10s)
+            block_resources: Abort requests the scrapper does not need. True uses
+                the default ResourceBlocker (images, media, fonts and analytics
+                hosts), False disables blocking, or pass a configured
+                ResourceBlocker. Blocked requests are counted in blocking_stats.
+                Default: True
+            artifacts: When to save debug screenshots: an ArtifactPolicy ("off",
+                "on_failure", "always", "sampled") written to ./artifacts, or a
+                configured ArtifactRecorder. Files are named per search and
+                written in the background. Default: on_failure
+            rate_limiter: Spacing of navigations and search submissions per
+                host. True uses the process-wide limiter built from
+                Config.REQUEST_DELAY, False disables limiting, or pass a
+                configured RateLimiter (for example one with a lock_dir to share
+                the budget across processes). Default: True
+            retry: Retry failed search stages (navigation, search form, parsing)
+                individually with jittered exponential backoff. True uses
+                Config.MAX_RETRIES and Config.RETRY_DELAY, False makes a single
+                attempt, or pass a configured RetryPolicy. Attempts per stage
+                of the last search are available in ``attempts``. Default: True
+            browser_endpoint: Connect to an already running browser instead of
+                launching one. An http(s) URL or a ws(s) URL with a /devtools/
+                path is a Chrome DevTools endpoint (for example one started
+                with ``ita-scrapper browser-server``); any other ws(s) URL is a
+                Playwright browser server. Closing the scrapper then only closes
+                its own context. Default: Config.BROWSER_ENDPOINT
+                (``ITA_BROWSER_ENDPOINT``), or launch a browser if unset
+            recycle: Replace the browser context with a fresh one, before a
+                search, once it has run a number of searches, reached an age
+                or grown past a JS heap size. Default: None (never recycle)
+            crash_restarts: How many times a search is re-run after the page
+                crashed or the browser disconnected while it was running. The
+                scrapper rebuilds its context (relaunching or reconnecting to
+                the browser if needed) before the next search either way; the
+                number of rebuilds is in ``restarts``. Default: 1
+            capture_responses: Read ITA Matrix results from the JSON search
+                API response the page receives instead of from the rendered
+                results, falling back to DOM parsing when no usable response
+                is captured. Default: True
+            deep_link: Start ITA Matrix searches by navigating straight to a
+                results link that encodes the search, instead of filling the
+                search form. If a link does not start a search, the scrapper
+                fills the form for that and all later searches. Default: True
+            record_har: Save all network traffic to this HAR file (.har with
+                embedded bodies, or .zip). The file is written when the
+                context closes; contexts replaced later (recycling, crash
+                restarts) write numbered files next to it. Default: None
+            replay_har: Serve all traffic from a recorded HAR file instead of
+                the network, for offline, deterministic runs. Requests missing
+                from the recording fail, and rate limiting is disabled.
+                Default: None
+            selector_registry: Learn which of the fallback selectors of each
+                form and parsing step work, and try them first next time.
+                True uses the process-wide registry, persisted to
+                Config.SELECTOR_CACHE (``ITA_SELECTOR_CACHE``) on close() when
+                that is set; False keeps the default order, or pass a
+                configured SelectorRegistry. Default: True
 
         Note:
             ITA Matrix (use_matrix=True) is the recommended option because:
@@ -140,6 +478,81 @@ class ITAScrapper:
         self.viewport_size = viewport_size
         self.user_agent = user_agent
         self.use_matrix = use_matrix
+        self.warm_session = warm_session
+        self.readiness_timeout = readiness_timeout
+        self.browser_endpoint = browser_endpoint or Config.BROWSER_ENDPOINT
+
+        if block_resources is True:
+            self.resource_blocker: Optional[ResourceBlocker] = ResourceBlocker()
+        elif block_resources is False:
+            self.resource_blocker = None
+        else:
+            self.resource_blocker = block_resources
+        # Requests blocked during the current (or last) search
+        self.blocking_stats = BlockingStats()
+
+        if isinstance(artifacts, ArtifactRecorder):
+            self.artifacts = artifacts
+        else:
+            self.artifacts = ArtifactRecorder(artifacts)
+        # Identifier of the current (or last) search, used to name artifacts
+        self._search_id = ArtifactRecorder.new_search_id()
+
+        if record_har and replay_har:
+            raise ValueError("record_har and replay_har cannot be combined")
+        self.record_har = Path(record_har) if record_har else None
+        self._har_contexts = 0
+        self.har_replay = HarReplay(replay_har) if replay_har else None
+        if self.har_replay:
+            # Nothing reaches the site, so there is nothing to be polite to
+            rate_limiter = False
+
+        if rate_limiter is True:
+            self.rate_limiter: Optional[RateLimiter] = default_rate_limiter()
+        elif rate_limiter is False:
+            self.rate_limiter = None
+        else:
+            self.rate_limiter = rate_limiter
+
+        if selector_registry is True:
+            self.selector_registry: Optional[SelectorRegistry] = (
+                default_selector_registry()
+            )
+        elif selector_registry is False:
+            self.selector_registry = None
+        else:
+            self.selector_registry = selector_registry
+        # Fingerprint of the page the current selector lookups run on
+        self._selector_fingerprint: Optional[str] = None
+
+        if isinstance(retry, RetryPolicy):
+            self.retry_policy = retry
+        else:
+            self.retry_policy = RetryPolicy() if retry else RetryPolicy(max_retries=0)
+        # Attempts per stage of the current (or last) search
+        self.attempts: dict[str, int] = {}
+
+        self.recycle_policy = recycle
+        # Contexts replaced so far
+        self.recycles = 0
+        self._context_searches = 0
+        self._context_started = time.monotonic()
+        self._metrics: Optional[PageMetrics] = None
+
+        self.crash_restarts = crash_restarts
+        # Contexts rebuilt and browsers relaunched after crashes
+        self.restarts = 0
+        self.browser_restarts = 0
+        # Why the page or browser died, None while they are healthy
+        self._crashed: Optional[str] = None
+        self._watched_browser: Optional[Browser] = None
+
+        self.capture_responses = capture_responses and use_matrix
+        self._capture: Optional[ResponseCapture] = None
+        self._response_parser = ITAMatrixResponseParser()
+
+        self.deep_link = deep_link and use_matrix
+        self._deep_link_failed = False
 
         # Set the base URL based on preference
         if use_matrix:
@@ -149,13 +562,23 @@ class ITAScrapper:
 
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self._readiness: Optional[PageReadiness] = None
+        self._owns_browser = False
+
+        # URL of the loaded search form, used by warm sessions to come back to it
+        self._search_form_url: Optional[str] = None
 
         # Initialize the appropriate parser
         if use_matrix:
-            self._parser = ITAMatrixParser()
+            self._parser = ITAMatrixParser(self.selector_registry)
         else:
             self._parser = None  # Will use basic parsing for Google Flights
+        # Markers of the current search's result rows for the parser's row scan
+        self._row_indicators: Optional[list[str]] = None
+        # Cabin of the current search, for solutions that do not name one
+        self._search_cabin = CabinClass.ECONOMY
 
     async def __aenter__(self):
         """
@@ -209,6 +632,9 @@ class ITAScrapper:
         - Custom viewport and user agent settings
         - Default timeout configuration
 
+        With a browser_endpoint, connects to that browser instead of launching
+        one and only opens a context in it.
+
         Raises:
             ITAScrapperError: If browser fails to start or initialize properly
 
@@ -224,102 +650,180 @@ class ITAScrapper:
         """
         try:
             self._playwright = await async_playwright().start()
+            await self._open_browser()
+            await self.attach(self._browser)
 
-            # Enhanced stealth args for better headless detection evasion
-            stealth_args = [
-                "--no-sandbox",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--disable-dev-shm-usage",
-                "--disable-extensions",
-                "--disable-plugins",
-                "--disable-images",  # Faster loading
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-default-apps",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-field-trial-config",
-                "--disable-ipc-flooding-protection",
-            ]
+            logger.info("Browser started successfully")
 
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                args=stealth_args,
-            )
+        except Exception as e:
+            logger.error(f"Failed to start browser: {e}")
+            raise ITAScrapperError(f"Failed to start browser: {e}")
 
-            # Enhanced context with better stealth
-            context = await self._browser.new_context(
-                viewport={
-                    "width": self.viewport_size[0],
-                    "height": self.viewport_size[1],
-                },
-                user_agent=self.user_agent
-                or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                extra_http_headers={
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate",
-                    "DNT": "1",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                },
+    async def _open_browser(self):
+        """Connect to the configured endpoint or launch a browser of our own."""
+        if self.browser_endpoint:
+            self._browser = await self.connect_browser(
+                self._playwright, self.browser_endpoint, self.timeout
             )
+            self._owns_browser = False
+        else:
+            self._browser = await self.launch_browser(self._playwright, self.headless)
+            self._owns_browser = True
+
+    @classmethod
+    async def launch_browser(
+        cls,
+        playwright: Playwright,
+        headless: bool,
+        debugging_port: Optional[int] = None,
+        debugging_host: str = "127.0.0.1",
+    ) -> Browser:
+        """
+        Launch a Chromium instance with the scrapper's stealth arguments.
 
-            # Add stealth JavaScript to mask headless detection
-            await context.add_init_script("""
-                // Remove webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                // Mock plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                // Mock languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-                
-                // Override permissions API
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-                );
-                
-                // Mock chrome runtime
-                window.chrome = { runtime: {} };
-                
-                // Override toString methods
-                window.navigator.webdriver = undefined;
-                
-                // Mock hardware concurrency
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => 4,
-                });
-            """)
+        Shared by start(), ITAScrapperPool and the browser-server command so
+        that every browser used by the library is configured identically.
 
-            self._page = await context.new_page()
-            self._page.set_default_timeout(self.timeout)
+        Args:
+            playwright: Running Playwright instance
+            headless: Whether to launch the browser in headless mode
+            debugging_port: Expose the Chrome DevTools Protocol on this port so
+                other processes can connect with connect_browser()
+            debugging_host: Address the DevTools endpoint listens on.
+                Default: 127.0.0.1
 
-            logger.info("Browser started successfully")
+        Returns:
+            The launched Browser
+        """
+        args = list(cls.BROWSER_ARGS)
+        if debugging_port is not None:
+            args += [
+                f"--remote-debugging-port={debugging_port}",
+                f"--remote-debugging-address={debugging_host}",
+            ]
+        return await playwright.chromium.launch(headless=headless, args=args)
+
+    @staticmethod
+    def is_cdp_endpoint(endpoint: str) -> bool:
+        """Whether an endpoint is Chrome DevTools rather than a Playwright server."""
+        parts = urlsplit(endpoint)
+        return parts.scheme in ("http", "https") or parts.path.startswith("/devtools/")
+
+    @classmethod
+    async def connect_browser(
+        cls, playwright: Playwright, endpoint: str, timeout: int = 30000
+    ) -> Browser:
+        """
+        Connect to a running browser instead of launching one.
 
-        except Exception as e:
-            logger.error(f"Failed to start browser: {e}")
-            raise ITAScrapperError(f"Failed to start browser: {e}")
+        Skips browser launch latency entirely: many short-lived scrappers can
+        share one warm browser, each in its own context.
+
+        Args:
+            playwright: Running Playwright instance
+            endpoint: Chrome DevTools endpoint (http://host:port or
+                ws://host:port/devtools/browser/<id>) or Playwright browser
+                server websocket URL
+            timeout: Connection timeout in milliseconds
+
+        Returns:
+            The connected Browser
+
+        Example:
+            >>> browser = await ITAScrapper.connect_browser(
+            ...     playwright, "http://127.0.0.1:9222"
+            ... )
+        """
+        logger.debug(f"Connecting to browser at {endpoint}")
+        if cls.is_cdp_endpoint(endpoint):
+            return await playwright.chromium.connect_over_cdp(endpoint, timeout=timeout)
+        return await playwright.chromium.connect(endpoint, timeout=timeout)
+
+    async def attach(self, browser: Browser):
+        """
+        Open an isolated browser context and page on an already running browser.
+
+        The context gets the scrapper's viewport, user agent, headers and stealth
+        init script. Closing the scrapper afterwards only closes this context;
+        the browser itself is left to its owner.
+
+        Args:
+            browser: Browser to create the context in
+
+        Example:
+            >>> scrapper = ITAScrapper()
+            >>> await scrapper.attach(shared_browser)
+            >>> result = await scrapper.search_flights("JFK", "LAX", date.today())
+            >>> await scrapper.close()  # shared_browser stays open
+        """
+        self._browser = browser
+        if browser is not self._watched_browser:
+            browser.on("disconnected", self._on_browser_disconnected)
+            self._watched_browser = browser
+
+        # Enhanced context with better stealth
+        self._context = await browser.new_context(
+            viewport={
+                "width": self.viewport_size[0],
+                "height": self.viewport_size[1],
+            },
+            user_agent=self.user_agent
+            or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            extra_http_headers={
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+                "Accept-Encoding": "gzip, deflate",
+                "DNT": "1",
+                "Connection": "keep-alive",
+                "Upgrade-Insecure-Requests": "1",
+            },
+            **self._har_record_options(),
+        )
+
+        # Add stealth JavaScript to mask headless detection
+        await self._context.add_init_script(self.STEALTH_INIT_SCRIPT)
+
+        if self.resource_blocker:
+            await self.resource_blocker.install(self._context, self.blocking_stats)
+        if self.har_replay:
+            # Installed last so it answers before any other route handler
+            await self.har_replay.install(self._context)
+
+        self._page = await self._context.new_page()
+        self._page.on("crash", self._on_page_crash)
+        if self.capture_responses:
+            self._capture = ResponseCapture(
+                accept=self._response_parser.is_search_response
+            )
+            self._capture.install(self._page)
+        self._page.set_default_timeout(self.timeout)
+        self._readiness = PageReadiness(self._page, max_wait_ms=self.readiness_timeout)
+
+        self._metrics = PageMetrics(self._context, self._page)
+        self._context_searches = 0
+        self._context_started = time.monotonic()
+        self._crashed = None
+
+    def _har_record_options(self) -> dict:
+        """Context options recording this context's traffic, if enabled."""
+        if not self.record_har:
+            return {}
+
+        path = self.record_har
+        if self._har_contexts:
+            # Later contexts must not overwrite the first recording
+            path = path.with_name(f"{path.stem}-{self._har_contexts}{path.suffix}")
+        self._har_contexts += 1
+        return record_options(path)
 
     async def close(self):
         """
         Close the browser and cleanup all resources.
 
         Safely closes the browser page, browser instance, and Playwright runtime.
-        This method is idempotent and safe to call multiple times.
+        This method is idempotent and safe to call multiple times. When the
+        scrapper was attached to a shared browser with attach(), only its own
+        context is closed.
 
         Should always be called after using the scrapper to prevent resource leaks,
         unless using the async context manager which handles cleanup automatically.
@@ -334,18 +838,173 @@ class ITAScrapper:
             ...     await scrapper.close()  # Always cleanup
         """
         try:
-            if self._page:
-                await self._page.close()
-            if self._browser:
+            await self._close_context()
+            if self.selector_registry:
+                # Persist what this scrapper's searches learned
+                self.selector_registry.save()
+
+            if self._browser and self._owns_browser:
                 await self._browser.close()
             if self._playwright:
                 await self._playwright.stop()
 
+            self._browser = None
+            self._playwright = None
+
             logger.info("Browser closed successfully")
 
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
 
+    async def _close_context(self):
+        """Close the page and context, leaving the browser running."""
+        await self.artifacts.drain()
+
+        # After a crash these fail; the resources are gone either way
+        for closable in (self._page, self._context):
+            if closable is None:
+                continue
+            try:
+                await closable.close()
+            except Exception as e:
+                if not self._crashed:
+                    raise
+                logger.debug(f"Ignoring error closing crashed {closable}: {e}")
+
+        self._page = None
+        self._readiness = None
+        self._capture = None
+        self._metrics = None
+        self._context = None
+        self._search_form_url = None
+
+    async def recycle_reason(self) -> Optional[str]:
+        """
+        Check the context against the recycle policy.
+
+        Returns:
+            Description of the exceeded limit, or None if the context can stay
+        """
+        if self.recycle_policy is None or self._context is None:
+            return None
+
+        memory = None
+        if self.recycle_policy.measures_memory and self._metrics:
+            memory = await self._metrics.js_heap_used()
+
+        return self.recycle_policy.reason(
+            self._context_searches,
+            time.monotonic() - self._context_started,
+            memory,
+        )
+
+    async def recycle(self):
+        """
+        Replace the browser context and page with fresh ones.
+
+        Everything the old page accumulated (DOM, JS heap, element handles,
+        cache and cookies) is released; the browser itself keeps running.
+
+        Raises:
+            ITAScrapperError: If the scrapper has no browser
+        """
+        if not self._browser:
+            raise ITAScrapperError("Browser not started. Call start() first.")
+
+        await self._close_context()
+        await self.attach(self._browser)
+        self.recycles += 1
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether the page and browser are usable (False after a crash)."""
+        return (
+            self._page is not None
+            and self._crashed is None
+            and self._browser is not None
+            and self._browser.is_connected()
+        )
+
+    def _on_page_crash(self, page: Page):
+        """Mark the scrapper unusable when its page crashes."""
+        if page is self._page:
+            logger.error("Browser page crashed")
+            self._crashed = "page crashed"
+
+    def _on_browser_disconnected(self, browser: Browser):
+        """Mark the scrapper unusable when its browser goes away."""
+        if browser is self._browser and self._page is not None:
+            logger.error("Browser disconnected")
+            self._crashed = "browser disconnected"
+
+    async def restart(self, browser: Optional[Browser] = None):
+        """
+        Rebuild the context and page after a crash.
+
+        A browser that is still connected only gets a fresh context. A dead
+        browser is relaunched, or reconnected to when the scrapper uses a
+        browser_endpoint. Scrappers attached to a shared browser (pools) cannot
+        do that themselves; their owner passes the replacement browser.
+
+        Args:
+            browser: Browser to rebuild the context in. Default: the current
+                browser, or a new one if it is gone
+
+        Raises:
+            ITAScrapperError: If the browser is gone and the scrapper cannot
+                replace it
+        """
+        reason = self._crashed = self._crashed or "restart requested"
+        await self._close_context()
+
+        if browser is None:
+            browser = self._browser
+            if browser is None or not browser.is_connected():
+                if not self._playwright:
+                    raise ITAScrapperError(
+                        "Browser disconnected; its owner must relaunch it"
+                    )
+                await self._open_browser()
+                browser = self._browser
+                self.browser_restarts += 1
+
+        await self.attach(browser)
+        self.restarts += 1
+        logger.warning(f"Browser context rebuilt after: {reason}")
+
+    async def _ensure_healthy(self):
+        """Restart after a crash noticed since the last search."""
+        if self._crashed or (self._page is not None and not self.is_healthy):
+            await self.restart()
+
+    async def _supervised(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a search, re-running it on a rebuilt context if the browser died.
+
+        Errors raised while the page and browser stay healthy are ordinary
+        search failures and propagate unchanged.
+        """
+        reruns = 0
+        while True:
+            await self._ensure_healthy()
+            try:
+                return await operation()
+            except Exception as e:
+                if self.is_healthy or reruns >= self.crash_restarts:
+                    raise
+                reruns += 1
+                logger.warning(
+                    f"Search interrupted ({self._crashed or 'browser lost'}), "
+                    f"re-running it after a restart: {e}"
+                )
+
+    async def _maybe_recycle(self):
+        """Recycle the context before a search if the policy says so."""
+        reason = await self.recycle_reason()
+        if reason:
+            logger.info(f"Recycling browser context after {reason}")
+            await self.recycle()
+
     async def search_flights(
         self,
         origin: str,
@@ -357,6 +1016,7 @@ class ITAScrapper:
         children: int = 0,
         infants: int = 0,
         max_results: int = 20,
+        deadline: Optional[float] = None,
     ) -> FlightResult:
         """
         Search for flights between two destinations with comprehensive options.
@@ -381,6 +1041,10 @@ class ITAScrapper:
             infants: Number of infant passengers (under 2). Default: 0
             max_results: Maximum number of flight results to return. Higher values
                 take longer to parse. Default: 20
+            deadline: Total time budget for the search in seconds, covering
+                navigation, form filling, retries and parsing. Every stage
+                shrinks its waits to fit and the search is cancelled when the
+                budget runs out. Default: None (no overall limit)
 
         Returns:
             FlightResult: Contains list of Flight objects, search parameters,
@@ -391,6 +1055,8 @@ class ITAScrapper:
             ITAScrapperError: If search parameters are invalid
             NavigationError: If unable to reach the booking site
             ParseError: If unable to parse search results
+            ITATimeoutError: If the deadline ran out; ``stage`` names the stage
+                that was running
             ValidationError: If Pydantic model validation fails
 
         Example:
@@ -426,11 +1092,125 @@ class ITAScrapper:
             - Weekend and holiday dates typically show higher prices
             - Business/First class may have fewer available flights
         """
-        # Validate inputs
+        search_params = self._build_search_params(
+            origin,
+            destination,
+            departure_date,
+            return_date,
+            cabin_class,
+            adults,
+            children,
+            infants,
+        )
+        return await self.search(search_params, max_results, deadline)
+
+    async def search_flights_stream(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: date,
+        return_date: Optional[date] = None,
+        cabin_class: CabinClass = CabinClass.ECONOMY,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        max_results: int = 20,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Flight]:
+        """
+        Search for flights and yield each flight as soon as it is parsed.
+
+        Takes the same arguments as search_flights(), but instead of returning
+        a FlightResult once every result has been parsed, yields Flight objects
+        one by one while later results may still be rendering. The full result
+        list is never held in memory. A deadline covers the whole iteration,
+        including the time the caller spends between flights.
+
+        Yields:
+            Flight objects in page order
+
+        Raises:
+            Same exceptions as search_flights()
+
+        Example:
+            >>> async for flight in scrapper.search_flights_stream(
+            ...     "JFK", "LAX", date(2024, 8, 15)
+            ... ):
+            ...     print(f"${flight.price}")
+        """
+        search_params = self._build_search_params(
+            origin,
+            destination,
+            departure_date,
+            return_date,
+            cabin_class,
+            adults,
+            children,
+            infants,
+        )
+
+        logger.info(f"Streaming flights from {origin} to {destination}")
+        budget = Deadline(deadline) if deadline is not None else None
+        # Flights already yielded cannot be taken back, so a crash mid-stream
+        # is not re-run; only a crash from an earlier search is recovered
+        await self._ensure_healthy()
+        await self._maybe_recycle()
+        self._begin_search(search_params)
+
+        await self._within(
+            budget,
+            lambda: self._open_search(
+                search_params, lambda: self._fill_search_form(search_params)
+            ),
+        )
+
+        # Parsing is only retried until the first flight has been yielded
+        streamed = 0
+        attempt = 0
+        while True:
+            attempt += 1
+            self.attempts["parse"] = attempt
+            if budget is not None:
+                budget.check("parse")
+
+            flights = self._iter_flight_results(max_results)
+            try:
+                while True:
+                    try:
+                        flight = await self._within(budget, flights.__anext__)
+                    except StopAsyncIteration:
+                        break
+                    streamed += 1
+                    yield flight
+                break
+            except ITATimeoutError:
+                raise
+            except Exception as e:
+                delay = self.retry_policy.next_delay(e, attempt, budget)
+                if streamed or delay is None:
+                    raise
+                logger.warning(f"Parsing failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+            finally:
+                await flights.aclose()
+        self._log_blocking_stats()
+
+    @staticmethod
+    def _build_search_params(
+        origin: str,
+        destination: str,
+        departure_date: date,
+        return_date: Optional[date],
+        cabin_class: CabinClass,
+        adults: int,
+        children: int,
+        infants: int,
+    ) -> SearchParams:
+        """Validate search_flights() arguments into SearchParams."""
         trip_type = TripType.ROUND_TRIP if return_date else TripType.ONE_WAY
 
         try:
-            search_params = SearchParams(
+            return SearchParams(
                 origin=origin,
                 destination=destination,
                 departure_date=departure_date,
@@ -444,16 +1224,58 @@ class ITAScrapper:
         except ValidationError as e:
             raise ITAScrapperError(f"Invalid search parameters: {e}")
 
-        logger.info(f"Searching flights from {origin} to {destination}")
+    async def search(
+        self,
+        search_params: Union[SearchParams, MultiCitySearchParams],
+        max_results: int = 20,
+        deadline: Optional[float] = None,
+    ) -> FlightResult:
+        """
+        Run a search described by a search parameters model.
 
-        # Navigate to flight search site
-        await self._navigate_to_flights()
+        Equivalent to search_flights() for SearchParams and to
+        search_multi_city() for MultiCitySearchParams. This is the entry point
+        used by batch searches, which are driven by parameter models.
+
+        Args:
+            search_params: Validated search parameters
+            max_results: Maximum number of results to return
 
-        # Fill search form
-        await self._fill_search_form(search_params)
+        Returns:
+            FlightResult containing found flights
+        """
+        if isinstance(search_params, MultiCitySearchParams):
+            return await self.search_multi_city(search_params, max_results, deadline)
+
+        budget = Deadline(deadline) if deadline is not None else None
+        return await self._within(
+            budget,
+            lambda: self._supervised(
+                lambda: self._search_one(search_params, max_results)
+            ),
+        )
 
-        # Wait for results and parse
-        flights = await self._parse_flight_results(max_results)
+    async def _search_one(
+        self, search_params: SearchParams, max_results: int
+    ) -> FlightResult:
+        """Run the stages of a one-way or round-trip search."""
+        logger.info(
+            f"Searching flights from {search_params.origin} "
+            f"to {search_params.destination}"
+        )
+        await self._maybe_recycle()
+        self._begin_search(search_params)
+
+        # Open the results directly, or navigate to the site and fill the form
+        await self._open_search(
+            search_params, lambda: self._fill_search_form(search_params)
+        )
+
+        # Wait for results and parse; a retry re-parses the same results page
+        flights = await self._run_stage(
+            "parse", lambda: self._parse_flight_results(max_results)
+        )
+        self._log_blocking_stats()
 
         return FlightResult(
             flights=flights,
@@ -465,6 +1287,7 @@ class ITAScrapper:
         self,
         search_params: MultiCitySearchParams,
         max_results: int = 20,
+        deadline: Optional[float] = None,
     ) -> FlightResult:
         """
         Search for multi-city flights.
@@ -472,25 +1295,42 @@ class ITAScrapper:
         Args:
             search_params: Multi-city search parameters
             max_results: Maximum number of results to return
+            deadline: Total time budget for the search in seconds.
+                Default: None (no overall limit)
 
         Returns:
             FlightResult containing found flights
         """
+        budget = Deadline(deadline) if deadline is not None else None
+        return await self._within(
+            budget,
+            lambda: self._supervised(
+                lambda: self._search_multi_city(search_params, max_results)
+            ),
+        )
+
+    async def _search_multi_city(
+        self, search_params: MultiCitySearchParams, max_results: int
+    ) -> FlightResult:
+        """Run the stages of a multi-city search."""
         logger.info(
             f"Searching multi-city flights with {len(search_params.segments)} segments"
         )
+        await self._maybe_recycle()
+        self._begin_search(search_params)
 
-        # Navigate to Google Flights
-        await self._navigate_to_flights()
+        async def fill_multi_city_form():
+            # Switch to multi-city mode and fill the segments
+            await self._switch_to_multi_city()
+            await self._fill_multi_city_form(search_params)
 
-        # Switch to multi-city mode
-        await self._switch_to_multi_city()
-
-        # Fill multi-city form
-        await self._fill_multi_city_form(search_params)
+        await self._open_search(search_params, fill_multi_city_form)
 
         # Wait for results and parse
-        flights = await self._parse_flight_results(max_results)
+        flights = await self._run_stage(
+            "parse", lambda: self._parse_flight_results(max_results)
+        )
+        self._log_blocking_stats()
 
         # Convert to regular SearchParams for compatibility
         first_segment = search_params.segments[0]
@@ -551,31 +1391,213 @@ class ITAScrapper:
             cabin_class=cabin_class,
         )
 
+    def _begin_search(self, search_params: Union[SearchParams, MultiCitySearchParams]):
+        """Reset per-search state at the start of a search."""
+        self._search_id = ArtifactRecorder.new_search_id()
+        self._row_indicators = ITAMatrixParser.row_indicators(search_params)
+        self._search_cabin = search_params.cabin_class
+        self.blocking_stats.reset()
+        self.attempts = {}
+        self._context_searches += 1
+        if self._capture:
+            self._capture.reset()
+        if self._page:
+            # A previous search may have shrunk the default to fit its deadline
+            self._page.set_default_timeout(self.timeout)
+
+    async def _within(
+        self, budget: Optional[Deadline], operation: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Await an operation under a search deadline.
+
+        The deadline is active while the operation runs, so every stage checks
+        it and shrinks its timeouts, and the operation is cancelled once the
+        budget is used up.
+
+        Raises:
+            ITATimeoutError: If the budget ran out, naming the stage it ran out in
+        """
+        if budget is None:
+            return await operation()
+
+        async def run():
+            with budget.activate():
+                return await operation()
+
+        try:
+            return await asyncio.wait_for(run(), budget.remaining)
+        except asyncio.TimeoutError:
+            if not budget.expired:
+                raise
+            # The page was abandoned mid-stage, so do not reuse it as a warm form
+            self._search_form_url = None
+            logger.warning(f"Search deadline exceeded during {budget.stage}")
+            raise budget.error() from None
+
+    async def _run_stage(
+        self,
+        stage: str,
+        operation: Callable[[], Awaitable[T]],
+        before_retry: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> T:
+        """Run a search stage under the retry policy, counting its attempts."""
+        deadline = current_deadline()
+        if deadline is not None and self._page:
+            self._page.set_default_timeout(deadline.clamp_ms(self.timeout))
+        return await self.retry_policy.call(
+            stage, operation, self.attempts, before_retry=before_retry
+        )
+
+    async def _open_search(
+        self,
+        search_params: Union[SearchParams, MultiCitySearchParams],
+        fill: Callable[[], Awaitable[None]],
+    ):
+        """
+        Start a search: through a deep link if possible, else through the form.
+
+        Args:
+            search_params: Search to start
+            fill: Coroutine function filling the search form, for the fallback
+        """
+        if self._deep_links_active:
+            if await self._run_stage(
+                "deep_link", lambda: self._open_deep_link(search_params)
+            ):
+                return
+            logger.warning("Deep link did not start a search, using the search form")
+            self._deep_link_failed = True
+
+        await self._run_stage("navigate", self._navigate_to_flights)
+        await self._submit_search_form(fill)
+
+    @property
+    def _deep_links_active(self) -> bool:
+        """Whether searches start from results links rather than the form."""
+        return self.deep_link and not self._deep_link_failed
+
+    async def _open_deep_link(
+        self, search_params: Union[SearchParams, MultiCitySearchParams]
+    ) -> bool:
+        """
+        Navigate to the results link of a search.
+
+        Returns:
+            True once the page has sent the search request, False if it loaded
+            without starting a search (the link format was not understood)
+
+        Raises:
+            NavigationError: If the results page cannot be loaded
+        """
+        if not self._page:
+            raise ITAScrapperError("Browser not started. Call start() first.")
+
+        url = build_search_url(search_params)
+        logger.debug(f"Opening search results link: {url}")
+        await self._throttle(url)
+        # Links do not leave the search form loaded for warm sessions
+        self._search_form_url = None
+
+        search_started = asyncio.get_running_loop().create_future()
+
+        def on_request(request):
+            if SEARCH_API_PATTERN.search(request.url) and not search_started.done():
+                search_started.set_result(True)
+
+        self._page.on("request", on_request)
+        try:
+            try:
+                response = await self._page.goto(
+                    url, wait_until="domcontentloaded", timeout=clamp_timeout(30000)
+                )
+            except PlaywrightTimeoutError as e:
+                raise NavigationError(f"Timed out opening search results link: {e}")
+            if response and response.status >= 400:
+                raise NavigationError(
+                    f"HTTP {response.status} error opening search results link",
+                    status_code=response.status,
+                )
+
+            # The app loaded; a link it understands makes it ask for results
+            # soon, so do not wait out the whole search timeout for one
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(search_started),
+                    clamp_timeout(self.DEEP_LINK_START_TIMEOUT) / 1000,
+                )
+            except asyncio.TimeoutError:
+                return False
+        finally:
+            self._page.remove_listener("request", on_request)
+            search_started.cancel()
+
+        return True
+
+    async def _submit_search_form(self, fill: Callable[[], Awaitable[None]]):
+        """
+        Fill and submit the search form as a retryable stage.
+
+        A failed attempt may leave the form half filled, so a retry first loads
+        a fresh search form instead of reusing the current page.
+        """
+
+        async def discard_form():
+            self._search_form_url = None
+
+        async def submit():
+            if self._search_form_url is None:
+                await self._navigate_to_flights()
+            await fill()
+
+        await self._run_stage("search_form", submit, before_retry=discard_form)
+
+    def _log_blocking_stats(self):
+        """Report what resource blocking saved during the search."""
+        if self.resource_blocker:
+            logger.info(
+                f"Blocked {self.blocking_stats.blocked_requests} requests, "
+                f"~{self.blocking_stats.bytes_saved // 1024} KiB saved"
+            )
+
+    async def _throttle(self, url: str):
+        """Wait for the rate limiter before a request to the URL's host."""
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(url)
+
     async def _navigate_to_flights(self):
         """Navigate to flight search homepage (ITA Matrix or Google Flights)."""
         if not self._page:
             raise ITAScrapperError("Browser not started. Call start() first.")
 
+        if self.warm_session and await self._restore_search_form():
+            return
+
         try:
             logger.debug(f"Navigating to: {self.base_url}")
+            await self._throttle(self.base_url)
 
             # First, just navigate to the page
             response = await self._page.goto(
-                self.base_url, wait_until="domcontentloaded", timeout=30000
+                self.base_url,
+                wait_until="domcontentloaded",
+                timeout=clamp_timeout(30000),
             )
 
             if response and response.status >= 400:
                 raise NavigationError(
-                    f"HTTP {response.status} error accessing {self.base_url}"
+                    f"HTTP {response.status} error accessing {self.base_url}",
+                    status_code=response.status,
                 )
 
-            # Wait a bit for JavaScript to load - longer delay for headless mode
-            initial_delay = 8000 if self.headless else 5000
-            await self._page.wait_for_timeout(initial_delay)
+            # Wait for the app to bootstrap and render the search form
+            await self._readiness.wait_until_ready(selector=self._search_form_selector)
 
             # Take a screenshot for debugging
-            await self._page.screenshot(
-                path=f"debug_{'matrix' if self.use_matrix else 'google'}.png"
+            self.artifacts.capture(
+                self._page,
+                self._search_id,
+                f"landing-{'matrix' if self.use_matrix else 'google'}",
             )
 
             # Get page info for debugging
@@ -583,11 +1605,98 @@ class ITAScrapper:
             url = self._page.url
             logger.info(f"Page loaded - Title: {title}, URL: {url}")
 
+            self._search_form_url = url
+
+        except NavigationError:
+            raise
         except Exception as e:
             site_name = "ITA Matrix" if self.use_matrix else "Google Flights"
             logger.error(f"Failed to navigate to {site_name}: {e}")
             raise NavigationError(f"Failed to navigate to {site_name}: {e}")
 
+    async def prewarm(self) -> bool:
+        """
+        Load the search form ahead of the next search.
+
+        Downloads and bootstraps the site (or returns a used page to its form)
+        now, so the next search starts on a ready form instead of paying for
+        the app bootstrap. Only useful with warm_session, as otherwise every
+        search navigates afresh, and not while searches start from deep links,
+        which navigate straight to the results and never use the form.
+
+        Returns:
+            True if the page is parked on a ready search form
+
+        Example:
+            >>> scrapper = ITAScrapper(warm_session=True)
+            >>> await scrapper.start()
+            >>> await scrapper.prewarm()  # while waiting for the next request
+        """
+        if not self.warm_session or self._deep_links_active:
+            return False
+
+        try:
+            await self._navigate_to_flights()
+            return True
+        except Exception as e:
+            logger.debug(f"Prewarming failed: {e}")
+            self._search_form_url = None
+            return False
+
+    @property
+    def _search_form_selector(self) -> str:
+        """Selector of the origin field, present once the search form is usable."""
+        if self.use_matrix:
+            return 'matrix-location-field[formcontrolname="origin"] input'
+        return 'input[aria-label="Where from?"]'
+
+    async def _restore_search_form(self) -> bool:
+        """
+        Bring a warm page back to the already loaded search form.
+
+        Uses history navigation so the single-page app is not downloaded and
+        bootstrapped again. The restored form still holds the previous search
+        (airport chips, dates), so it is reset and checked to be empty before
+        reuse. Returns False when there is no warm form to return to or it
+        could not be restored or cleared, in which case the caller performs a
+        regular navigation.
+        """
+        if not self._search_form_url:
+            return False
+
+        try:
+            if self._page.url != self._search_form_url:
+                logger.debug(f"Returning to search form from {self._page.url}")
+                await self._throttle(self._search_form_url)
+                await self._page.go_back(
+                    wait_until="domcontentloaded", timeout=clamp_timeout(10000)
+                )
+
+            if self._page.url != self._search_form_url:
+                logger.debug(f"Back navigation ended on {self._page.url}")
+                self._search_form_url = None
+                return False
+
+            await self._page.wait_for_selector(
+                self._search_form_selector, timeout=clamp_timeout(5000)
+            )
+
+            await self._page.evaluate(_RESET_SEARCH_FORM_JS)
+            await self._readiness.settle(300)
+            leftovers = await self._page.evaluate(_SEARCH_FORM_LEFTOVERS_JS)
+            if leftovers:
+                logger.debug(f"Warm search form kept previous values: {leftovers}")
+                self._search_form_url = None
+                return False
+
+            logger.info("Reusing warm search form")
+            return True
+
+        except Exception as e:
+            logger.debug(f"Could not restore warm search form: {e}")
+            self._search_form_url = None
+            return False
+
     async def _fill_search_form(self, params: SearchParams):
         """Fill the flight search form with proper selectors based on exploration."""
         try:
@@ -598,7 +1707,33 @@ class ITAScrapper:
 
         except Exception as e:
             logger.error(f"Failed to fill search form: {e}")
-            raise ITAScrapperError(f"Failed to fill search form: {e}")
+            raise ParseError(f"Failed to fill search form: {e}")
+
+    async def _ordered_selectors(self, step: str, selectors: list[str]) -> list[str]:
+        """
+        A step's selectors, those that worked before first.
+
+        Args:
+            step: Name of the form step, the key of its statistics
+            selectors: The step's selectors in their default order
+
+        Returns:
+            The selectors as ordered by the selector registry, or unchanged
+            without one
+        """
+        if not self.selector_registry:
+            return selectors
+        self._selector_fingerprint = await self.selector_registry.fingerprint(
+            self._page
+        )
+        return self.selector_registry.order(self._selector_fingerprint, step, selectors)
+
+    def _record_selector(self, step: str, selector: str, hit: bool):
+        """Tell the selector registry whether a selector of a step worked."""
+        if self.selector_registry and self._selector_fingerprint:
+            self.selector_registry.record(
+                self._selector_fingerprint, step, selector, hit
+            )
 
     async def _fill_matrix_form(self, params: SearchParams):
         """Fill ITA Matrix search form using correct selectors from exploration."""
@@ -620,42 +1755,39 @@ class ITAScrapper:
             ]
 
             origin_filled = False
-            for selector in origin_selectors:
+            for selector in await self._ordered_selectors("origin", origin_selectors):
                 try:
                     origin_input = await self._page.wait_for_selector(
-                        selector, timeout=3000
+                        selector, timeout=clamp_timeout(3000)
                     )
                     # Angular Material form interaction - proper focus and event handling
                     await origin_input.click()
-                    await self._page.wait_for_timeout(200)
 
                     # Clear any existing value first
                     await origin_input.fill("")
-                    await self._page.wait_for_timeout(100)
 
                     # Type the airport code to trigger Angular's autocomplete
                     await origin_input.type(params.origin, delay=50)
-                    await self._page.wait_for_timeout(
-                        600
-                    )  # Wait for Angular autocomplete
 
                     # Handle Angular Material autocomplete selection
                     try:
-                        # Look for autocomplete options and select first one
+                        # Wait for autocomplete options and select first one
                         autocomplete_option = await self._page.wait_for_selector(
                             ".mat-mdc-autocomplete-panel .mat-mdc-option:first-child",
-                            timeout=2000,
+                            timeout=clamp_timeout(2000),
                         )
                         await autocomplete_option.click()
-                        await self._page.wait_for_timeout(200)
+                        await self._readiness.settle(200)
                     except:
                         # If no autocomplete, just press Tab to move to next field
                         await self._page.keyboard.press("Tab")
 
                     origin_filled = True
+                    self._record_selector("origin", selector, hit=True)
                     logger.info(f"Filled origin with selector: {selector}")
                     break
                 except Exception as e:
+                    self._record_selector("origin", selector, hit=False)
                     logger.debug(f"Origin selector {selector} failed: {e}")
                     continue
 
@@ -675,42 +1807,41 @@ class ITAScrapper:
             ]
 
             destination_filled = False
-            for selector in destination_selectors:
+            for selector in await self._ordered_selectors(
+                "destination", destination_selectors
+            ):
                 try:
                     destination_input = await self._page.wait_for_selector(
-                        selector, timeout=3000
+                        selector, timeout=clamp_timeout(3000)
                     )
                     # Angular Material form interaction - proper focus and event handling
                     await destination_input.click()
-                    await self._page.wait_for_timeout(200)
 
                     # Clear any existing value first
                     await destination_input.fill("")
-                    await self._page.wait_for_timeout(100)
 
                     # Type the airport code to trigger Angular's autocomplete
                     await destination_input.type(params.destination, delay=50)
-                    await self._page.wait_for_timeout(
-                        600
-                    )  # Wait for Angular autocomplete
 
                     # Handle Angular Material autocomplete selection
                     try:
-                        # Look for autocomplete options and select first one
+                        # Wait for autocomplete options and select first one
                         autocomplete_option = await self._page.wait_for_selector(
                             ".mat-mdc-autocomplete-panel .mat-mdc-option:first-child",
-                            timeout=2000,
+                            timeout=clamp_timeout(2000),
                         )
                         await autocomplete_option.click()
-                        await self._page.wait_for_timeout(200)
+                        await self._readiness.settle(200)
                     except:
                         # If no autocomplete, just press Tab to move to next field
                         await self._page.keyboard.press("Tab")
 
                     destination_filled = True
+                    self._record_selector("destination", selector, hit=True)
                     logger.info(f"Filled destination with selector: {selector}")
                     break
                 except Exception as e:
+                    self._record_selector("destination", selector, hit=False)
                     logger.debug(f"Destination selector {selector} failed: {e}")
                     continue
 
@@ -721,7 +1852,7 @@ class ITAScrapper:
             await self._handle_matrix_dates(params)
 
             # Wait a moment for the form to update
-            await self._page.wait_for_timeout(500)
+            await self._readiness.settle(500)
 
             # Submit the search
             await self._submit_matrix_search()
@@ -751,19 +1882,19 @@ class ITAScrapper:
                 try:
                     # Click outside to ensure any calendars are closed
                     await self._page.click("body", position={"x": 100, "y": 100})
-                    await self._page.wait_for_timeout(500)
+                    await self._readiness.settle(500)
                 except:
                     pass
 
             # Final cleanup - close any remaining calendars
             await self._page.keyboard.press("Escape")
-            await self._page.wait_for_timeout(1000)
+            await self._readiness.settle(1000)
 
         except Exception as e:
             logger.error(f"Failed to handle Matrix dates: {e}")
             # Try to close any open calendars
             await self._page.keyboard.press("Escape")
-            await self._page.wait_for_timeout(500)
+            await self._readiness.settle(500)
             raise
 
     async def _set_trip_type(self, is_round_trip: bool):
@@ -782,19 +1913,23 @@ class ITAScrapper:
                     'div.mat-mdc-tab:has-text("Round Trip")',
                 ]
 
-                for selector in round_trip_selectors:
+                for selector in await self._ordered_selectors(
+                    "round_trip", round_trip_selectors
+                ):
                     try:
                         round_trip_tab = await self._page.wait_for_selector(
-                            selector, timeout=2000
+                            selector, timeout=clamp_timeout(2000)
                         )
                         if round_trip_tab:
                             await round_trip_tab.click()
+                            self._record_selector("round_trip", selector, hit=True)
                             logger.info(
                                 f"Selected Round Trip tab with selector: {selector}"
                             )
-                            await self._page.wait_for_timeout(500)
+                            await self._readiness.settle(500)
                             return
                     except:
+                        self._record_selector("round_trip", selector, hit=False)
                         continue
 
                 logger.debug(
@@ -814,10 +1949,12 @@ class ITAScrapper:
                     'div.mat-mdc-tab:has-text("One Way")',
                 ]
 
-                for selector in one_way_selectors:
+                for selector in await self._ordered_selectors(
+                    "one_way", one_way_selectors
+                ):
                     try:
                         one_way_tab = await self._page.wait_for_selector(
-                            selector, timeout=2000
+                            selector, timeout=clamp_timeout(2000)
                         )
                         if one_way_tab:
                             # Check if it's visible and enabled
@@ -829,13 +1966,14 @@ class ITAScrapper:
                                 logger.info(
                                     f"Selected One Way tab with selector: {selector}"
                                 )
-                                await self._page.wait_for_timeout(500)
+                                await self._readiness.settle(500)
 
                                 # Verify the click worked
                                 aria_selected = await one_way_tab.get_attribute(
                                     "aria-selected"
                                 )
                                 if aria_selected == "true":
+                                    self._record_selector("one_way", selector, hit=True)
                                     logger.info("One Way tab successfully selected")
                                     return
                                 logger.warning(
@@ -846,6 +1984,7 @@ class ITAScrapper:
                                     f"One Way tab not clickable: visible={is_visible}, enabled={is_enabled}"
                                 )
                     except Exception as e:
+                        self._record_selector("one_way", selector, hit=False)
                         logger.debug(f"One Way selector {selector} failed: {e}")
                         continue
 
@@ -897,223 +2036,9 @@ class ITAScrapper:
         try:
             # Close any existing overlays first
             await self._page.keyboard.press("Escape")
-            await self._page.wait_for_timeout(300)
-
-            # Use different selectors based on whether it's one-way or round-trip
-            # One-way mode uses different input structure than round-trip mode
-            if is_departure:
-                # For departure date, use Angular Material specific selectors (no placeholder text!)
-                date_selectors = [
-                    # Most specific Angular Material date picker selectors first
-                    'input[data-mat-calendar="mat-datepicker-1"]',  # Specific calendar attribute
-                    'input.mat-datepicker-input[id="mat-input-12"]',  # Specific ID from HTML
-                    # Angular Material date picker class combinations
-                    "input.mat-datepicker-input.mat-mdc-input-element",
-                    "input.mat-mdc-form-field-input-control.mat-datepicker-input",
-                    ".mat-datepicker-input",  # Angular Material date picker input
-                    "input.mat-datepicker-input",  # More specific Angular Material selector
-                    ".mat-mdc-input-element.mat-datepicker-input",  # Full Angular Material chain
-                    # Form field context selectors
-                    ".mat-mdc-form-field.date-field input",
-                    "mat-form-field.date-field input",
-                    # Generic Angular Material input selectors
-                    ".mat-start-date",  # Round-trip mode
-                    "input.mat-start-date",
-                    "input[matstartdate]",
-                    # Data attribute selectors
-                    "input[data-mat-calendar]",  # Angular Material calendar attribute
-                    # Fallback placeholder-based selectors (may not exist)
-                    'input[placeholder="Start date"]',  # Round-trip mode
-                    'input[placeholder="Departure"]',  # One-way mode
-                    'input[placeholder*="depart" i]',  # Case insensitive departure
-                    'input[placeholder*="date" i]',  # Any input with "date" in placeholder
-                    # Aria and name attribute selectors for dates
-                    'input[type="text"][aria-label*="date" i]',  # Inputs with "date" in aria-label
-                    'input[type="text"][name*="date" i]',  # Inputs with "date" in name attribute
-                    # Last resort: any text input that's not airport/city/address related
-                    'input[type="text"]:not([placeholder*="Add airport"])'
-                    ':not([placeholder*="city" i]):not([placeholder*="address" i])'
-                    ':not([placeholder*="sales" i]):not([placeholder*="billing" i])',
-                ]
-            else:
-                # For return date, use Angular Material specific selectors (round-trip only)
-                date_selectors = [
-                    # Most specific Angular Material return date selectors
-                    'input[data-mat-calendar="mat-datepicker-2"]',  # Specific return calendar attribute
-                    'input.mat-datepicker-input[id="mat-input-13"]',  # Typical return date ID
-                    # Angular Material return date class combinations
-                    "input.mat-datepicker-input.mat-end-date",
-                    "input.mat-datepicker-input.mat-end-date",  # More specific return date
-                    ".mat-datepicker-input.mat-end-date",  # Angular Material return date
-                    # Traditional mat-end-date selectors
-                    ".mat-end-date",  # Traditional mat-end-date class
-                    "input.mat-end-date",
-                    "input[matenddate]",
-                    # Form field context for return dates
-                    ".mat-mdc-form-field.date-field:nth-of-type(2) input",
-                    # Placeholder-based selectors for return date
-                    'input[placeholder="End date"]',
-                    'input[placeholder="Return"]',
-                    'input[placeholder*="return" i]',  # Case insensitive return
-                ]
-
-            date_input = None
-            successful_selector = None
-
-            for selector in date_selectors:
-                try:
-                    # Check if the element exists and is visible
-                    elements = await self._page.query_selector_all(selector)
-                    for element in elements:
-                        is_visible = await element.is_visible()
-                        is_enabled = await element.is_enabled()
-
-                        if is_visible and is_enabled:
-                            # Additional check: make sure it's not the airport input or other non-date fields
-                            placeholder = (
-                                await element.get_attribute("placeholder") or ""
-                            )
-                            aria_label = await element.get_attribute("aria-label") or ""
-                            name_attr = await element.get_attribute("name") or ""
-                            class_attr = await element.get_attribute("class") or ""
-
-                            # Combine all attributes for comprehensive checking
-                            all_attrs = (
-                                placeholder
-                                + " "
-                                + aria_label
-                                + " "
-                                + name_attr
-                                + " "
-                                + class_attr
-                            ).lower()
-
-                            # Exclude fields that are clearly not date inputs
-                            excluded_keywords = [
-                                "airport",
-                                "city",
-                                "address",
-                                "sales",
-                                "billing",
-                                "street",
-                                "zip",
-                                "postal",
-                                "phone",
-                                "email",
-                                "name",
-                                "company",
-                                "organization",
-                                "contact",
-                            ]
-
-                            # Check if this field should be excluded
-                            is_excluded = any(
-                                keyword in all_attrs for keyword in excluded_keywords
-                            )
-
-                            # Prefer fields that have date-related indicators
-                            has_date_indicators = any(
-                                indicator in all_attrs
-                                for indicator in [
-                                    "date",
-                                    "depart",
-                                    "departure",
-                                    "start",
-                                    "calendar",
-                                    "end",
-                                    "return",
-                                    "mat-datepicker",
-                                    "datepicker",
-                                    "mat-input",
-                                ]
-                            )
-
-                            if not is_excluded and (
-                                has_date_indicators or selector != date_selectors[-1]
-                            ):
-                                # Either it has date indicators, or it's not the last-resort selector
-                                date_input = element
-                                successful_selector = selector
-                                break
-
-                    if date_input:
-                        break
-
-                except Exception as e:
-                    logger.debug(f"Date selector {selector} failed: {e}")
-                    continue
-
-            if not date_input:
-                # Last resort: try to find any date input by looking for date-related attributes
-                all_inputs = await self._page.query_selector_all('input[type="text"]')
-                for input_elem in all_inputs:
-                    try:
-                        placeholder = (
-                            await input_elem.get_attribute("placeholder") or ""
-                        )
-                        class_name = await input_elem.get_attribute("class") or ""
-                        aria_label = await input_elem.get_attribute("aria-label") or ""
-                        name_attr = await input_elem.get_attribute("name") or ""
-
-                        # Combine all attributes for comprehensive checking
-                        all_attrs = (
-                            placeholder
-                            + " "
-                            + class_name
-                            + " "
-                            + aria_label
-                            + " "
-                            + name_attr
-                        ).lower()
-
-                        # Look for date-related hints
-                        date_keywords = [
-                            "date",
-                            "depart",
-                            "departure",
-                            "return",
-                            "start",
-                            "end",
-                            "calendar",
-                            "mat-datepicker",
-                            "datepicker",
-                            "mat-input",
-                        ]
-                        has_date_hints = any(
-                            keyword in all_attrs for keyword in date_keywords
-                        )
-
-                        # Exclude non-date fields
-                        excluded_keywords = [
-                            "airport",
-                            "city",
-                            "address",
-                            "sales",
-                            "billing",
-                            "street",
-                            "zip",
-                            "postal",
-                            "phone",
-                            "email",
-                            "name",
-                            "company",
-                            "organization",
-                            "contact",
-                        ]
-                        is_excluded = any(
-                            keyword in all_attrs for keyword in excluded_keywords
-                        )
+            await self._readiness.settle(300)
 
-                        if has_date_hints and not is_excluded:
-                            is_visible = await input_elem.is_visible()
-                            is_enabled = await input_elem.is_enabled()
-
-                            if is_visible and is_enabled:
-                                date_input = input_elem
-                                successful_selector = "date-keyword-based"
-                                break
-                    except Exception:
-                        continue
+            date_input, successful_selector = await self._find_date_input(is_departure)
 
             if not date_input:
                 raise Exception(
@@ -1126,13 +2051,13 @@ class ITAScrapper:
 
             # Now click the date input - Angular Material specific interaction
             await date_input.click()
-            await self._page.wait_for_timeout(500)
+            await self._readiness.settle(500)
 
             # Clear any existing value - Angular Material inputs need proper clearing
             await date_input.focus()
             await self._page.keyboard.press("Control+a")
             await self._page.keyboard.press("Delete")
-            await self._page.wait_for_timeout(300)
+            await self._readiness.settle(300)
 
             # Type the date slowly to avoid Angular Material validation issues
             formatted_date = target_date.strftime("%m/%d/%Y")
@@ -1146,21 +2071,21 @@ class ITAScrapper:
 
             # For Angular Material, we need to trigger change events properly
             await self._page.keyboard.press("Tab")
-            await self._page.wait_for_timeout(500)
+            await self._readiness.settle(500)
 
             # Try to close any Angular Material calendar overlay
             try:
                 await self._page.keyboard.press("Escape")
-                await self._page.wait_for_timeout(300)
+                await self._readiness.settle(300)
             except:
                 pass
 
             # If this is a return date, give extra time for Angular animations
             if not is_departure:
-                await self._page.wait_for_timeout(1000)
+                await self._readiness.settle(1000)
                 # Click outside to ensure Angular Material calendar closes
                 await self._page.click("body", position={"x": 200, "y": 200})
-                await self._page.wait_for_timeout(500)
+                await self._readiness.settle(500)
 
         except Exception as e:
             logger.warning(
@@ -1169,7 +2094,54 @@ class ITAScrapper:
             # Cleanup: try to close any open calendars
             await self._page.keyboard.press("Escape")
             await self._page.click("body", position={"x": 100, "y": 100})
-            await self._page.wait_for_timeout(500)
+            await self._readiness.settle(500)
+
+    async def _find_date_input(
+        self, is_departure: bool
+    ) -> tuple[Optional[ElementHandle], Optional[str]]:
+        """
+        Find the departure or return date input in a single page call.
+
+        Scoring every candidate from Python took an is_visible, an is_enabled
+        and four get_attribute round trips per element across some 20
+        selectors; the same rules now run in the page. Selectors that found
+        the input before are tried first (see SelectorRegistry).
+
+        Args:
+            is_departure: Find the departure input rather than the return one
+
+        Returns:
+            The input and the selector that found it, or (None, None)
+        """
+        step = "departure_date" if is_departure else "return_date"
+        defaults = DEPARTURE_DATE_SELECTORS if is_departure else RETURN_DATE_SELECTORS
+        # The catch-all keeps its place: it needs a date indicator to match
+        selectors = await self._ordered_selectors(step, defaults[:-1])
+        selectors.append(defaults[-1])
+
+        found = await self._page.evaluate_handle(
+            _DATE_INPUT_JS,
+            {
+                "selectors": selectors,
+                "excluded": DATE_EXCLUDED_KEYWORDS,
+                "indicators": DATE_INDICATORS,
+            },
+        )
+        try:
+            properties = await found.get_properties()
+            element = properties["0"].as_element()
+            selector = await properties["1"].json_value()
+            missed = await properties["2"].json_value()
+        finally:
+            await found.dispose()
+
+        learned = selectors[:-1]
+        for miss in missed:
+            if miss in learned:
+                self._record_selector(step, miss, hit=False)
+        if selector in learned:
+            self._record_selector(step, selector, hit=True)
+        return element, selector
 
     async def _submit_matrix_search(self):
         """Submit the ITA Matrix search form."""
@@ -1189,17 +2161,21 @@ class ITAScrapper:
                 'button[aria-label*="Find"]',
             ]
 
+            await self._throttle(self.base_url)
+
             search_submitted = False
-            for selector in search_selectors:
+            for selector in await self._ordered_selectors("submit", search_selectors):
                 try:
                     search_button = await self._page.wait_for_selector(
-                        selector, timeout=2000
+                        selector, timeout=clamp_timeout(2000)
                     )
                     await search_button.click()
                     search_submitted = True
+                    self._record_selector("submit", selector, hit=True)
                     logger.info(f"Submitted search using selector: {selector}")
                     break
                 except Exception as e:
+                    self._record_selector("submit", selector, hit=False)
                     logger.debug(f"Search selector {selector} failed: {e}")
                     continue
 
@@ -1281,11 +2257,13 @@ class ITAScrapper:
                 '[data-testid="search-button"]',
             ]
 
+            await self._throttle(self.base_url)
+
             search_submitted = False
             for selector in search_selectors:
                 try:
                     search_button = await self._page.wait_for_selector(
-                        selector, timeout=2000
+                        selector, timeout=clamp_timeout(2000)
                     )
                     await search_button.click()
                     search_submitted = True
@@ -1306,10 +2284,12 @@ class ITAScrapper:
 
             # Wait for results to load
             if self.use_matrix:
-                await self._page.wait_for_selector(".itinerary", timeout=30000)
+                await self._page.wait_for_selector(
+                    ".itinerary", timeout=clamp_timeout(30000)
+                )
             else:
                 await self._page.wait_for_selector(
-                    '[data-testid="flight-card"]', timeout=30000
+                    '[data-testid="flight-card"]', timeout=clamp_timeout(30000)
                 )
 
         except Exception as e:
@@ -1375,19 +2355,86 @@ class ITAScrapper:
 
     async def _parse_flight_results(self, max_results: int) -> list[Flight]:
         """Parse flight results from the page."""
-        flights = []
+        return [flight async for flight in self._iter_flight_results(max_results)]
+
+    async def harvest_session(self, search_params: SearchParams) -> MatrixSession:
+        """
+        Run a search and record its search API request for ITAHttpEngine.
+
+        Args:
+            search_params: Search to run; any valid search works
+
+        Returns:
+            MatrixSession replaying the request this search sent
+
+        Raises:
+            ParseError: If the search API request could not be captured
+        """
+        if not self.capture_responses:
+            raise ITAScrapperError("Harvesting a session needs capture_responses")
+
+        await self.search(search_params, max_results=1)
+        if self._capture is None or self._capture.request is None:
+            raise ParseError("No search API request seen during the search")
+        return await MatrixSession.from_request(self._capture.request)
+
+    async def _captured_flights(self, max_results: int) -> Optional[list[Flight]]:
+        """
+        Map the captured search API response of this search to flights.
+
+        Returns:
+            The flights, possibly none when the search found nothing, or None
+            when no response was captured or none of its solutions could be
+            mapped, so the page has to be parsed instead
+        """
+        payload = await self._capture.wait(
+            clamp_timeout(self.timeout),
+            rendered=self._page.wait_for_selector(
+                '[role="tooltip"]', timeout=clamp_timeout(self.timeout)
+            ),
+        )
+        if payload is None:
+            return None
+        flights = self._response_parser.parse_search_response(
+            payload, max_results, self._search_cabin
+        )
+        solutions = (payload.get("solutionList") or {}).get("solutions")
+        if solutions and not flights:
+            return None
+        return flights
+
+    async def _iter_flight_results(self, max_results: int) -> AsyncIterator[Flight]:
+        """Parse flight results from the page, yielding each flight once parsed."""
+        parsed = 0
+        started = time.monotonic()
 
         try:
+            if self._capture:
+                flights = await self._captured_flights(max_results)
+                if flights is not None:
+                    # An empty solution list means the search found nothing
+                    for flight in flights:
+                        yield flight
+                    return
+                logger.info("No usable search API response, parsing the page")
+
             if self.use_matrix and self._parser:
                 # Use enhanced ITA Matrix parser
                 logger.info("Using enhanced ITA Matrix parser...")
-                flights = await self._parser.parse_flight_results(
-                    self._page, max_results
-                )
-
-                if flights:
-                    logger.info(f"Enhanced parser found {len(flights)} flights")
-                    return flights
+                # Waiting for a capture already used part of the results timeout
+                remaining = self.timeout - (time.monotonic() - started) * 1000
+                async for flight in self._parser.iter_flight_results(
+                    self._page,
+                    max_results,
+                    self._row_indicators,
+                    wait_timeout=max(remaining, 0),
+                ):
+                    parsed += 1
+                    yield flight
+
+                if parsed:
+                    logger.info(f"Enhanced parser found {parsed} flights")
+                    return
                 logger.warning(
                     "Enhanced parser found no flights, falling back to basic parsing"
                 )
@@ -1412,7 +2459,9 @@ class ITAScrapper:
                 flight_cards = []
                 for selector in result_selectors:
                     try:
-                        await self._page.wait_for_selector(selector, timeout=10000)
+                        await self._page.wait_for_selector(
+                            selector, timeout=clamp_timeout(10000)
+                        )
                         cards = await self._page.query_selector_all(selector)
                         if cards:
                             flight_cards = cards
@@ -1426,7 +2475,9 @@ class ITAScrapper:
 
                 if not flight_cards:
                     # If no specific results found, take a screenshot and check page state
-                    await self._page.screenshot(path="no_results_found.png")
+                    self.artifacts.capture(
+                        self._page, self._search_id, "no-results", failure=True
+                    )
                     logger.warning("No flight results found with any selector")
 
                     # Check if there's an error message or if we need to wait longer
@@ -1436,11 +2487,11 @@ class ITAScrapper:
                         or "no results" in page_text.lower()
                     ):
                         logger.info("Search returned no flights")
-                        return []
+                        return
 
                     # Try a longer wait in case results are still loading
                     logger.info("Waiting longer for results to appear...")
-                    await self._page.wait_for_timeout(10000)
+                    await self._readiness.wait_until_ready(timeout_ms=10000)
 
                     # Try again with broader selectors
                     broad_selectors = ["div", "tr", "li"]
@@ -1458,7 +2509,7 @@ class ITAScrapper:
             else:
                 # Google Flights parsing (unchanged)
                 await self._page.wait_for_selector(
-                    '[data-testid="flight-card"]', timeout=30000
+                    '[data-testid="flight-card"]', timeout=clamp_timeout(30000)
                 )
                 flight_cards = await self._page.query_selector_all(
                     '[data-testid="flight-card"]'
@@ -1468,27 +2519,25 @@ class ITAScrapper:
             for i, card in enumerate(flight_cards[:max_results]):
                 try:
                     flight = await self._parse_flight_card(card)
-                    if flight:
-                        flights.append(flight)
                 except Exception as e:
                     logger.warning(f"Failed to parse flight card {i}: {e}")
                     continue
+                if flight:
+                    parsed += 1
+                    yield flight
 
-            logger.info(f"Parsed {len(flights)} flights")
+            logger.info(f"Parsed {parsed} flights")
 
             # If we still have no flights, create demo flights as fallback
-            if not flights and self.use_matrix:
-                logger.warning(
-                    "No flights parsed from ITA Matrix, generating demo data"
-                )
-                # For now, return empty list instead of demo data since user doesn't want demo mode
-                return []
-
-            return flights
+            if not parsed and self.use_matrix:
+                # For now, yield nothing instead of demo data since user doesn't want demo mode
+                logger.warning("No flights parsed from ITA Matrix")
 
         except Exception as e:
             logger.error(f"Failed to parse flight results: {e}")
-            await self._page.screenshot(path="parse_error.png")
+            self.artifacts.capture(
+                self._page, self._search_id, "parse-error", failure=True
+            )
             raise ParseError(f"Failed to parse flight results: {e}")
 
     async def _parse_flight_card(self, card) -> Optional[Flight]:
@@ -1628,10 +2677,13 @@ class ITAScrapper:
         """Check if the target site is accessible and not blocking us."""
         try:
             logger.debug(f"Checking accessibility of {self.base_url}")
+            await self._throttle(self.base_url)
 
             # Try a simple navigation first
             response = await self._page.goto(
-                self.base_url, wait_until="domcontentloaded", timeout=15000
+                self.base_url,
+                wait_until="domcontentloaded",
+                timeout=clamp_timeout(15000),
             )
 
             # Check response status
@@ -0,0 +1,266 @@
+"""
+Learned ordering of fallback selectors, persisted across runs.
+
+Form filling and result parsing try long ordered selector lists because the
+ITA Matrix markup changes between deployments. Every selector that misses
+before the one that works costs a wait_for_selector timeout of a few seconds,
+on every search. A SelectorRegistry remembers, for each step, which selector
+hit and which missed, and reorders the list for the next attempt: the
+selector that worked last is tried first, and selectors that keep missing are
+demoted behind the untried ones.
+
+Statistics are kept per page fingerprint: the host and path of the page plus
+the script bundles it loads. A new deployment of the site loads different
+bundles, so its selectors are learned afresh instead of being tried in an
+order learned on markup that no longer exists.
+
+With a path (opt-in, see Config.SELECTOR_CACHE), the statistics are loaded
+from and saved to a JSON file, so after the first run every step hits on its
+first selector. Saving merges this registry's new hits and misses into the
+file under an exclusive lock, so processes sharing the file (SearchExecutor
+workers) add to each other's statistics instead of overwriting them.
+
+Usage:
+    >>> registry = SelectorRegistry("~/.cache/ita-scrapper/selectors.json")
+    >>> fingerprint = await registry.fingerprint(page)
+    >>> for selector in registry.order(fingerprint, "origin", ORIGIN_SELECTORS):
+    ...     ...
+    >>> registry.record(fingerprint, "origin", selector, hit=True)
+    >>> registry.save()
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Union
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page
+
+from .config import Config
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Host, path and script bundles of the page, the inputs of its fingerprint
+_FINGERPRINT_JS = """
+() => [
+    location.host,
+    location.pathname,
+    ...Array.from(document.scripts, (script) => script.src).filter(Boolean).sort(),
+]
+"""
+
+
+class SelectorRegistry:
+    """
+    Hit and miss statistics of selectors, per page fingerprint and step.
+
+    Attributes:
+        path: JSON file the statistics persist to, or None to keep them in
+            memory only
+        dead_after: Consecutive misses after which a selector is demoted
+
+    Example:
+        >>> registry = SelectorRegistry()
+        >>> registry.record("site", "submit", "#search", hit=True)
+        >>> registry.order("site", "submit", [".search-button", "#search"])
+        ['#search', '.search-button']
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, dead_after: int = 3):
+        """
+        Load previously saved statistics.
+
+        Args:
+            path: JSON file to load from and save to. Default: None (memory only)
+            dead_after: Demote selectors after this many consecutive misses.
+                Default: 3
+        """
+        self.path = Path(path).expanduser() if path else None
+        self.dead_after = dead_after
+        # fingerprint -> step -> selector -> {"hits", "misses", "streak", "last_hit"}
+        self._stats: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        # Same shape, holding only what was recorded since the last save
+        self._pending: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        self._fingerprints: dict[str, str] = {}
+        self.load()
+
+    async def fingerprint(self, page: Page) -> str:
+        """
+        Fingerprint of the site version a page shows.
+
+        Computed once per page URL (without query); pages whose scripts cannot
+        be read are identified by host and path alone.
+
+        Returns:
+            "host/path#hash" where the hash covers the loaded script bundles
+        """
+        url = urlsplit(page.url)
+        key = f"{url.netloc}{url.path}"
+        if key not in self._fingerprints:
+            try:
+                parts = await page.evaluate(_FINGERPRINT_JS)
+            except Exception as e:
+                logger.debug(f"Could not fingerprint {key}: {e}")
+                return key
+            digest = hashlib.sha1(
+                "\n".join(parts).encode(), usedforsecurity=False
+            ).hexdigest()[:12]
+            self._fingerprints[key] = f"{key}#{digest}"
+        return self._fingerprints[key]
+
+    def order(self, fingerprint: str, step: str, selectors: list[str]) -> list[str]:
+        """
+        Order a step's selectors by what worked before.
+
+        Selectors that hit come first, most recent hit first. Then come the
+        selectors without hits, in their given order, and finally those that
+        missed dead_after times in a row.
+
+        Args:
+            fingerprint: Page fingerprint from fingerprint()
+            step: Name of the form or parsing step
+            selectors: The step's selectors in their default order
+
+        Returns:
+            The same selectors, reordered
+        """
+        stats = self._stats.get(fingerprint, {}).get(step, {})
+
+        def rank(item: tuple[int, str]) -> tuple:
+            index, selector = item
+            entry = stats.get(selector)
+            if entry is None:
+                return (1, 0, index)
+            if entry["streak"] >= self.dead_after:
+                return (2, 0, index)
+            if entry["last_hit"]:
+                return (0, -entry["last_hit"], index)
+            return (1, 0, index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record(self, fingerprint: str, step: str, selector: str, hit: bool):
+        """
+        Record whether a selector found its element.
+
+        Args:
+            fingerprint: Page fingerprint from fingerprint()
+            step: Name of the form or parsing step
+            selector: Selector that was tried
+            hit: Whether it matched
+        """
+        now = time.time()
+        for stats in (self._stats, self._pending):
+            entry = _entry(stats, fingerprint, step, selector)
+            if hit:
+                entry["hits"] += 1
+                entry["streak"] = 0
+                entry["last_hit"] = now
+            else:
+                entry["misses"] += 1
+                entry["streak"] += 1
+
+    def stats(self, fingerprint: str, step: str) -> dict[str, dict[str, Any]]:
+        """Statistics of a step's selectors, by selector."""
+        return self._stats.get(fingerprint, {}).get(step, {})
+
+    def load(self):
+        """Load statistics from the file, if there is one."""
+        if self.path is None:
+            return
+        stats = self._read()
+        # Keep what was recorded but not saved yet
+        for fingerprint, step, selector, change in _entries(self._pending):
+            _merge(_entry(stats, fingerprint, step, selector), change)
+        self._stats = stats
+
+    def save(self):
+        """
+        Merge the statistics recorded since the last save into the file.
+
+        The file is re-read under an exclusive lock and this registry's new
+        hits and misses are added to what other processes saved meanwhile;
+        the merged statistics then become this registry's own.
+        """
+        if self.path is None or not self._pending:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.with_suffix(".lock").open("a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    stats = self._read()
+                    for fingerprint, step, selector, change in _entries(self._pending):
+                        _merge(_entry(stats, fingerprint, step, selector), change)
+                    # Write then rename so readers never see a partial file
+                    temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+                    temporary.write_text(json.dumps(stats, indent=1, sort_keys=True))
+                    temporary.replace(self.path)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock, fcntl.LOCK_UN)
+        except OSError as e:
+            logger.warning(f"Could not save selector cache {self.path}: {e}")
+            return
+        self._stats = stats
+        self._pending = {}
+
+    def _read(self) -> dict:
+        """Statistics currently in the file, empty if missing or unreadable."""
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable selector cache {self.path}: {e}")
+            return {}
+
+
+def _entry(stats: dict, fingerprint: str, step: str, selector: str) -> dict:
+    """Statistics entry of a selector, created empty if missing."""
+    return (
+        stats.setdefault(fingerprint, {})
+        .setdefault(step, {})
+        .setdefault(selector, {"hits": 0, "misses": 0, "streak": 0, "last_hit": 0})
+    )
+
+
+def _entries(stats: dict):
+    """Yield (fingerprint, step, selector, entry) for every entry."""
+    for fingerprint, steps in stats.items():
+        for step, selectors in steps.items():
+            for selector, entry in selectors.items():
+                yield fingerprint, step, selector, entry
+
+
+def _merge(entry: dict, change: dict):
+    """Add the hits and misses recorded in change to a saved entry."""
+    entry["hits"] += change["hits"]
+    entry["misses"] += change["misses"]
+    if change["last_hit"]:
+        # The change hit, so only its own misses since then count
+        entry["streak"] = change["streak"]
+        entry["last_hit"] = max(entry["last_hit"], change["last_hit"])
+    else:
+        entry["streak"] += change["streak"]
+
+
+@functools.cache
+def default_selector_registry() -> SelectorRegistry:
+    """
+    Process-wide registry used by scrappers that do not get their own.
+
+    Built on first use, persisting to Config.SELECTOR_CACHE when it is set.
+    """
+    return SelectorRegistry(Config.SELECTOR_CACHE)
@@ -0,0 +1,97 @@
+"""
+Tests for debug artifact capture.
+"""
+
+from ita_scrapper.artifacts import ArtifactPolicy, ArtifactRecorder
+
+
+class FakePage:
+    """Page stand-in returning a fixed screenshot."""
+
+    def __init__(self, data: bytes = b"\xff\xd8jpeg"):
+        self.data = data
+        self.screenshots = 0
+
+    async def screenshot(self, **kwargs):
+        self.screenshots += 1
+        return self.data
+
+
+class TestArtifactPolicy:
+    """Test capture decisions per policy."""
+
+    def test_off(self):
+        """Test that nothing is captured when disabled."""
+        recorder = ArtifactRecorder("off")
+        assert not recorder.should_capture("id", failure=True)
+
+    def test_on_failure(self):
+        """Test that only failures are captured by default."""
+        recorder = ArtifactRecorder()
+        assert recorder.policy == ArtifactPolicy.ON_FAILURE
+        assert recorder.should_capture("id", failure=True)
+        assert not recorder.should_capture("id")
+
+    def test_always(self):
+        """Test that every capture point is captured."""
+        recorder = ArtifactRecorder(ArtifactPolicy.ALWAYS)
+        assert recorder.should_capture("id")
+
+    def test_sampled_is_stable_per_search(self):
+        """Test that sampling is decided once per search id."""
+        recorder = ArtifactRecorder("sampled", sample_rate=0.5)
+        ids = [ArtifactRecorder.new_search_id() for _ in range(200)]
+        decisions = [recorder.should_capture(i) for i in ids]
+        assert decisions == [recorder.should_capture(i) for i in ids]
+        assert 0 < sum(decisions) < len(ids)
+        assert all(recorder.should_capture(i, failure=True) for i in ids)
+
+    def test_search_ids_are_unique(self):
+        """Test that concurrent searches get distinct artifact names."""
+        ids = {ArtifactRecorder.new_search_id() for _ in range(100)}
+        assert len(ids) == 100
+
+
+class TestArtifactRecorder:
+    """Test writing artifacts."""
+
+    async def test_capture_writes_named_file(self, tmp_path):
+        """Test that a capture is written under the search id."""
+        recorder = ArtifactRecorder("always", directory=tmp_path)
+        page = FakePage()
+        task = recorder.capture(page, "search-1", "landing")
+        assert task is not None
+        await recorder.drain()
+        assert (tmp_path / "search-1-landing.jpg").read_bytes() == page.data
+
+    async def test_no_capture_skips_page(self, tmp_path):
+        """Test that skipped captures do not touch the page."""
+        recorder = ArtifactRecorder("on_failure", directory=tmp_path)
+        page = FakePage()
+        assert recorder.capture(page, "search-1", "landing") is None
+        assert page.screenshots == 0
+
+    async def test_oversized_screenshot_dropped(self, tmp_path):
+        """Test that screenshots over the size limit are not written."""
+        recorder = ArtifactRecorder("always", directory=tmp_path, max_bytes=4)
+        recorder.capture(FakePage(b"x" * 10), "search-1", "landing")
+        await recorder.drain()
+        assert not list(tmp_path.glob("*.jpg"))
+
+    async def test_retention(self, tmp_path):
+        """Test that old artifacts are removed beyond max_files."""
+        recorder = ArtifactRecorder("always", directory=tmp_path, max_files=3)
+        for _ in range(5):
+            recorder.capture(FakePage(), recorder.new_search_id(), "landing")
+            await recorder.drain()
+        assert len(list(tmp_path.glob("*.jpg"))) == 3
+
+    async def test_retention_keeps_foreign_files(self, tmp_path):
+        """Test that images not written by the recorder are never removed."""
+        (tmp_path / "holiday.jpg").write_bytes(b"photo")
+        recorder = ArtifactRecorder("always", directory=tmp_path, max_files=1)
+        for _ in range(3):
+            recorder.capture(FakePage(), recorder.new_search_id(), "landing")
+            await recorder.drain()
+        assert (tmp_path / "holiday.jpg").read_bytes() == b"photo"
+        assert len(list(tmp_path.glob("*.jpg"))) == 2
@@ -0,0 +1,73 @@
+"""
+Tests for request blocking rules.
+"""
+
+from ita_scrapper.blocking import BlockingStats, ResourceBlocker
+
+
+class TestResourceBlocker:
+    """Test blocking decisions."""
+
+    def test_default_blocks_heavy_resource_types(self):
+        """Test that images, fonts and media are blocked by default."""
+        blocker = ResourceBlocker()
+        assert blocker.should_block("https://matrix.itasoftware.com/a.png", "image")
+        assert blocker.should_block("https://fonts.gstatic.com/a.woff2", "font")
+        assert blocker.should_block("https://example.com/clip.mp4", "media")
+
+    def test_default_allows_app_resources(self):
+        """Test that scripts, styles and XHR of the app are allowed."""
+        blocker = ResourceBlocker()
+        assert not blocker.should_block(
+            "https://matrix.itasoftware.com/main.js", "script"
+        )
+        assert not blocker.should_block(
+            "https://matrix.itasoftware.com/styles.css", "stylesheet"
+        )
+        assert not blocker.should_block("https://matrix.itasoftware.com/search", "xhr")
+
+    def test_blocked_domains_include_subdomains(self):
+        """Test that tracker domains and their subdomains are blocked."""
+        blocker = ResourceBlocker()
+        assert blocker.should_block(
+            "https://www.google-analytics.com/g/collect", "ping"
+        )
+        assert blocker.should_block("https://stats.g.doubleclick.net/j", "script")
+        assert not blocker.should_block("https://notdoubleclick.net/x", "script")
+
+    def test_allowlist(self):
+        """Test that an allowlist blocks every other host."""
+        blocker = ResourceBlocker(
+            block_resource_types=(), allow_domains=ResourceBlocker.MATRIX_DOMAINS
+        )
+        assert not blocker.should_block(
+            "https://content-alkalimatrix-pa.googleapis.com/v1/search", "fetch"
+        )
+        assert blocker.should_block("https://cdn.example.com/lib.js", "script")
+
+    def test_inline_urls_never_blocked(self):
+        """Test that data URLs are left alone."""
+        blocker = ResourceBlocker()
+        assert not blocker.should_block("data:image/png;base64,AAAA", "image")
+
+
+class TestBlockingStats:
+    """Test blocked request counters."""
+
+    def test_record_and_reset(self):
+        """Test counting and resetting blocked requests."""
+        blocker = ResourceBlocker()
+        stats = BlockingStats()
+        stats.record("image", blocker.estimate_bytes("image"))
+        stats.record("font", blocker.estimate_bytes("font"))
+
+        assert stats.blocked_requests == 2
+        assert stats.bytes_saved == (
+            ResourceBlocker.ESTIMATED_BYTES["image"]
+            + ResourceBlocker.ESTIMATED_BYTES["font"]
+        )
+        assert stats.by_type["image"] == 1
+
+        stats.reset()
+        assert stats.blocked_requests == 0
+        assert stats.bytes_saved == 0
@@ -0,0 +1,239 @@
+"""
+Tests for search API response capture and mapping.
+"""
+
+import asyncio
+import json
+from decimal import Decimal
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.capture import ResponseCapture
+from ita_scrapper.models import CabinClass
+from ita_scrapper.parsers import ITAMatrixResponseParser
+
+SEARCH_URL = "https://content-alkalimatrix-pa.googleapis.com/v1/search?key=k"
+
+SEARCH_RESPONSE = {
+    "solutionList": {
+        "solutions": [
+            {
+                "displayTotal": "USD315.20",
+                "itinerary": {
+                    "carriers": [{"code": "AA", "shortName": "American"}],
+                    "slices": [
+                        {
+                            "origin": {"code": "JFK"},
+                            "destination": {"code": "LAX"},
+                            "departure": "2030-08-15T08:00-04:00",
+                            "arrival": "2030-08-15T11:20-07:00",
+                            "duration": 380,
+                            "flights": ["AA1"],
+                            "cabins": ["COACH"],
+                        }
+                    ],
+                },
+            },
+            {"displayTotal": "USD99.00", "itinerary": {"slices": "broken"}},
+            {
+                "displayTotal": "USD1,204.10",
+                "itinerary": {
+                    "carriers": [{"code": "UA", "shortName": "United"}],
+                    "slices": [
+                        {
+                            "origin": {"code": "JFK"},
+                            "destination": {"code": "SFO"},
+                            "departure": "2030-08-15T07:00-04:00",
+                            "arrival": "2030-08-15T13:30-07:00",
+                            "duration": 570,
+                            "flights": ["UA10", "UA20"],
+                            "cabins": ["COACH", "BUSINESS"],
+                            "stops": [{"code": "ORD"}],
+                            "segments": [
+                                {
+                                    "flight": {"carrier": "UA", "number": 10},
+                                    "origin": {"code": "JFK"},
+                                    "destination": {"code": "ORD"},
+                                    "departure": "2030-08-15T07:00-04:00",
+                                    "arrival": "2030-08-15T08:45-05:00",
+                                    "aircraft": {"shortName": "Boeing 737"},
+                                },
+                                {
+                                    "flight": {"carrier": "UA", "number": 20},
+                                    "origin": {"code": "ORD"},
+                                    "destination": {"code": "SFO"},
+                                    "departure": "2030-08-15T10:00-05:00",
+                                    "arrival": "2030-08-15T13:30-07:00",
+                                    "duration": 330,
+                                },
+                            ],
+                        }
+                    ],
+                },
+            },
+        ]
+    }
+}
+
+
+class FakeResponse:
+    """Response with a fixed URL and body."""
+
+    def __init__(self, url: str, body: str):
+        self.url = url
+        self.body = body
+        self.request = None
+
+    async def text(self):
+        return self.body
+
+
+class FakePage:
+    """Page that lets tests emit response events."""
+
+    def __init__(self):
+        self.handlers = []
+
+    def on(self, event, handler):
+        if event == "response":
+            self.handlers.append(handler)
+
+    def respond(self, url: str, body):
+        text = body if isinstance(body, str) else json.dumps(body)
+        for handler in self.handlers:
+            handler(FakeResponse(url, text))
+
+
+class TestResponseParser:
+    """Test mapping search API JSON to flights."""
+
+    def test_maps_solutions(self):
+        """Test summary and detailed slices; unmappable solutions are skipped."""
+        flights = ITAMatrixResponseParser().parse_search_response(SEARCH_RESPONSE)
+
+        assert len(flights) == 2
+        direct, connecting = flights
+
+        assert direct.price == Decimal("315.20")
+        assert direct.cabin_class == CabinClass.ECONOMY
+        assert direct.total_duration_minutes == 380
+        assert direct.stops == 0
+        segment = direct.segments[0]
+        assert segment.flight_number == "AA1"
+        assert segment.airline.name == "American"
+        assert segment.arrival_airport.code == "LAX"
+        assert segment.arrival_time.utcoffset().total_seconds() == -7 * 3600
+
+        assert connecting.price == Decimal("1204.10")
+        assert connecting.cabin_class == CabinClass.BUSINESS
+        assert connecting.stops == 1
+        assert [s.flight_number for s in connecting.segments] == ["UA10", "UA20"]
+        assert connecting.segments[0].duration_minutes == 165
+        assert connecting.segments[0].aircraft_type == "Boeing 737"
+
+    def test_max_results(self):
+        """Test that mapping stops at max_results."""
+        parser = ITAMatrixResponseParser()
+        assert len(parser.parse_search_response(SEARCH_RESPONSE, max_results=1)) == 1
+        assert parser.parse_search_response({"solutionList": {}}) == []
+
+
+class TestResponseCapture:
+    """Test capturing the search response from page events."""
+
+    async def test_captures_matching_response(self):
+        """Test that only matching, accepted responses are captured."""
+        page = FakePage()
+        capture = ResponseCapture(accept=ITAMatrixResponseParser.is_search_response)
+        capture.install(page)
+
+        page.respond("https://matrix.itasoftware.com/app.js", "not json")
+        page.respond(SEARCH_URL.replace("search", "locations"), {"x": 1})
+        page.respond(SEARCH_URL, {"error": "not results"})
+        page.respond(SEARCH_URL, ")]}'\n" + json.dumps(SEARCH_RESPONSE))
+
+        assert await capture.wait(1000) == SEARCH_RESPONSE
+        assert capture.captured == 1
+
+        capture.reset()
+        assert await capture.wait(10) is None
+
+    async def test_gives_up_once_results_render(self):
+        """Test that a page rendered without the response stops the wait."""
+        capture = ResponseCapture()
+        capture.install(FakePage())
+
+        payload = await asyncio.wait_for(
+            capture.wait(30000, rendered=asyncio.sleep(0), grace_ms=10), 1
+        )
+        assert payload is None
+
+
+def captured_scrapper(dom_parser=None) -> tuple[ITAScrapper, FakePage]:
+    """Scrapper capturing from a fake page whose results never render."""
+    scrapper = ITAScrapper()
+    page = FakePage()
+    capture = ResponseCapture(accept=ITAMatrixResponseParser.is_search_response)
+    capture.install(page)
+    scrapper._capture = capture
+
+    async def wait_for_selector(selector, timeout):
+        await asyncio.sleep(10)
+
+    async def no_dom_parser(*args, **kwargs):
+        raise AssertionError("DOM parser should not run")
+        yield
+
+    page.wait_for_selector = wait_for_selector
+    scrapper._page = page
+    scrapper._parser.iter_flight_results = dom_parser or no_dom_parser
+    return scrapper, page
+
+
+class TestScrapperCapture:
+    """Test that the scrapper prefers captured responses."""
+
+    async def test_captured_flights_skip_dom_parsing(self):
+        """Test that captured flights are returned without DOM parsing."""
+        scrapper, page = captured_scrapper()
+
+        page.respond(SEARCH_URL, SEARCH_RESPONSE)
+        flights = await scrapper._parse_flight_results(max_results=5)
+
+        assert [f.segments[0].flight_number for f in flights] == ["AA1", "UA10"]
+
+    async def test_empty_solution_list_is_final(self):
+        """Test that a search that found nothing does not parse the page."""
+        scrapper, page = captured_scrapper()
+
+        page.respond(SEARCH_URL, {"solutionList": {"solutions": []}})
+
+        assert await scrapper._parse_flight_results(max_results=5) == []
+
+    async def test_search_cabin_fills_unnamed_cabins(self):
+        """Test that solutions without cabins get the searched cabin."""
+        scrapper, page = captured_scrapper()
+        scrapper._search_cabin = CabinClass.FIRST
+        solution = json.loads(
+            json.dumps(SEARCH_RESPONSE["solutionList"]["solutions"][0])
+        )
+        del solution["itinerary"]["slices"][0]["cabins"]
+
+        page.respond(SEARCH_URL, {"solutionList": {"solutions": [solution]}})
+        flights = await scrapper._parse_flight_results(max_results=5)
+
+        assert [f.cabin_class for f in flights] == [CabinClass.FIRST]
+
+    async def test_dom_fallback_gets_remaining_timeout(self):
+        """Test that the page is parsed within what the capture wait left."""
+        timeouts = []
+
+        async def dom_parser(page, max_results, row_indicators, wait_timeout):
+            timeouts.append(wait_timeout)
+            yield "parsed"
+
+        scrapper, _ = captured_scrapper(dom_parser)
+        scrapper.timeout = 200
+
+        assert await scrapper._parse_flight_results(max_results=5) == ["parsed"]
+        assert len(timeouts) == 1
+        assert timeouts[0] < 50
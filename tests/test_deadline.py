@@ -0,0 +1,99 @@
+"""
+Tests for search deadlines.
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.deadline import Deadline, clamp_timeout, current_deadline
+from ita_scrapper.exceptions import ITATimeoutError, ParseError
+from ita_scrapper.models import SearchParams, TripType
+from ita_scrapper.retry import RetryPolicy
+
+
+def one_way() -> SearchParams:
+    """One-way search parameters."""
+    return SearchParams(
+        origin="JFK",
+        destination="LAX",
+        departure_date=date.today() + timedelta(days=30),
+        trip_type=TripType.ONE_WAY,
+    )
+
+
+class TestDeadline:
+    """Test budget bookkeeping."""
+
+    def test_clamp_and_check(self):
+        """Test that timeouts shrink to the budget and checks record the stage."""
+        deadline = Deadline(2)
+
+        assert deadline.clamp_ms(500) == 500
+        assert deadline.clamp_ms(30000) <= 2000
+
+        deadline.expires_at = 0
+        with pytest.raises(ITATimeoutError) as exc_info:
+            deadline.check("parse")
+        assert exc_info.value.stage == "parse"
+        assert deadline.clamp_ms(30000) == 1
+
+    def test_activation(self):
+        """Test that clamp_timeout only applies inside an active deadline."""
+        assert current_deadline() is None
+        assert clamp_timeout(30000) == 30000
+
+        with Deadline(1).activate() as deadline:
+            assert current_deadline() is deadline
+            assert clamp_timeout(30000) <= 1000
+
+        assert current_deadline() is None
+
+
+class TestScrapperDeadline:
+    """Test deadline enforcement around the search stages."""
+
+    async def test_cancels_slow_stage(self):
+        """Test that a stage overrunning the budget is cancelled and named."""
+        scrapper = ITAScrapper(retry=False, deep_link=False)
+
+        async def navigate():
+            scrapper._search_form_url = "https://matrix.itasoftware.com/search"
+
+        async def fill(params):
+            await asyncio.sleep(5)
+
+        scrapper._navigate_to_flights = navigate
+        scrapper._fill_search_form = fill
+
+        with pytest.raises(ITATimeoutError) as exc_info:
+            await scrapper.search(one_way(), deadline=0.1)
+
+        assert exc_info.value.stage == "search_form"
+        assert scrapper._search_form_url is None
+
+    async def test_no_retry_past_deadline(self):
+        """Test that a retry whose backoff exceeds the budget is not attempted."""
+        scrapper = ITAScrapper(
+            retry=RetryPolicy(max_retries=5, base_delay=100), deep_link=False
+        )
+        parses = []
+
+        async def noop(*args):
+            scrapper._search_form_url = "https://matrix.itasoftware.com/search"
+
+        async def parse(max_results):
+            parses.append(1)
+            raise ParseError("not rendered")
+
+        scrapper._navigate_to_flights = noop
+        scrapper._fill_search_form = noop
+        scrapper._parse_flight_results = parse
+
+        with pytest.raises(ParseError):
+            await scrapper.search(one_way(), deadline=0.5)
+
+        # Backoff ceilings of 100s+ almost never fit a 0.5s budget
+        assert len(parses) <= 2
@@ -0,0 +1,129 @@
+"""
+Tests for search deep links.
+"""
+
+from datetime import date, timedelta
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.deeplink import build_search_url, parse_search_url
+from ita_scrapper.models import (
+    CabinClass,
+    MultiCitySearchParams,
+    MultiCitySegment,
+    SearchParams,
+    TripType,
+)
+
+DAY = date.today() + timedelta(days=30)
+
+
+class TestBuildSearchUrl:
+    """Test encoding searches into Matrix result links."""
+
+    def test_round_trip(self):
+        """Test that a round trip is one slice with a return date."""
+        params = SearchParams(
+            origin="jfk",
+            destination="LAX",
+            departure_date=DAY,
+            return_date=DAY + timedelta(days=7),
+            trip_type=TripType.ROUND_TRIP,
+            cabin_class=CabinClass.BUSINESS,
+            adults=2,
+            infants=1,
+        )
+        url = build_search_url(params)
+        state = parse_search_url(url)
+
+        assert url.startswith("https://matrix.itasoftware.com/flights?search=")
+        assert state["type"] == "round-trip"
+        assert state["slices"][0]["origin"] == ["JFK"]
+        assert state["slices"][0]["dates"]["departureDate"] == DAY.isoformat()
+        assert state["slices"][0]["dates"]["returnDate"] == str(DAY + timedelta(7))
+        assert state["options"]["cabin"] == "BUSINESS"
+        assert state["pax"] == {"adults": "2", "infantsInLap": "1"}
+
+    def test_multi_city(self):
+        """Test that every multi-city segment becomes a slice."""
+        params = MultiCitySearchParams(
+            segments=[
+                MultiCitySegment(origin="JFK", destination="LHR", departure_date=DAY),
+                MultiCitySegment(
+                    origin="LHR",
+                    destination="CDG",
+                    departure_date=DAY + timedelta(days=3),
+                ),
+            ]
+        )
+        state = parse_search_url(build_search_url(params))
+
+        assert state["type"] == "multi-city"
+        assert [s["dest"] for s in state["slices"]] == [["LHR"], ["CDG"]]
+        assert state["slices"][1]["dates"]["returnDate"] == ""
+        assert state["options"]["cabin"] == "COACH"
+
+
+class TestDeepLinkSearch:
+    """Test the scrapper's choice between deep links and the form."""
+
+    async def test_falls_back_to_form_once(self):
+        """Test that a link that starts no search switches to the form for good."""
+        scrapper = ITAScrapper(retry=False)
+        calls = []
+
+        async def open_deep_link(params):
+            calls.append("link")
+            return False
+
+        async def navigate():
+            calls.append("navigate")
+            scrapper._search_form_url = "https://matrix.itasoftware.com/search"
+
+        async def fill():
+            calls.append("fill")
+
+        scrapper._open_deep_link = open_deep_link
+        scrapper._navigate_to_flights = navigate
+        params = SearchParams(
+            origin="JFK",
+            destination="LAX",
+            departure_date=DAY,
+            trip_type=TripType.ONE_WAY,
+        )
+
+        await scrapper._open_search(params, fill)
+        await scrapper._open_search(params, fill)
+
+        assert calls == ["link", "navigate", "fill", "navigate", "fill"]
+
+    async def test_link_not_understood_detected_quickly(self):
+        """Test that a link starting no search fails after the short timeout."""
+        scrapper = ITAScrapper(rate_limiter=False)
+        scrapper.DEEP_LINK_START_TIMEOUT = 50
+        handlers = []
+
+        class SilentPage:
+            def on(self, event, handler):
+                handlers.append(handler)
+
+            def remove_listener(self, event, handler):
+                handlers.remove(handler)
+
+            async def goto(self, url, **kwargs):
+                return None
+
+        scrapper._page = SilentPage()
+        params = SearchParams(
+            origin="JFK",
+            destination="LAX",
+            departure_date=DAY,
+            trip_type=TripType.ONE_WAY,
+        )
+
+        assert await scrapper._open_deep_link(params) is False
+        assert handlers == []
+
+    def test_matrix_only(self):
+        """Test that deep links are only used for ITA Matrix."""
+        assert ITAScrapper().deep_link
+        assert not ITAScrapper(use_matrix=False).deep_link
@@ -0,0 +1,138 @@
+"""
+Tests for the multi-process search executor.
+
+The worker processes run a fake engine instead of a browser pool, so these
+tests exercise job distribution, IPC and supervision without Chromium.
+"""
+
+import asyncio
+import os
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from ita_scrapper.exceptions import ITAScrapperError, NavigationError
+from ita_scrapper.executor import SearchExecutor
+from ita_scrapper.models import FlightResult, SearchParams, TripType
+
+
+class FakeEngine:
+    """Engine stand-in run inside the worker processes."""
+
+    def __init__(self, options):
+        self.options = options
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def search(self, search_params, max_results=20):
+        if search_params.destination == "DYE":
+            marker = Path(self.options["die_once"])
+            if not marker.exists():
+                # Die the moment the job arrives, before anything is reported
+                marker.touch()
+                os._exit(1)
+        await asyncio.sleep(0.01)
+        if search_params.destination == "ERR":
+            raise NavigationError("boom")
+        if search_params.destination == "DIE":
+            os._exit(1)
+        return FlightResult(flights=[], search_params=search_params, total_results=0)
+
+
+def fake_engine(options):
+    """Picklable engine factory for the worker processes."""
+    return FakeEngine(options)
+
+
+def one_way(destination: str) -> SearchParams:
+    """One-way search parameters to a destination."""
+    return SearchParams(
+        origin="JFK",
+        destination=destination,
+        departure_date=date.today() + timedelta(days=30),
+        trip_type=TripType.ONE_WAY,
+    )
+
+
+class TestSearchExecutor:
+    """Test the executor with fake engines in real worker processes."""
+
+    def test_submit_before_start(self):
+        """Test that submitting to a stopped executor fails."""
+        executor = SearchExecutor(processes=1, engine_factory=fake_engine)
+        with pytest.raises(ITAScrapperError):
+            executor.submit(one_way("LAX"))
+
+    def test_map_returns_outcomes_in_order(self):
+        """Test that results and errors come back over IPC in input order."""
+        destinations = ["LAX", "ERR", "SFO", "SEA", "BOS"]
+
+        with SearchExecutor(
+            processes=2, pool_size=2, engine_factory=fake_engine
+        ) as executor:
+            outcomes = list(executor.map(one_way(d) for d in destinations))
+            stats = executor.stats
+
+        assert [o.index for o in outcomes] == list(range(len(destinations)))
+        assert outcomes[0].result.search_params.destination == "LAX"
+        assert isinstance(outcomes[1].error, NavigationError)
+        assert sum(s.searches for s in stats) == 4
+        assert sum(s.failures for s in stats) == 1
+
+    def test_recycles_workers(self):
+        """Test that workers are replaced after max_searches_per_worker."""
+        with SearchExecutor(
+            processes=1,
+            pool_size=1,
+            max_searches_per_worker=2,
+            engine_factory=fake_engine,
+        ) as executor:
+            outcomes = list(executor.map(one_way("LAX") for _ in range(5)))
+            stats = executor.stats[0]
+
+        assert all(o.ok for o in outcomes)
+        assert stats.searches == 5
+        assert stats.recycles == 2
+
+    def test_crashed_worker_is_restarted(self):
+        """Test that a crash fails its job and the worker keeps serving."""
+        with SearchExecutor(
+            processes=1, pool_size=1, max_requeues=0, engine_factory=fake_engine
+        ) as executor:
+            with pytest.raises(ITAScrapperError):
+                executor.submit(one_way("DIE")).result(timeout=60)
+            result = executor.submit(one_way("LAX")).result(timeout=60)
+            stats = executor.stats[0]
+
+        assert result.search_params.destination == "LAX"
+        assert stats.restarts == 1
+
+    def test_job_of_dead_worker_is_requeued(self, tmp_path):
+        """Test that a job is rerun when its worker dies right after taking it."""
+        with SearchExecutor(
+            processes=1,
+            pool_size=1,
+            engine_factory=fake_engine,
+            die_once=str(tmp_path / "died"),
+        ) as executor:
+            outcomes = list(executor.map([one_way("DYE"), one_way("LAX")]))
+            stats = executor.stats[0]
+
+        assert [o.ok for o in outcomes] == [True, True]
+        assert outcomes[0].result.search_params.destination == "DYE"
+        assert stats.restarts == 1
+
+    async def test_search_many(self):
+        """Test the async batch API."""
+        async with SearchExecutor(
+            processes=2, pool_size=1, engine_factory=fake_engine
+        ) as executor:
+            outcomes = await executor.search_many([one_way("LAX"), one_way("ERR")])
+
+        assert outcomes[0].ok
+        assert not outcomes[1].ok
@@ -0,0 +1,223 @@
+"""
+Tests for locating search form fields.
+"""
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.scrapper import DEPARTURE_DATE_SELECTORS, RETURN_DATE_SELECTORS
+from ita_scrapper.selector_registry import SelectorRegistry
+
+
+class FakeProperty:
+    """Property handle of the in-page result."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def as_element(self):
+        return self.value
+
+    async def json_value(self):
+        return self.value
+
+
+class FakeHandle:
+    """Handle of the [element, selector, missed] array returned by the page."""
+
+    def __init__(self, values):
+        self.values = values
+        self.disposed = False
+
+    async def get_properties(self):
+        return {str(i): FakeProperty(v) for i, v in enumerate(self.values)}
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class FakePage:
+    """Page whose evaluate_handle finds a canned date input."""
+
+    url = "https://matrix.itasoftware.com/search"
+
+    def __init__(self, found):
+        self.found = found
+        self.calls = []
+        self.handles = []
+
+    async def evaluate(self, script):
+        return ["matrix.itasoftware.com", "/search", "main.js"]
+
+    async def evaluate_handle(self, script, arg):
+        self.calls.append(arg)
+        handle = FakeHandle(self.found)
+        self.handles.append(handle)
+        return handle
+
+
+class TestDateInput:
+    """Tests for ITAScrapper._find_date_input."""
+
+    async def test_found_in_one_call(self):
+        """The candidate scoring runs as a single page call."""
+        scrapper = ITAScrapper(selector_registry=SelectorRegistry())
+        selector = RETURN_DATE_SELECTORS[3]
+        scrapper._page = FakePage(["return-input", selector, []])
+
+        assert await scrapper._find_date_input(is_departure=False) == (
+            "return-input",
+            selector,
+        )
+        assert len(scrapper._page.calls) == 1
+        assert scrapper._page.calls[0]["selectors"] == RETURN_DATE_SELECTORS
+        assert scrapper._page.handles[0].disposed
+
+    async def test_learned_selector_first(self):
+        """The selector that worked before is tried first next time."""
+        scrapper = ITAScrapper(selector_registry=SelectorRegistry())
+        selector = DEPARTURE_DATE_SELECTORS[5]
+        scrapper._page = FakePage(["departure-input", selector, []])
+
+        await scrapper._find_date_input(is_departure=True)
+        await scrapper._find_date_input(is_departure=True)
+
+        selectors = scrapper._page.calls[1]["selectors"]
+        assert selectors[0] == selector
+        assert sorted(selectors) == sorted(DEPARTURE_DATE_SELECTORS)
+        assert selectors[-1] == DEPARTURE_DATE_SELECTORS[-1]
+
+    async def test_misses_recorded(self):
+        """Selectors tried before the one that matched are recorded as misses."""
+        scrapper = ITAScrapper(selector_registry=SelectorRegistry())
+        missed = DEPARTURE_DATE_SELECTORS[:2]
+        selector = DEPARTURE_DATE_SELECTORS[2]
+        scrapper._page = FakePage(["departure-input", selector, missed])
+
+        await scrapper._find_date_input(is_departure=True)
+
+        fingerprint = scrapper._selector_fingerprint
+        stats = scrapper.selector_registry.stats(fingerprint, "departure_date")
+        assert {s: stats[s]["misses"] for s in missed} == {s: 1 for s in missed}
+        assert stats[selector]["hits"] == 1
+
+    async def test_not_found(self):
+        """No usable input records every learnable selector as a miss."""
+        scrapper = ITAScrapper(selector_registry=SelectorRegistry())
+        scrapper._page = FakePage([None, None, DEPARTURE_DATE_SELECTORS])
+
+        assert await scrapper._find_date_input(is_departure=True) == (None, None)
+        fingerprint = scrapper._selector_fingerprint
+        stats = scrapper.selector_registry.stats(fingerprint, "departure_date")
+        # The catch-all is not reordered, so it is not learned either
+        assert sorted(stats) == sorted(DEPARTURE_DATE_SELECTORS[:-1])
+        assert all(entry["hits"] == 0 for entry in stats.values())
+
+
+FORM_URL = "https://matrix.itasoftware.com/search"
+
+
+class FakeReadiness:
+    """Readiness stand-in that returns at once."""
+
+    async def settle(self, max_ms=None):
+        return True
+
+
+class FormPage:
+    """Page parked on (or returning to) the search form."""
+
+    def __init__(
+        self,
+        url,
+        back_url=FORM_URL,
+        leftovers=(),
+        form_present=True,
+        resets_clear=True,
+    ):
+        self.url = url
+        self.back_url = back_url
+        self.leftovers = list(leftovers)
+        self.form_present = form_present
+        self.resets_clear = resets_clear
+        self.backs = 0
+        self.resets = 0
+
+    async def go_back(self, **kwargs):
+        self.backs += 1
+        self.url = self.back_url
+
+    async def wait_for_selector(self, selector, timeout=None):
+        if not self.form_present:
+            raise TimeoutError(f"Timeout {timeout}ms waiting for {selector}")
+        return object()
+
+    async def evaluate(self, script):
+        if "click()" in script:
+            self.resets += 1
+            # A reset that works clears everything
+            if self.resets_clear:
+                self.leftovers = []
+            return None
+        return self.leftovers
+
+
+def warm_scrapper(page: FormPage) -> ITAScrapper:
+    """Scrapper whose warm form is FORM_URL, on the given page."""
+    scrapper = ITAScrapper(warm_session=True, rate_limiter=False, deep_link=False)
+    scrapper._page = page
+    scrapper._readiness = FakeReadiness()
+    scrapper._search_form_url = FORM_URL
+    return scrapper
+
+
+class TestRestoreSearchForm:
+    """Tests for ITAScrapper._restore_search_form."""
+
+    async def test_same_url(self):
+        """A page still on the form is reused without navigating."""
+        page = FormPage(FORM_URL)
+        scrapper = warm_scrapper(page)
+
+        assert await scrapper._restore_search_form()
+        assert page.backs == 0
+        assert page.resets == 1
+
+    async def test_back_to_form(self):
+        """A results page goes back in history to the form."""
+        page = FormPage(FORM_URL + "/results")
+        scrapper = warm_scrapper(page)
+
+        assert await scrapper._restore_search_form()
+        assert page.backs == 1
+
+    async def test_back_lands_elsewhere(self):
+        """Landing on another page falls back to a fresh navigation."""
+        page = FormPage(FORM_URL + "/results", back_url="https://example.com/")
+        scrapper = warm_scrapper(page)
+
+        assert not await scrapper._restore_search_form()
+        assert scrapper._search_form_url is None
+
+    async def test_form_selector_timeout(self):
+        """A form that does not render is not reused."""
+        page = FormPage(FORM_URL, form_present=False)
+        scrapper = warm_scrapper(page)
+
+        assert not await scrapper._restore_search_form()
+        assert scrapper._search_form_url is None
+
+    async def test_previous_values_cleared(self):
+        """The previous search's chips and dates are reset before reuse."""
+        page = FormPage(FORM_URL, leftovers=["JFK", "08/15/2030"])
+        scrapper = warm_scrapper(page)
+
+        assert await scrapper._restore_search_form()
+        assert page.resets == 1
+        assert page.leftovers == []
+
+    async def test_values_that_survive_reset(self):
+        """A form that cannot be cleared is not reused."""
+        page = FormPage(FORM_URL, leftovers=["JFK"], resets_clear=False)
+        scrapper = warm_scrapper(page)
+
+        assert not await scrapper._restore_search_form()
+        assert scrapper._search_form_url is None
@@ -0,0 +1,139 @@
+"""
+Tests for HAR recording and replay.
+"""
+
+import base64
+import json
+
+import pytest
+
+from ita_scrapper import ITAScrapper, ITAScrapperPool
+from ita_scrapper.har import HarReplay
+
+SEARCH_URL = "https://content-alkalimatrix-pa.googleapis.com/v1/search?key=k"
+
+
+def write_har(path):
+    """Write a HAR with a page load and a base64-encoded search response."""
+    body = json.dumps({"solutionList": {"solutions": []}})
+    entries = [
+        {
+            "request": {"method": "GET", "url": "https://matrix.itasoftware.com/"},
+            "response": {
+                "status": 200,
+                "headers": [],
+                "content": {"text": "<html></html>"},
+            },
+        },
+        {
+            "request": {"method": "POST", "url": SEARCH_URL},
+            "response": {
+                "status": 200,
+                "headers": [
+                    {"name": "Content-Type", "value": "application/json"},
+                    {"name": "Content-Encoding", "value": "gzip"},
+                ],
+                "content": {
+                    "text": base64.b64encode(body.encode()).decode(),
+                    "encoding": "base64",
+                },
+            },
+        },
+    ]
+    path.write_text(json.dumps({"log": {"entries": entries}}))
+    return body
+
+
+class FakeRequest:
+    """Request with a URL and method."""
+
+    def __init__(self, url, method="GET"):
+        self.url = url
+        self.method = method
+
+
+class FakeRoute:
+    """Route recording how it was handled."""
+
+    def __init__(self, url, method="GET"):
+        self.request = FakeRequest(url, method)
+        self.fulfilled = None
+        self.aborted = None
+
+    async def fulfill(self, **response):
+        self.fulfilled = response
+
+    async def abort(self, error_code=None):
+        self.aborted = error_code
+
+
+class FakeContext:
+    """Context recording route registrations."""
+
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, url, handler):
+        self.routes.append(("route", url))
+
+    async def route_from_har(self, har, not_found="abort"):
+        self.routes.append(("har", not_found))
+
+
+class TestHarReplay:
+    """Test serving recorded traffic."""
+
+    async def test_replays_search_calls_and_aborts_the_rest(self, tmp_path):
+        """Test that search calls are served in order and nothing goes online."""
+        har = tmp_path / "search.har"
+        body = write_har(har)
+        replay = HarReplay(har)
+        context = FakeContext()
+
+        await replay.install(context)
+        assert context.routes == [("route", "**/*"), ("har", "fallback")]
+
+        search = FakeRoute(SEARCH_URL, "POST")
+        await replay._handle_unmatched(search)
+        assert search.fulfilled["body"] == body.encode()
+        assert search.fulfilled["headers"] == {"Content-Type": "application/json"}
+
+        other = FakeRoute("https://example.com/tracker.js")
+        await replay._handle_unmatched(other)
+        assert other.aborted == "internetdisconnected"
+        assert replay.missed == 1
+
+    def test_missing_file(self, tmp_path):
+        """Test that replaying a missing recording fails early."""
+        with pytest.raises(FileNotFoundError):
+            HarReplay(tmp_path / "missing.har")
+
+
+class TestScrapperHarOptions:
+    """Test the scrapper's HAR options."""
+
+    def test_record_paths(self, tmp_path):
+        """Test that replacement contexts record to numbered files."""
+        scrapper = ITAScrapper(record_har=tmp_path / "run.har")
+
+        first = scrapper._har_record_options()
+        second = scrapper._har_record_options()
+
+        assert first["record_har_path"] == str(tmp_path / "run.har")
+        assert first["record_har_content"] == "embed"
+        assert second["record_har_path"] == str(tmp_path / "run-1.har")
+        assert ITAScrapper()._har_record_options() == {}
+
+        zipped = ITAScrapper(record_har=tmp_path / "run.zip")
+        assert zipped._har_record_options()["record_har_content"] == "attach"
+
+    def test_replay_disables_rate_limiting(self, tmp_path):
+        """Test that replays run unthrottled and exclude recording."""
+        har = tmp_path / "search.har"
+        write_har(har)
+
+        assert ITAScrapper(replay_har=har).rate_limiter is None
+        with pytest.raises(ValueError):
+            ITAScrapper(record_har=tmp_path / "new.har", replay_har=har)
+        with pytest.raises(ValueError):
+            ITAScrapperPool(size=2, record_har=tmp_path / "new.har")
@@ -0,0 +1,196 @@
+"""
+Tests for the browserless HTTP search engine against a local stand-in API.
+"""
+
+import json
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ita_scrapper.exceptions import ITAScrapperError, NavigationError
+from ita_scrapper.http_engine import ITAHttpEngine, MatrixSession
+from ita_scrapper.models import CabinClass, SearchParams, TripType
+
+pytest.importorskip("httpx")
+
+TEMPLATE = {
+    "summarizers": ["solutionList"],
+    "inputs": {
+        "page": {"current": 1, "size": 25},
+        "pax": {"adults": 1},
+        "cabin": "COACH",
+        "slices": [{"origin": ["BOS"], "destination": ["ORD"], "date": "2030-01-01"}],
+    },
+    "bgProgramResponse": "token",
+}
+
+
+class StandInAPI(BaseHTTPRequestHandler):
+    """Matrix search API stand-in answering with one solution per slice."""
+
+    protocol_version = "HTTP/1.1"
+    api_key = "good"
+    requests: list = []
+    clients: set = set()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StandInAPI.requests.append(body)
+        StandInAPI.clients.add(self.client_address)
+
+        if self.headers.get("X-Goog-Api-Key") != StandInAPI.api_key:
+            self._reply(403, {"error": "forbidden"})
+            return
+
+        slices = [
+            {
+                "origin": {"code": s["origin"][0]},
+                "destination": {"code": s["destination"][0]},
+                "departure": f"{s['date']}T08:00-04:00",
+                "arrival": f"{s['date']}T11:00-07:00",
+                "duration": 360,
+                "flights": ["AA1"],
+                "cabins": [body["inputs"]["cabin"]],
+            }
+            for s in body["inputs"]["slices"]
+        ]
+        solution = {"displayTotal": "USD250.00", "itinerary": {"slices": slices}}
+        self._reply(200, {"solutionList": {"solutions": [solution]}})
+
+    def _reply(self, status, payload):
+        data = (")]}'\n" + json.dumps(payload)).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_url():
+    """Run the stand-in API on a free local port."""
+    StandInAPI.requests = []
+    StandInAPI.clients = set()
+    StandInAPI.api_key = "good"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1/search?key=k"
+    server.shutdown()
+    server.server_close()
+
+
+def session_for(url: str, api_key: str = "good") -> MatrixSession:
+    """Session replaying the template against the stand-in API."""
+    headers = {"x-goog-api-key": api_key, "content-length": "99", ":path": "/"}
+    return MatrixSession(url, headers, TEMPLATE)
+
+
+class TestITAHttpEngine:
+    """Test searches replayed over HTTP."""
+
+    async def test_round_trip_search(self, api_url):
+        """Test that the template is adapted and connections are reused."""
+        departure = date.today() + timedelta(days=30)
+        engine = ITAHttpEngine(
+            session=session_for(api_url), harvester=False, rate_limiter=False
+        )
+
+        async with engine:
+            result = await engine.search_flights(
+                "JFK",
+                "LAX",
+                departure,
+                return_date=departure + timedelta(days=7),
+                cabin_class=CabinClass.BUSINESS,
+                adults=2,
+            )
+            await engine.search_flights("JFK", "SFO", departure)
+
+        flight = result.flights[0]
+        assert str(flight.price) == "250.00"
+        assert flight.cabin_class == CabinClass.BUSINESS
+        assert [s.arrival_airport.code for s in flight.segments] == ["LAX", "JFK"]
+
+        sent = StandInAPI.requests[0]
+        assert sent["bgProgramResponse"] == "token"
+        assert sent["inputs"]["pax"] == {"adults": 2}
+        assert sent["inputs"]["cabin"] == "BUSINESS"
+        assert sent["inputs"]["page"] == {"current": 1, "size": 20}
+        assert sent["inputs"]["slices"][1]["date"] == str(departure + timedelta(7))
+        # Keep-alive: both searches went over the same connection
+        assert len(StandInAPI.clients) == 1
+
+    async def test_rejected_session_is_reharvested(self, api_url):
+        """Test that a 403 triggers one harvest and a replay."""
+        harvested = []
+
+        async def harvester(search_params):
+            harvested.append(search_params.destination)
+            return session_for(api_url)
+
+        engine = ITAHttpEngine(
+            session=session_for(api_url, api_key="expired"),
+            harvester=harvester,
+            rate_limiter=False,
+            retry=False,
+        )
+        async with engine:
+            result = await engine.search_flights(
+                "JFK", "LAX", date.today() + timedelta(days=30)
+            )
+
+        assert result.total_results == 1
+        assert harvested == ["LAX"]
+        assert engine.harvests == 1
+
+    async def test_without_session_or_harvester(self, api_url):
+        """Test failures when no session can be used."""
+        params = SearchParams(
+            origin="JFK",
+            destination="LAX",
+            departure_date=date.today() + timedelta(days=30),
+            trip_type=TripType.ONE_WAY,
+        )
+
+        async with ITAHttpEngine(harvester=False, rate_limiter=False) as engine:
+            with pytest.raises(ITAScrapperError):
+                await engine.search(params)
+
+        engine = ITAHttpEngine(
+            session=session_for(api_url, api_key="expired"),
+            harvester=False,
+            rate_limiter=False,
+            retry=False,
+        )
+        async with engine:
+            with pytest.raises(NavigationError) as error:
+                await engine.search(params)
+        assert error.value.status_code == 403
+
+    async def test_invalid_parameters_keep_cause(self):
+        """Test that invalid parameters are reported with the validation error."""
+        engine = ITAHttpEngine(harvester=False, rate_limiter=False)
+        with pytest.raises(ITAScrapperError) as error:
+            await engine.search_flights(
+                origin="JFK",
+                destination="LAX",
+                departure_date=date.today() + timedelta(days=30),
+                adults=0,
+            )
+        assert error.value.__cause__ is not None
+
+    def test_session_round_trip(self, tmp_path):
+        """Test that saved sessions load back without pseudo headers."""
+        session = session_for("https://example.test/v1/search")
+        session.save(tmp_path / "session.json")
+        loaded = MatrixSession.load(tmp_path / "session.json")
+
+        assert loaded.headers == {"x-goog-api-key": "good"}
+        assert loaded.body == TEMPLATE
+        assert loaded.created_at == session.created_at
@@ -0,0 +1,49 @@
+"""
+Tests for lazy imports and CLI startup cost.
+"""
+
+import subprocess
+import sys
+
+HEAVY_MODULES = ("playwright", "pydantic", "ita_scrapper.scrapper")
+
+
+def loaded_modules(source: str) -> set[str]:
+    """Top-level and package modules loaded after running source."""
+    output = subprocess.run(
+        [sys.executable, "-c", f"{source}\nimport sys\nprint(*sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    """Test that light entry points do not load the browser stack."""
+
+    def test_package_import_is_light(self):
+        """Test that importing the package loads no heavy modules."""
+        modules = loaded_modules("import ita_scrapper")
+        assert not modules & set(HEAVY_MODULES)
+
+    def test_cli_parse_is_light(self):
+        """Test that the parse command runs without loading heavy modules."""
+        modules = loaded_modules(
+            "import sys\n"
+            "from ita_scrapper.cli import main\n"
+            "sys.argv = ['ita-scrapper', 'parse', '--type', 'duration', '2h 30m']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        assert "ita_scrapper.utils" in modules
+        assert not modules & set(HEAVY_MODULES)
+
+    def test_lazy_attributes(self):
+        """Test that public names resolve on first access."""
+        import ita_scrapper
+
+        assert ita_scrapper.ITAScrapper.__name__ == "ITAScrapper"
+        assert "SearchExecutor" in dir(ita_scrapper)
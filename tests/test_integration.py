@@ -6,7 +6,7 @@ from datetime import date, timedelta
 
 import pytest
 
-from ita_scrapper import ITAScrapper
+from ita_scrapper import ITAScrapper, ITAScrapperPool
 from ita_scrapper.models import CabinClass, TripType
 
 
@@ -67,3 +67,30 @@ class TestITAScrapperIntegration:
             assert result.search_params.trip_type == TripType.ONE_WAY
             assert result.search_params.cabin_class == CabinClass.BUSINESS
             assert result.search_params.adults == 2
+
+    async def test_pool_context_manager(self):
+        """Test that pool workers share one browser with separate contexts."""
+        async with ITAScrapperPool(size=2, headless=True) as pool:
+            assert pool.available == 2
+
+            async with pool.lease() as first, pool.lease() as second:
+                assert pool.available == 0
+                assert first._browser is second._browser
+                assert first._context is not second._context
+
+            assert pool.available == 2
+
+    async def test_search_flights_stream_integration(self):
+        """Test streaming flights from a one-way search."""
+        async with ITAScrapper(headless=True) as scrapper:
+            flights = [
+                flight
+                async for flight in scrapper.search_flights_stream(
+                    origin="JFK",
+                    destination="LAX",
+                    departure_date=date.today() + timedelta(days=30),
+                    max_results=5,
+                )
+            ]
+
+            assert len(flights) <= 5
@@ -0,0 +1,241 @@
+"""
+Tests for the DOM-based ITA Matrix parser.
+"""
+
+from datetime import date
+
+from ita_scrapper.models import (
+    MultiCitySearchParams,
+    MultiCitySegment,
+    SearchParams,
+    TripType,
+)
+from ita_scrapper.parsers import (
+    _ROW_RECORDS_JS,
+    CONTAINER_SELECTORS,
+    DEFAULT_ROW_INDICATORS,
+    ITAMatrixParser,
+)
+from ita_scrapper.readiness import PageReadiness
+from ita_scrapper.selector_registry import SelectorRegistry
+
+
+class FakePage:
+    """Page whose evaluate returns a canned result and counts calls."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.scripts = []
+        self.args = []
+
+    async def evaluate(self, script, *args):
+        self.scripts.append(script)
+        self.args.append(args)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    async def query_selector_all(self, selector):
+        raise AssertionError("extraction should not query elements one by one")
+
+
+class TestTooltipExtraction:
+    """Tests for ITAMatrixParser._extract_tooltip_data."""
+
+    async def test_single_round_trip(self):
+        """All strategies run in one in-page call."""
+        page = FakePage({"cdk-describedby-message-1": "AA 100 JFK 8:00 AM"})
+
+        data = await ITAMatrixParser()._extract_tooltip_data(page)
+
+        assert data == {"cdk-describedby-message-1": "AA 100 JFK 8:00 AM"}
+        assert len(page.scripts) == 1
+        assert "cdk-describedby-message" in page.scripts[0]
+
+    async def test_failure_returns_empty(self):
+        """A failed evaluate yields no tooltips instead of raising."""
+        page = FakePage(error=RuntimeError("Execution context was destroyed"))
+
+        assert await ITAMatrixParser()._extract_tooltip_data(page) == {}
+
+
+class TestRowExtraction:
+    """Tests for reading result rows with their tooltips."""
+
+    async def test_rows_found_and_read_in_one_call(self):
+        """Row lookup and reading run in one evaluate returning plain records."""
+        rows = [{"key": str(i), "text": "$315 Delta", "tooltips": []} for i in range(3)]
+        page = FakePage({"selector": ".mat-row", "missed": [], "rows": rows})
+
+        assert await ITAMatrixParser()._read_rows(page, ["JFK", "$"]) == rows
+        assert len(page.scripts) == 1
+        selectors, indicators, limit, seen = page.args[0][0]
+        assert selectors == CONTAINER_SELECTORS
+        assert indicators == ["jfk", "$"]
+        assert limit == 20
+        assert seen == []
+
+    async def test_seen_rows_passed_to_page(self):
+        """Keys of rows already read go to the page so they are skipped."""
+        page = FakePage({"selector": ".mat-row", "missed": [], "rows": []})
+
+        await ITAMatrixParser()._read_rows(page, seen={"1", "0"})
+
+        assert page.args[0][0][3] == ["0", "1"]
+
+    async def test_failure_returns_no_rows(self):
+        """A failed evaluate yields no rows instead of raising."""
+        page = FakePage(error=RuntimeError("Execution context was destroyed"))
+
+        assert await ITAMatrixParser()._read_rows(page) == []
+
+    async def test_selector_hits_and_misses_recorded(self):
+        """Selectors tried before the matching one are recorded as misses."""
+        registry = SelectorRegistry()
+        page = FakePage(
+            {
+                "selector": 'tr[class*="flight"]',
+                "missed": ['tr[class*="itinerary"]', 'tr[class*="result"]'],
+                "rows": [],
+            }
+        )
+        page.url = "https://matrix.itasoftware.com/flights"
+
+        await ITAMatrixParser(registry)._read_rows(page)
+
+        fingerprint = await registry.fingerprint(page)
+        stats = registry.stats(fingerprint, "containers")
+        assert stats['tr[class*="flight"]']["hits"] == 1
+        assert stats['tr[class*="itinerary"]']["misses"] == 1
+        assert stats['tr[class*="result"]']["misses"] == 1
+
+    def test_parse_row_record(self):
+        """A row record is parsed without touching the page."""
+        row = {
+            "text": "Delta $315",
+            "tooltips": [
+                "JFK time: 10:00 AM Sat July 12",
+                "LAX time: 11:30 AM Sat July 12",
+            ],
+        }
+
+        flight = ITAMatrixParser()._parse_single_flight(row, {})
+
+        assert flight is not None
+        assert flight.price == 315
+        assert flight.segments[0].departure_airport.code == "JFK"
+
+
+def result_row(key: str, price: int) -> dict:
+    """Row record with its own departure and arrival tooltips."""
+    return {
+        "key": key,
+        "text": f"Delta ${price}",
+        "tooltips": [
+            "JFK time: 10:00 AM Sat July 12",
+            "LAX time: 11:30 AM Sat July 12",
+        ],
+    }
+
+
+class ResultsPage:
+    """Results page whose rows render over several rounds."""
+
+    def __init__(self, rounds: list[list[dict]]):
+        self.rounds = rounds
+        self.round = 0
+        self.reads: list[str] = []
+        self.tooltip_extractions = 0
+
+    def on(self, event, handler):
+        pass
+
+    async def wait_for_selector(self, selector, timeout):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        if script != _ROW_RECORDS_JS:
+            self.tooltip_extractions += 1
+            return {}
+        seen = set(arg[3])
+        rows = [row for row in self.rounds[self.round] if row["key"] not in seen]
+        self.reads.extend(row["key"] for row in rows)
+        return {"selector": ".mat-row", "missed": [], "rows": rows}
+
+
+class RoundReadiness(PageReadiness):
+    """Readiness whose every wait lets the next round of rows render."""
+
+    async def wait_until_ready(self, selector=None, timeout_ms=None):
+        self.page.round = min(self.page.round + 1, len(self.page.rounds) - 1)
+        return True
+
+
+class TestIncrementalParsing:
+    """Tests for parsing rows as they render over several rounds."""
+
+    async def test_rows_parsed_once_by_key(self):
+        """Rows are tracked by their stamped key, not by their position."""
+        first, second, late = (
+            result_row("0", 315),
+            result_row("1", 420),
+            result_row("2", 199),
+        )
+        # The late row renders above the rows already parsed
+        page = ResultsPage([[first, second], [late, first, second]])
+        RoundReadiness(page)
+
+        flights = [
+            flight async for flight in ITAMatrixParser().iter_flight_results(page)
+        ]
+
+        assert [flight.price for flight in flights] == [315, 420, 199]
+        assert page.reads == ["0", "1", "2"]
+
+    async def test_tooltips_extracted_only_when_needed(self):
+        """Rows with their own tooltips do not need the page's tooltips."""
+        page = ResultsPage([[result_row("0", 315)], [result_row("0", 315)]])
+        RoundReadiness(page)
+
+        flights = [
+            flight async for flight in ITAMatrixParser().iter_flight_results(page)
+        ]
+
+        assert len(flights) == 1
+        assert page.tooltip_extractions == 0
+
+
+class TestRowIndicators:
+    """Tests for the row indicators of the fallback row scan."""
+
+    def test_indicators_from_search(self):
+        """Indicators are the searched airports and the currency symbol."""
+        params = SearchParams(
+            origin="JFK",
+            destination="LAX",
+            departure_date=date(2030, 8, 15),
+            trip_type=TripType.ONE_WAY,
+        )
+
+        assert ITAMatrixParser.row_indicators(params) == ["jfk", "lax", "$"]
+        assert ITAMatrixParser.row_indicators(params, "€") == ["jfk", "lax", "€"]
+
+    def test_indicators_multi_city(self):
+        """Every segment's airports are indicators, once each."""
+        params = MultiCitySearchParams(
+            segments=[
+                MultiCitySegment(
+                    origin="JFK", destination="LHR", departure_date=date(2030, 8, 15)
+                ),
+                MultiCitySegment(
+                    origin="LHR", destination="CDG", departure_date=date(2030, 8, 20)
+                ),
+            ]
+        )
+
+        assert ITAMatrixParser.row_indicators(params) == ["jfk", "lhr", "cdg", "$"]
+
+    def test_default_indicators(self):
+        """Without a search the generic markers are used."""
+        assert ITAMatrixParser.row_indicators() == list(DEFAULT_ROW_INDICATORS)
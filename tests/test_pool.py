@@ -0,0 +1,352 @@
+"""
+Tests for the browser pool.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from typing import ClassVar
+
+import pytest
+
+from ita_scrapper import ITAScrapper, ITAScrapperPool
+from ita_scrapper.exceptions import ITAScrapperError, NavigationError
+from ita_scrapper.models import (
+    FlightResult,
+    MultiCitySearchParams,
+    MultiCitySegment,
+    SearchParams,
+    TripType,
+)
+
+# Search time per destination: later inputs of the batch tests finish first
+SEARCH_SECONDS = {"LAX": 0.05, "ERR": 0.02, "SFO": 0.04, "SEA": 0.03, "BOS": 0.01}
+
+
+class FakeWorker:
+    """Worker stand-in that records concurrency and fails on request."""
+
+    running = 0
+    peak = 0
+    completed: ClassVar[list[str]] = []
+
+    def __init__(self):
+        self.prewarmed = 0
+        self.is_healthy = True
+        self.restarts = 0
+        self.browser = None
+        self.recycle_policy = None
+
+    async def restart(self, browser=None):
+        self.is_healthy = True
+        self.restarts += 1
+        self.browser = browser
+
+    async def prewarm(self):
+        await asyncio.sleep(0.01)
+        self.prewarmed += 1
+        return True
+
+    async def search(self, search_params, max_results=20, deadline=None):
+        FakeWorker.running += 1
+        FakeWorker.peak = max(FakeWorker.peak, FakeWorker.running)
+        try:
+            await asyncio.sleep(SEARCH_SECONDS.get(search_params.destination, 0.01))
+            FakeWorker.completed.append(search_params.destination)
+            if search_params.destination == "ERR":
+                raise NavigationError("boom")
+            return FlightResult(
+                flights=[], search_params=search_params, total_results=0
+            )
+        finally:
+            FakeWorker.running -= 1
+
+    async def search_multi_city(self, search_params, max_results=20, deadline=None):
+        self.multi_city_deadline = deadline
+
+
+class CrashOnceWorker(FakeWorker):
+    """Worker whose page crashes during its first search."""
+
+    async def search(self, search_params, max_results=20, deadline=None):
+        if not self.restarts:
+            self.is_healthy = False
+            raise NavigationError("Target crashed")
+        return await super().search(search_params, max_results, deadline)
+
+
+class FakeBrowser:
+    """Browser stand-in that can be disconnected."""
+
+    def __init__(self, connected: bool = True):
+        self.connected = connected
+
+    def on(self, event, handler):
+        pass
+
+    def is_connected(self):
+        return self.connected
+
+
+class NavigationPage:
+    """Page counting navigations; results links start a search request."""
+
+    url = "about:blank"
+
+    def __init__(self):
+        self.navigations = []
+        self.request_handlers = []
+
+    def on(self, event, handler):
+        if event == "request":
+            self.request_handlers.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.request_handlers.remove(handler)
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.navigations.append(url)
+        self.url = url
+        if "/flights?search=" in url:
+            request = type("Request", (), {"url": "https://api.test/v1/search"})
+            for handler in list(self.request_handlers):
+                handler(request)
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return object()
+
+    async def title(self):
+        return "ITA Matrix"
+
+
+class FakeReadiness:
+    """Readiness stand-in that returns at once."""
+
+    async def wait_until_ready(self, **kwargs):
+        return True
+
+    async def settle(self, max_ms=None):
+        return True
+
+
+def page_worker() -> ITAScrapper:
+    """Real scrapper on a navigation-counting page, with parsing stubbed out."""
+    worker = ITAScrapper(
+        warm_session=True,
+        rate_limiter=False,
+        retry=False,
+        selector_registry=False,
+        artifacts="off",
+    )
+    worker._page = NavigationPage()
+    worker._browser = FakeBrowser()
+    worker._readiness = FakeReadiness()
+
+    async def parse(max_results):
+        return []
+
+    worker._parse_flight_results = parse
+    return worker
+
+
+def fake_pool(size: int) -> ITAScrapperPool:
+    """Create a pool whose idle queue holds fake workers."""
+    pool = ITAScrapperPool(size=size)
+    pool._idle = asyncio.Queue()
+    for _ in range(size):
+        pool._idle.put_nowait(FakeWorker())
+    FakeWorker.running = 0
+    FakeWorker.peak = 0
+    FakeWorker.completed = []
+    return pool
+
+
+def one_way(destination: str) -> SearchParams:
+    """One-way search parameters to a destination."""
+    return SearchParams(
+        origin="JFK",
+        destination=destination,
+        departure_date=date.today() + timedelta(days=30),
+        trip_type=TripType.ONE_WAY,
+    )
+
+
+class TestITAScrapperPool:
+    """Test pool behaviour that does not need a running browser."""
+
+    def test_invalid_size(self):
+        """Test that a pool needs at least one worker."""
+        with pytest.raises(ValueError):
+            ITAScrapperPool(size=0)
+
+    def test_not_started(self):
+        """Test that an unstarted pool has no idle workers."""
+        pool = ITAScrapperPool(size=2)
+        assert pool.size == 2
+        assert pool.available == 0
+
+    async def test_lease_before_start(self):
+        """Test that leasing from an unstarted pool fails."""
+        pool = ITAScrapperPool()
+        with pytest.raises(ITAScrapperError):
+            async with pool.lease():
+                pass
+
+    async def test_multi_city_deadline_forwarded(self):
+        """Test that a pooled multi-city search passes its deadline on."""
+        pool = fake_pool(1)
+        worker = pool._idle._queue[0]
+        departure = date.today() + timedelta(days=30)
+        params = MultiCitySearchParams(
+            segments=[
+                MultiCitySegment(
+                    origin="JFK", destination="LHR", departure_date=departure
+                ),
+                MultiCitySegment(
+                    origin="LHR",
+                    destination="CDG",
+                    departure_date=departure + timedelta(days=5),
+                ),
+            ]
+        )
+
+        await pool.search_multi_city(params, deadline=12.5)
+
+        assert worker.multi_city_deadline == 12.5
+
+
+class TestSearchMany:
+    """Test batch searches on a pool."""
+
+    async def test_input_order_and_partial_failure(self):
+        """Test that outcomes keep input order and failures stay isolated."""
+        pool = fake_pool(size=3)
+        destinations = ["LAX", "ERR", "SFO", "SEA", "ERR", "BOS"]
+
+        outcomes = await pool.search_many(one_way(d) for d in destinations)
+
+        # The searches finished out of order, so the outcomes were re-sorted
+        assert FakeWorker.completed != destinations
+        assert [o.index for o in outcomes] == list(range(len(destinations)))
+        assert [o.params.destination for o in outcomes] == destinations
+        assert [o.ok for o in outcomes] == [d != "ERR" for d in destinations]
+        assert isinstance(outcomes[1].error, NavigationError)
+        assert outcomes[0].result.search_params.destination == "LAX"
+        assert pool.available == 3
+
+    async def test_concurrency_limit(self):
+        """Test that no more than the requested searches run at once."""
+        pool = fake_pool(size=4)
+        await pool.search_many([one_way("LAX")] * 10, concurrency=2)
+        assert FakeWorker.peak == 2
+
+    async def test_as_completed(self):
+        """Test that every input is yielded exactly once, as it completes."""
+        pool = fake_pool(size=3)
+        seen = [
+            outcome.index
+            async for outcome in pool.search_many_as_completed(
+                [one_way("LAX"), one_way("ERR"), one_way("SFO")]
+            )
+        ]
+        assert seen == [1, 2, 0]
+
+
+class TestPrewarm:
+    """Test background prewarming of idle workers."""
+
+    async def test_rewarms_after_each_lease(self):
+        """Test that returned workers are warmed again before the next lease."""
+        pool = fake_pool(size=1)
+
+        async with pool.lease() as worker:
+            assert worker.prewarmed == 0
+
+        # The next lease waits for the warm-up scheduled on return
+        async with pool.lease() as worker:
+            assert worker.prewarmed == 1
+
+        await pool.warm_up()
+        assert worker.prewarmed == 2
+
+    async def test_one_navigation_per_deep_link_search(self):
+        """Test that prewarming does not load the form for deep link searches."""
+        pool = ITAScrapperPool(size=1)
+        worker = page_worker()
+        pool._workers = [worker]
+        pool._idle = asyncio.Queue()
+        pool._idle.put_nowait(worker)
+        pool._browser = FakeBrowser()
+
+        for _ in range(3):
+            await pool.search(one_way("LAX"))
+            await pool.warm_up()
+
+        navigations = worker._page.navigations
+        assert len(navigations) == 3
+        assert all("/flights?search=" in url for url in navigations)
+
+    async def test_form_prewarmed_after_deep_link_failure(self):
+        """Test that prewarming resumes once searches use the form."""
+        worker = page_worker()
+        worker._deep_link_failed = True
+
+        assert await worker.prewarm()
+        assert worker._page.navigations == [worker.base_url]
+
+    async def test_disabled_without_warm_session(self):
+        """Test that prewarming needs warm sessions to be useful."""
+        pool = ITAScrapperPool(size=1, warm_session=False)
+        assert not pool.prewarm
+
+
+class TestSupervision:
+    """Test recovery from browser and page crashes."""
+
+    async def test_requeues_search_lost_to_crash(self):
+        """Test that a crashed search runs again on the rebuilt worker."""
+        pool = ITAScrapperPool(size=1, prewarm=False)
+        worker = CrashOnceWorker()
+        pool._workers = [worker]
+        pool._idle = asyncio.Queue()
+        pool._idle.put_nowait(worker)
+        pool._browser = FakeBrowser()
+
+        result = await pool.search(one_way("LAX"))
+
+        assert result.search_params.destination == "LAX"
+        assert pool.requeued == 1
+        assert pool.restarts == 1
+        assert pool.browser_restarts == 0
+
+    async def test_ordinary_errors_not_requeued(self):
+        """Test that failures of healthy workers propagate unchanged."""
+        pool = fake_pool(size=1)
+        with pytest.raises(NavigationError):
+            await pool.search(one_way("ERR"))
+        assert pool.requeued == 0
+
+    async def test_relaunches_disconnected_browser(self):
+        """Test that leasing a crashed worker replaces the dead browser once."""
+        pool = ITAScrapperPool(size=2, prewarm=False)
+        pool._idle = asyncio.Queue()
+        for _ in range(2):
+            worker = FakeWorker()
+            worker.is_healthy = False
+            pool._idle.put_nowait(worker)
+        pool._browser = FakeBrowser(connected=False)
+        pool._playwright = object()
+        replacement = FakeBrowser()
+
+        async def open_browser():
+            pool._browser = replacement
+
+        pool._open_browser = open_browser
+
+        async with pool.lease() as first, pool.lease() as second:
+            assert first.browser is second.browser is replacement
+            assert first.restarts == second.restarts == 1
+
+        assert pool.browser_restarts == 1
@@ -0,0 +1,83 @@
+"""
+Tests for request rate limiting.
+"""
+
+import asyncio
+import pickle
+import time
+
+import pytest
+
+from ita_scrapper.ratelimit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test the token bucket arithmetic."""
+
+    def test_burst_then_spacing(self):
+        """Test that a full bucket allows a burst, then spaces reservations."""
+        bucket = TokenBucket(rate=2.0, burst=2)
+
+        assert bucket.reserve(100.0) == 0.0
+        assert bucket.reserve(100.0) == 0.0
+        assert bucket.reserve(100.0) == 0.5
+        assert bucket.reserve(100.0) == 1.0
+
+    def test_refill(self):
+        """Test that tokens refill over time up to the burst size."""
+        bucket = TokenBucket(rate=1.0, burst=1)
+
+        assert bucket.reserve(0.0) == 0.0
+        assert bucket.reserve(10.0) == 0.0
+        assert bucket.reserve(10.0) == 1.0
+
+    def test_state_round_trip(self):
+        """Test that bucket state survives serialization."""
+        bucket = TokenBucket(rate=1.0, burst=1)
+        bucket.reserve(5.0)
+
+        restored = TokenBucket.from_state(1.0, 1, bucket.to_state())
+
+        assert restored.reserve(5.0) == 1.0
+
+
+class TestRateLimiter:
+    """Test per-host limiting in and across limiters."""
+
+    async def test_spaces_requests_per_host(self):
+        """Test that requests to one host wait while other hosts do not."""
+        limiter = RateLimiter(min_interval=0.05)
+
+        url = "https://matrix.itasoftware.com/search"
+        waits = await asyncio.gather(*(limiter.acquire(url) for _ in range(3)))
+        other = await limiter.acquire("https://www.google.com/travel/flights")
+
+        assert sorted(waits) == [
+            0.0,
+            pytest.approx(0.05, abs=0.02),
+            pytest.approx(0.1, abs=0.02),
+        ]
+        assert other == 0.0
+        assert limiter.throughput("matrix.itasoftware.com") == 3 / limiter.window
+
+    async def test_host_override_and_disabled(self):
+        """Test per-host intervals and that an interval of 0 never waits."""
+        limiter = RateLimiter(min_interval=0, host_intervals={"slow.example": 0.05})
+
+        assert await limiter.acquire("https://fast.example/") == 0.0
+        assert await limiter.acquire("https://fast.example/") == 0.0
+        await limiter.acquire("https://slow.example/")
+        assert await limiter.acquire("https://slow.example/") > 0
+
+    async def test_shared_across_limiters(self, tmp_path):
+        """Test that limiters sharing a lock_dir share one budget."""
+        first = RateLimiter(min_interval=0.05, lock_dir=tmp_path)
+        second = pickle.loads(pickle.dumps(first))
+
+        started = time.monotonic()
+        await first.acquire("https://matrix.itasoftware.com/")
+        waited = await second.acquire("https://matrix.itasoftware.com/")
+
+        assert waited > 0
+        assert time.monotonic() - started >= 0.04
+        assert (tmp_path / "matrix.itasoftware.com.bucket").exists()
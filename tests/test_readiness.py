@@ -0,0 +1,73 @@
+"""
+Tests for page readiness tracking.
+"""
+
+import asyncio
+
+from ita_scrapper.readiness import PageReadiness
+
+
+class FakeRequest:
+    """Minimal stand-in for a Playwright request."""
+
+    def __init__(self, url: str, resource_type: str = "xhr"):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakePage:
+    """Page stand-in that lets tests fire network events."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, request):
+        for handler in self.handlers.get(event, []):
+            handler(request)
+
+
+class TestNetworkIdle:
+    """Test network idle detection."""
+
+    async def test_idle_without_requests(self):
+        """Test that a page with no traffic is idle immediately."""
+        readiness = PageReadiness(FakePage(), quiet_ms=0)
+        assert await readiness.wait_for_network_idle(timeout_ms=100)
+
+    async def test_waits_for_inflight_request(self):
+        """Test that idle is reported only after the request finishes."""
+        page = FakePage()
+        readiness = PageReadiness(page, quiet_ms=10)
+        request = FakeRequest("https://example.com/search")
+        page.emit("request", request)
+        assert readiness.inflight_requests == 1
+
+        asyncio.get_running_loop().call_later(
+            0.05, page.emit, "requestfinished", request
+        )
+        assert await readiness.wait_for_network_idle(timeout_ms=1000)
+        assert readiness.inflight_requests == 0
+
+    async def test_times_out_while_busy(self):
+        """Test that a request that never finishes times out."""
+        page = FakePage()
+        readiness = PageReadiness(page)
+        page.emit("request", FakeRequest("https://example.com/search"))
+        assert not await readiness.wait_for_network_idle(timeout_ms=50)
+
+    async def test_ignores_documents_and_unmatched_urls(self):
+        """Test that only matching XHR/fetch requests are tracked."""
+        page = FakePage()
+        readiness = PageReadiness(page, url_pattern=r"/search")
+        page.emit("request", FakeRequest("https://example.com/", "document"))
+        page.emit("request", FakeRequest("https://example.com/log", "fetch"))
+        assert readiness.inflight_requests == 0
+
+    def test_for_page_reuses_tracker(self):
+        """Test that one tracker is shared per page."""
+        page = FakePage()
+        readiness = PageReadiness(page)
+        assert PageReadiness.for_page(page) is readiness
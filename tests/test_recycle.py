@@ -0,0 +1,120 @@
+"""
+Tests for context recycling.
+"""
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.recycle import MB, PageMetrics, RecyclePolicy
+
+
+class FakeSession:
+    """CDP session returning fixed performance metrics."""
+
+    def __init__(self, heap_bytes: float):
+        self.heap_bytes = heap_bytes
+        self.sent = []
+
+    async def send(self, method, params=None):
+        self.sent.append(method)
+        if method == "Performance.getMetrics":
+            return {
+                "metrics": [
+                    {"name": "JSHeapUsedSize", "value": self.heap_bytes},
+                    {"name": "Nodes", "value": 1200},
+                ]
+            }
+        return {}
+
+
+class FlakySession(FakeSession):
+    """CDP session whose first metrics read fails."""
+
+    def __init__(self, heap_bytes: float):
+        super().__init__(heap_bytes)
+        self.failed = False
+
+    async def send(self, method, params=None):
+        if method == "Performance.getMetrics" and not self.failed:
+            self.failed = True
+            raise RuntimeError("Execution context was destroyed")
+        return await super().send(method, params)
+
+
+class FakeContext:
+    """Context that hands out a FakeSession."""
+
+    def __init__(self, session):
+        self.session = session
+        self.sessions = 0
+
+    async def new_cdp_session(self, page):
+        self.sessions += 1
+        if self.session is None:
+            raise RuntimeError("CDP session is only available in Chromium")
+        return self.session
+
+
+class TestRecyclePolicy:
+    """Test the recycle limits."""
+
+    def test_limits(self):
+        """Test each limit and that unset limits are ignored."""
+        policy = RecyclePolicy(max_searches=10, max_age=600, max_memory_mb=300)
+
+        assert policy.reason(searches=3, age=10, memory_bytes=100 * MB) is None
+        assert policy.reason(searches=10, age=10) == "10 searches"
+        assert policy.reason(searches=1, age=601) == "age 601s"
+        assert policy.reason(1, 10, memory_bytes=350 * MB) == "JS heap 350 MB"
+        assert RecyclePolicy().reason(10_000, 1e6, 1e12) is None
+
+    async def test_page_metrics(self):
+        """Test reading metrics over one reused CDP session."""
+        session = FakeSession(heap_bytes=42 * MB)
+        metrics = PageMetrics(FakeContext(session), page=None)
+
+        assert (await metrics.read())["Nodes"] == 1200
+        assert await metrics.js_heap_used() == 42 * MB
+        assert session.sent.count("Performance.enable") == 1
+
+    async def test_transient_failure_reopens_session(self):
+        """Test that a failed read does not turn metrics off for good."""
+        context = FakeContext(FlakySession(heap_bytes=42 * MB))
+        metrics = PageMetrics(context, page=None)
+
+        assert await metrics.read() == {}
+        assert await metrics.js_heap_used() == 42 * MB
+        assert context.sessions == 2
+
+    async def test_without_cdp(self):
+        """Test that browsers without CDP are not asked again."""
+        context = FakeContext(None)
+        metrics = PageMetrics(context, page=None)
+
+        assert await metrics.read() == {}
+        assert await metrics.read() == {}
+        assert context.sessions == 1
+
+
+class TestScrapperRecycling:
+    """Test the scrapper's recycle decision."""
+
+    async def test_recycles_when_due(self):
+        """Test that a search past the limit replaces the context first."""
+        scrapper = ITAScrapper(recycle=RecyclePolicy(max_memory_mb=100))
+        scrapper._context = object()
+        scrapper._metrics = PageMetrics(FakeContext(FakeSession(150 * MB)), None)
+        recycled = []
+
+        async def recycle():
+            recycled.append(True)
+
+        scrapper.recycle = recycle
+
+        assert await scrapper.recycle_reason() == "JS heap 150 MB"
+        await scrapper._maybe_recycle()
+        assert recycled == [True]
+
+    async def test_no_policy(self):
+        """Test that scrappers without a policy never recycle."""
+        scrapper = ITAScrapper()
+        scrapper._context = object()
+        assert await scrapper.recycle_reason() is None
@@ -0,0 +1,63 @@
+"""
+Tests for connecting to a running browser instead of launching one.
+"""
+
+from ita_scrapper import ITAScrapper
+
+
+class FakeChromium:
+    """Records which Playwright entry point was used."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def launch(self, **kwargs):
+        self.calls.append(("launch", kwargs))
+        return "launched"
+
+    async def connect(self, endpoint, **kwargs):
+        self.calls.append(("connect", endpoint))
+        return "connected"
+
+    async def connect_over_cdp(self, endpoint, **kwargs):
+        self.calls.append(("connect_over_cdp", endpoint))
+        return "connected"
+
+
+class FakePlaywright:
+    """Playwright stand-in exposing only chromium."""
+
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+
+class TestRemoteBrowser:
+    """Test endpoint handling without a real browser."""
+
+    def test_endpoint_kinds(self):
+        """Test telling DevTools endpoints from Playwright server endpoints."""
+        assert ITAScrapper.is_cdp_endpoint("http://127.0.0.1:9222")
+        assert ITAScrapper.is_cdp_endpoint("ws://host:9222/devtools/browser/abc")
+        assert not ITAScrapper.is_cdp_endpoint("ws://host:3000/")
+
+    async def test_connect_browser_dispatch(self):
+        """Test that each endpoint kind uses the matching connect method."""
+        playwright = FakePlaywright()
+
+        await ITAScrapper.connect_browser(playwright, "http://127.0.0.1:9222")
+        await ITAScrapper.connect_browser(playwright, "ws://host:3000/")
+
+        assert playwright.chromium.calls == [
+            ("connect_over_cdp", "http://127.0.0.1:9222"),
+            ("connect", "ws://host:3000/"),
+        ]
+
+    async def test_launch_exposes_debugging_port(self):
+        """Test that the browser server launch adds the DevTools flags."""
+        playwright = FakePlaywright()
+
+        await ITAScrapper.launch_browser(playwright, True, debugging_port=9333)
+
+        _, kwargs = playwright.chromium.calls[0]
+        assert "--remote-debugging-port=9333" in kwargs["args"]
+        assert "--remote-debugging-port=9333" not in ITAScrapper.BROWSER_ARGS
@@ -0,0 +1,124 @@
+"""
+Tests for stage retries.
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.exceptions import (
+    ITAScrapperError,
+    NavigationError,
+    ParseError,
+    ValidationError,
+)
+from ita_scrapper.models import SearchParams, TripType
+from ita_scrapper.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test error classification, backoff and the retry loop."""
+
+    def test_classification(self):
+        """Test which errors are considered transient."""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(ParseError("results not rendered"))
+        assert policy.is_retryable(asyncio.TimeoutError())
+        assert policy.is_retryable(NavigationError("HTTP 503", status_code=503))
+        assert policy.is_retryable(NavigationError("HTTP 429", status_code=429))
+        assert not policy.is_retryable(NavigationError("HTTP 404", status_code=404))
+        assert not policy.is_retryable(ValidationError("bad airport"))
+        assert not policy.is_retryable(ITAScrapperError("Browser not started"))
+        assert not policy.is_retryable(TypeError("bug"))
+
+    def test_backoff_bounds(self):
+        """Test that jittered delays stay within the exponential ceiling."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        for _ in range(50):
+            assert 0 <= policy.backoff(1) <= 1.0
+            assert 0 <= policy.backoff(3) <= 4.0
+            assert 0 <= policy.backoff(10) <= 5.0
+
+    async def test_retries_until_success(self):
+        """Test that transient errors are retried and attempts recorded."""
+        policy = RetryPolicy(max_retries=3, base_delay=0)
+        calls = []
+        resets = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ParseError("not yet")
+            return "ok"
+
+        async def reset():
+            resets.append(1)
+
+        attempts = {}
+        result = await policy.call("parse", flaky, attempts, before_retry=reset)
+
+        assert result == "ok"
+        assert attempts == {"parse": 3}
+        assert len(resets) == 2
+
+    async def test_fatal_and_exhausted(self):
+        """Test that fatal errors fail at once and retries are bounded."""
+        policy = RetryPolicy(max_retries=2, base_delay=0)
+        attempts = {}
+
+        async def invalid():
+            raise ValidationError("bad input")
+
+        async def broken():
+            raise ParseError("still broken")
+
+        with pytest.raises(ValidationError):
+            await policy.call("search_form", invalid, attempts)
+        with pytest.raises(ParseError):
+            await policy.call("parse", broken, attempts)
+
+        assert attempts == {"search_form": 1, "parse": 3}
+
+
+class TestScrapperStageRetries:
+    """Test that the scrapper retries only the stage that failed."""
+
+    async def test_parse_retry_does_not_renavigate(self):
+        """Test that a parse failure re-parses without a new search."""
+        scrapper = ITAScrapper(
+            retry=RetryPolicy(max_retries=2, base_delay=0), deep_link=False
+        )
+        calls = {"navigate": 0, "fill": 0, "parse": 0}
+
+        async def navigate():
+            calls["navigate"] += 1
+            scrapper._search_form_url = "https://matrix.itasoftware.com/search"
+
+        async def fill(params):
+            calls["fill"] += 1
+
+        async def parse(max_results):
+            calls["parse"] += 1
+            if calls["parse"] == 1:
+                raise ParseError("results still rendering")
+            return []
+
+        scrapper._navigate_to_flights = navigate
+        scrapper._fill_search_form = fill
+        scrapper._parse_flight_results = parse
+
+        params = SearchParams(
+            origin="JFK",
+            destination="LAX",
+            departure_date=date.today() + timedelta(days=30),
+            trip_type=TripType.ONE_WAY,
+        )
+        result = await scrapper.search(params)
+
+        assert result.total_results == 0
+        assert calls == {"navigate": 1, "fill": 1, "parse": 2}
+        assert scrapper.attempts == {"navigate": 1, "search_form": 1, "parse": 2}
@@ -0,0 +1,119 @@
+"""
+Tests for the learned selector ordering.
+"""
+
+from datetime import date
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.models import SearchParams, TripType
+from ita_scrapper.selector_registry import SelectorRegistry
+
+SELECTORS = ["#a", "#b", "#c", "#d"]
+
+
+class FakePage:
+    """Page with a URL and script list to fingerprint."""
+
+    def __init__(self, url, scripts):
+        self.url = url
+        self.scripts = scripts
+        self.evaluations = 0
+
+    async def evaluate(self, script):
+        self.evaluations += 1
+        return ["matrix.itasoftware.com", "/search", *self.scripts]
+
+
+class TestSelectorRegistry:
+    """Tests for SelectorRegistry."""
+
+    def test_unknown_step_keeps_order(self):
+        """Without statistics the default order is kept."""
+        assert SelectorRegistry().order("site", "origin", SELECTORS) == SELECTORS
+
+    def test_last_hit_first(self):
+        """The selector that hit most recently is tried first."""
+        registry = SelectorRegistry()
+        registry.record("site", "origin", "#c", hit=True)
+        registry.record("site", "origin", "#d", hit=True)
+
+        assert registry.order("site", "origin", SELECTORS) == ["#d", "#c", "#a", "#b"]
+        assert registry.order("other", "origin", SELECTORS) == SELECTORS
+
+    def test_dead_selectors_demoted(self):
+        """Selectors that keep missing move behind untried ones."""
+        registry = SelectorRegistry(dead_after=2)
+        for _ in range(2):
+            registry.record("site", "submit", "#a", hit=False)
+        registry.record("site", "submit", "#b", hit=False)
+
+        assert registry.order("site", "submit", SELECTORS) == ["#b", "#c", "#d", "#a"]
+
+        registry.record("site", "submit", "#a", hit=True)
+        assert registry.order("site", "submit", SELECTORS)[0] == "#a"
+
+    def test_persisted_across_runs(self, tmp_path):
+        """Statistics saved by one registry order the next one."""
+        path = tmp_path / "cache" / "selectors.json"
+        registry = SelectorRegistry(path)
+        registry.record("site", "origin", "#c", hit=True)
+        registry.save()
+
+        assert SelectorRegistry(path).order("site", "origin", SELECTORS)[0] == "#c"
+
+    def test_saves_merge(self, tmp_path):
+        """Registries sharing a file add to each other's statistics."""
+        path = tmp_path / "selectors.json"
+        first, second = SelectorRegistry(path), SelectorRegistry(path)
+        first.record("site", "origin", "#a", hit=True)
+        second.record("site", "origin", "#a", hit=True)
+        second.record("site", "origin", "#b", hit=False)
+        first.save()
+        second.save()
+
+        stats = SelectorRegistry(path).stats("site", "origin")
+        assert stats["#a"]["hits"] == 2
+        assert stats["#b"]["misses"] == 1
+        # The last save also brought the other registry's statistics in
+        assert second.stats("site", "origin")["#a"]["hits"] == 2
+
+    def test_unchanged_not_saved(self, tmp_path):
+        """Nothing is written until something was recorded."""
+        path = tmp_path / "selectors.json"
+        SelectorRegistry(path).save()
+
+        assert not path.exists()
+
+    async def test_scrapper_saves_on_close(self, tmp_path):
+        """Searches do not write the file; closing the scrapper does."""
+        path = tmp_path / "selectors.json"
+        registry = SelectorRegistry(path)
+        scrapper = ITAScrapper(selector_registry=registry)
+        params = SearchParams(
+            origin="JFK",
+            destination="LAX",
+            departure_date=date(2030, 8, 15),
+            trip_type=TripType.ONE_WAY,
+        )
+
+        registry.record("site", "origin", "#a", hit=True)
+        scrapper._begin_search(params)
+        scrapper._begin_search(params)
+        assert not path.exists()
+
+        await scrapper.close()
+        assert SelectorRegistry(path).stats("site", "origin")["#a"]["hits"] == 1
+
+    async def test_fingerprint_per_site_version(self):
+        """New script bundles give a new fingerprint; queries do not."""
+        registry = SelectorRegistry()
+        page = FakePage("https://matrix.itasoftware.com/search?x=1", ["main.1.js"])
+
+        first = await registry.fingerprint(page)
+        page.url = "https://matrix.itasoftware.com/search?x=2"
+        assert await registry.fingerprint(page) == first
+        assert page.evaluations == 1
+
+        deployed = FakePage("https://matrix.itasoftware.com/search", ["main.2.js"])
+        assert await SelectorRegistry().fingerprint(deployed) != first
+        assert first.startswith("matrix.itasoftware.com/search#")
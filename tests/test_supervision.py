@@ -0,0 +1,138 @@
+"""
+Tests for crash recovery of a single scrapper.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from ita_scrapper import ITAScrapper
+from ita_scrapper.exceptions import ITAScrapperError, ParseError
+from ita_scrapper.models import SearchParams, TripType
+
+
+class FakeBrowser:
+    """Browser stand-in that fires its disconnected handlers."""
+
+    def __init__(self):
+        self.connected = True
+        self.handlers = []
+
+    def on(self, event, handler):
+        if event == "disconnected":
+            self.handlers.append(handler)
+
+    def is_connected(self):
+        return self.connected
+
+    def disconnect(self):
+        self.connected = False
+        for handler in self.handlers:
+            handler(self)
+
+
+class DeadPage:
+    """Page whose close() fails like a crashed page's does."""
+
+    async def close(self):
+        raise PlaywrightError("Target page, context or browser has been closed")
+
+
+def supervised_scrapper(browser: FakeBrowser) -> ITAScrapper:
+    """Scrapper on a fake browser whose attach() just installs a new page."""
+    scrapper = ITAScrapper(rate_limiter=False, retry=False)
+
+    async def attach(target):
+        scrapper._browser = target
+        target.on("disconnected", scrapper._on_browser_disconnected)
+        scrapper._page = DeadPage()
+        scrapper._crashed = None
+
+    scrapper.attach = attach
+    scrapper._browser = browser
+    browser.on("disconnected", scrapper._on_browser_disconnected)
+    scrapper._page = DeadPage()
+    return scrapper
+
+
+def one_way() -> SearchParams:
+    """One-way search parameters."""
+    return SearchParams(
+        origin="JFK",
+        destination="LAX",
+        departure_date=date.today() + timedelta(days=30),
+        trip_type=TripType.ONE_WAY,
+    )
+
+
+class TestCrashRecovery:
+    """Test restarting after page crashes and browser disconnects."""
+
+    async def test_page_crash_reruns_search(self):
+        """Test that a search hit by a page crash runs again on a new context."""
+        scrapper = supervised_scrapper(FakeBrowser())
+        calls = []
+
+        async def search_one(params, max_results):
+            calls.append(1)
+            if len(calls) == 1:
+                scrapper._on_page_crash(scrapper._page)
+                raise PlaywrightError("Target crashed")
+            return "ok"
+
+        scrapper._search_one = search_one
+
+        assert await scrapper.search(one_way()) == "ok"
+        assert len(calls) == 2
+        assert scrapper.restarts == 1
+        assert scrapper.browser_restarts == 0
+
+    async def test_relaunches_disconnected_browser(self):
+        """Test that a browser lost between searches is replaced first."""
+        browser = FakeBrowser()
+        scrapper = supervised_scrapper(browser)
+        scrapper._playwright = object()
+        replacement = FakeBrowser()
+
+        async def open_browser():
+            scrapper._browser = replacement
+
+        async def search_one(params, max_results):
+            return "ok"
+
+        scrapper._open_browser = open_browser
+        scrapper._search_one = search_one
+
+        browser.disconnect()
+        assert not scrapper.is_healthy
+
+        assert await scrapper.search(one_way()) == "ok"
+        assert scrapper._browser is replacement
+        assert scrapper.browser_restarts == 1
+        assert scrapper.is_healthy
+
+    async def test_healthy_failures_not_rerun(self):
+        """Test that ordinary search errors are not treated as crashes."""
+        scrapper = supervised_scrapper(FakeBrowser())
+        calls = []
+
+        async def search_one(params, max_results):
+            calls.append(1)
+            raise ParseError("no results")
+
+        scrapper._search_one = search_one
+
+        with pytest.raises(ParseError):
+            await scrapper.search(one_way())
+        assert len(calls) == 1
+        assert scrapper.restarts == 0
+
+    async def test_shared_browser_left_to_owner(self):
+        """Test that an attached scrapper cannot relaunch a shared browser."""
+        browser = FakeBrowser()
+        scrapper = supervised_scrapper(browser)
+        browser.disconnect()
+
+        with pytest.raises(ITAScrapperError):
+            await scrapper.restart()